@@ -25,6 +25,7 @@ from app.ncr.models import (
     NCRFileType,
     NCRStatus,
     NCRMode,
+    NCRFact,
 )
 
     
@@ -0,0 +1,103 @@
+"""ncr fact table
+
+Revision ID: b4f1c2d9e7a3
+Revises: 95c9f03342a5
+Create Date: 2026-03-04 10:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f1c2d9e7a3'
+down_revision: Union[str, Sequence[str], None] = '95c9f03342a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ncr_fact',
+    sa.Column('ncr_id', postgresql.UUID(), nullable=False),
+    sa.Column('ref', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='ncrstatus', create_type=False), nullable=False),
+    sa.Column('mode', postgresql.ENUM(name='ncrmode', create_type=False), nullable=False),
+    sa.Column('type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('repeat', sa.Boolean(), nullable=False),
+    sa.Column('root_cause', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('rejected_reson', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('rejected_count', sa.Integer(), nullable=False),
+    sa.Column('main_clause', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('sub_clause', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('ss_clause', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expected_date_of_completion', sa.DateTime(), nullable=True),
+    sa.Column('actual_date_of_completion', sa.DateTime(), nullable=True),
+    sa.Column('edc_given_date', sa.DateTime(), nullable=True),
+    sa.Column('closed_on', sa.DateTime(), nullable=True),
+    sa.Column('closure_days', sa.Float(), nullable=True),
+    sa.Column('overdue_days', sa.Float(), nullable=True),
+    sa.Column('audit_info_id', sa.Uuid(), nullable=False),
+    sa.Column('audit_id', sa.Uuid(), nullable=False),
+    sa.Column('audit_ref', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('audit_type', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('company_id', sa.Uuid(), nullable=False),
+    sa.Column('company_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('plant_id', sa.Uuid(), nullable=False),
+    sa.Column('plant_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('department_id', sa.Uuid(), nullable=False),
+    sa.Column('department_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['ncr_id'], ['ncr.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ncr_id')
+    )
+    op.create_index(op.f('ix_ncr_fact_company_id'), 'ncr_fact', ['company_id'], unique=False)
+    op.create_index(op.f('ix_ncr_fact_created_at'), 'ncr_fact', ['created_at'], unique=False)
+    op.create_index(op.f('ix_ncr_fact_department_id'), 'ncr_fact', ['department_id'], unique=False)
+    op.create_index(op.f('ix_ncr_fact_mode'), 'ncr_fact', ['mode'], unique=False)
+    op.create_index(op.f('ix_ncr_fact_plant_id'), 'ncr_fact', ['plant_id'], unique=False)
+    op.create_index(op.f('ix_ncr_fact_status'), 'ncr_fact', ['status'], unique=False)
+
+    # backfill existing NCRs; afterwards rows are kept current by
+    # app.ncr.facts.refresh_ncr_facts on every write path.
+    op.execute("""
+INSERT INTO ncr_fact (
+    ncr_id, ref, status, mode, type, repeat, root_cause, rejected_reson,
+    rejected_count, main_clause, sub_clause, ss_clause, created_at,
+    expected_date_of_completion, actual_date_of_completion, edc_given_date,
+    closed_on, closure_days, overdue_days, audit_info_id, audit_id, audit_ref,
+    audit_type, company_id, company_name, plant_id, plant_name, department_id,
+    department_name
+)
+SELECT
+    ncr.id, ncr.ref, ncr.status, ncr.mode, ncr.type, ncr.repeat,
+    ncr.root_cause, ncr.rejected_reson, coalesce(ncr.rejected_count, 0),
+    ncr.main_clause, ncr.sub_clause, ncr.ss_clause, ncr.created_at,
+    ncr.expected_date_of_completion, ncr.actual_date_of_completion,
+    ncr.edc_given_date, ncr.closed_on,
+    EXTRACT(epoch FROM ncr.actual_date_of_completion - ncr.created_at) / 86400,
+    EXTRACT(epoch FROM ncr.actual_date_of_completion - ncr.edc_given_date) / 86400,
+    auditinfo.id, audit.id, audit.ref, audit.type,
+    company.id, company.name, plant.id, plant.name,
+    department.id, department.name
+FROM ncr
+JOIN auditinfo ON auditinfo.id = ncr.audit_info_id
+JOIN audit ON audit.id = auditinfo.audit_id
+JOIN plant ON plant.id = audit.plant_id
+JOIN company ON company.id = plant.company_id
+JOIN department ON department.id = auditinfo.department_id
+""")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ncr_fact_status'), table_name='ncr_fact')
+    op.drop_index(op.f('ix_ncr_fact_plant_id'), table_name='ncr_fact')
+    op.drop_index(op.f('ix_ncr_fact_mode'), table_name='ncr_fact')
+    op.drop_index(op.f('ix_ncr_fact_department_id'), table_name='ncr_fact')
+    op.drop_index(op.f('ix_ncr_fact_created_at'), table_name='ncr_fact')
+    op.drop_index(op.f('ix_ncr_fact_company_id'), table_name='ncr_fact')
+    op.drop_table('ncr_fact')
@@ -0,0 +1,101 @@
+"""text search: generated tsvector columns, GIN and pg_trgm indexes
+
+Revision ID: c7e3a9d2f5b1
+Revises: b4f1c2d9e7a3
+Create Date: 2026-10-17 09:41:12.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a9d2f5b1'
+down_revision: Union[str, Sequence[str], None] = 'b4f1c2d9e7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# must match the add_search_vector / add_trigram_indexes calls in the models
+SEARCH_VECTORS = {
+    'ncr': {
+        'ref': 'A',
+        'description': 'B',
+        'objective_evidence': 'B',
+        'root_cause': 'C',
+        'requirement': 'D',
+    },
+    'suggestion': {'ref': 'A', 'suggestion': 'B', 'corrective_action': 'C'},
+    'internalauditorschecklistitem': {
+        'audit_findings': 'A',
+        'activity_description': 'B',
+        'applicable_functions': 'C',
+    },
+    'internalauditobservationchecklistitem': {
+        'observation': 'A',
+        'qms_check_point': 'B',
+        'procedure_ref': 'C',
+        'clause_no': 'C',
+    },
+}
+
+TRIGRAM_COLUMNS = {
+    'ncr': ['ref', 'description', 'objective_evidence', 'root_cause'],
+    'suggestion': ['ref', 'suggestion'],
+    'internalauditorschecklistitem': ['audit_findings'],
+    'internalauditobservationchecklistitem': ['observation'],
+}
+
+
+def _document(weighted):
+    return " || ".join(
+        f"setweight(to_tsvector('english'::regconfig, coalesce({name}, '')), '{weight}')"
+        for name, weight in weighted.items()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, weighted in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(_document(weighted), persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f'ix_{table}_search_vector',
+            table,
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
+
+    for table in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
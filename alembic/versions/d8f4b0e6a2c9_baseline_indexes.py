@@ -0,0 +1,389 @@
+"""baseline indexes: foreign keys, refs and created_at
+
+Revision ID: d8f4b0e6a2c9
+Revises: c7e3a9d2f5b1
+Create Date: 2026-10-17 02:50:09.534441
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f4b0e6a2c9'
+down_revision: Union[str, Sequence[str], None] = 'c7e3a9d2f5b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable; Postgres only allows it
+    # outside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_created_at', 'user', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_brcpwarehousechecklist_created_by_id', 'brcpwarehousechecklist', ['created_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_franchiseauditchecklist_created_by_id', 'franchiseauditchecklist', ['created_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_plant_company_id', 'plant', ['company_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_created_at', 'audit', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_plant_id', 'audit', ['plant_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_batteryrefreshstatus_checklist_id', 'batteryrefreshstatus', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chargerinfrastructure_checklist_id', 'chargerinfrastructure', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_department_plant_id', 'department', ['plant_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_franchiseauditobservation_checklist_id', 'franchiseauditobservation', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_measuringinstrument_checklist_id', 'measuringinstrument', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_warehouseadditionalinfo_checklist_id', 'warehouseadditionalinfo', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_auditinfo_audit_id', 'auditinfo', ['audit_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_auditinfo_created_at', 'auditinfo', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_auditinfo_department_id', 'auditinfo', ['department_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_userdepartment_department_id', 'userdepartment', ['department_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_userdepartment_role_id', 'userdepartment', ['role_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_userdepartment_user_id', 'userdepartment', ['user_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_auditteam_audit_info_id', 'auditteam', ['audit_info_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_auditteam_user_id', 'auditteam', ['user_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditobservationchecklist_created_by_id', 'internalauditobservationchecklist', ['created_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditobservationchecklist_internal_audit_number_id', 'internalauditobservationchecklist', ['internal_audit_number_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditorschecklist_created_by_id', 'internalauditorschecklist', ['created_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditorschecklist_internal_audit_number_id', 'internalauditorschecklist', ['internal_audit_number_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncr_audit_info_id', 'ncr', ['audit_info_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncr_created_at', 'ncr', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncr_ref', 'ncr', ['ref'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_suggestion_audit_info_id', 'suggestion', ['audit_info_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_suggestion_created_at', 'suggestion', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_suggestion_ref', 'suggestion', ['ref'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_documentreference_ncr_id', 'documentreference', ['ncr_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_edcrequest_created_at', 'edcrequest', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_edcrequest_ncr_id', 'edcrequest', ['ncr_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_edcrequest_requested_by_id', 'edcrequest', ['requested_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_followup_auditor_id', 'followup', ['auditor_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_followup_created_at', 'followup', ['created_at'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_followup_ncr_id', 'followup', ['ncr_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_followup_requested_by_id', 'followup', ['requested_by_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditobservationchecklistitem_checklist_id', 'internalauditobservationchecklistitem', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_internalauditorschecklistitem_checklist_id', 'internalauditorschecklistitem', ['checklist_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncrfiles_ncr_id', 'ncrfiles', ['ncr_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncrteam_ncr_id', 'ncrteam', ['ncr_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_ncrteam_user_id', 'ncrteam', ['user_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_suggestionteam_suggestion_id', 'suggestionteam', ['suggestion_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_suggestionteam_user_id', 'suggestionteam', ['user_id'], unique=False,
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_suggestionteam_user_id', table_name='suggestionteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_suggestionteam_suggestion_id', table_name='suggestionteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncrteam_user_id', table_name='ncrteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncrteam_ncr_id', table_name='ncrteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncrfiles_ncr_id', table_name='ncrfiles',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditorschecklistitem_checklist_id', table_name='internalauditorschecklistitem',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditobservationchecklistitem_checklist_id', table_name='internalauditobservationchecklistitem',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_followup_requested_by_id', table_name='followup',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_followup_ncr_id', table_name='followup',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_followup_created_at', table_name='followup',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_followup_auditor_id', table_name='followup',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_edcrequest_requested_by_id', table_name='edcrequest',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_edcrequest_ncr_id', table_name='edcrequest',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_edcrequest_created_at', table_name='edcrequest',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_documentreference_ncr_id', table_name='documentreference',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_suggestion_ref', table_name='suggestion',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_suggestion_created_at', table_name='suggestion',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_suggestion_audit_info_id', table_name='suggestion',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncr_ref', table_name='ncr',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncr_created_at', table_name='ncr',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ncr_audit_info_id', table_name='ncr',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditorschecklist_internal_audit_number_id', table_name='internalauditorschecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditorschecklist_created_by_id', table_name='internalauditorschecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditobservationchecklist_internal_audit_number_id', table_name='internalauditobservationchecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_internalauditobservationchecklist_created_by_id', table_name='internalauditobservationchecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_auditteam_user_id', table_name='auditteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_auditteam_audit_info_id', table_name='auditteam',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_userdepartment_user_id', table_name='userdepartment',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_userdepartment_role_id', table_name='userdepartment',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_userdepartment_department_id', table_name='userdepartment',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_auditinfo_department_id', table_name='auditinfo',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_auditinfo_created_at', table_name='auditinfo',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_auditinfo_audit_id', table_name='auditinfo',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_warehouseadditionalinfo_checklist_id', table_name='warehouseadditionalinfo',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_measuringinstrument_checklist_id', table_name='measuringinstrument',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_franchiseauditobservation_checklist_id', table_name='franchiseauditobservation',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_department_plant_id', table_name='department',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chargerinfrastructure_checklist_id', table_name='chargerinfrastructure',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_batteryrefreshstatus_checklist_id', table_name='batteryrefreshstatus',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_plant_id', table_name='audit',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_created_at', table_name='audit',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_plant_company_id', table_name='plant',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_franchiseauditchecklist_created_by_id', table_name='franchiseauditchecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_brcpwarehousechecklist_created_by_id', table_name='brcpwarehousechecklist',
+            if_exists=True, postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_user_created_at', table_name='user',
+            if_exists=True, postgresql_concurrently=True,
+        )
@@ -21,6 +21,7 @@ from app.audit.models import (
 )
 from app.core.security import authenticate
 from app.users.models import User
+from app.utils.export import ExportFormat
 
 router = APIRouter()
 
@@ -54,6 +55,8 @@ async def get_all_audits(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     audit_service: AuditService = Depends(get_audit_service),
      from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
@@ -63,6 +66,8 @@ async def get_all_audits(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
     )
@@ -74,6 +79,18 @@ async def get_all_audits(
     )
 
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def stream_audits(
+    format: ExportFormat = ExportFormat.CSV,
+    filters: Optional[str] = None,
+    sort: Optional[str] = "created_at.desc",
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    return audit_service.stream_audits(format, filters, sort, from_date, to_date)
+
+
 @router.get(
     "/export/all",
     status_code=status.HTTP_200_OK,
@@ -6,7 +6,7 @@ from typing import List, Optional
 from sqlmodel import Field, Relationship
 from app.core.schemas import BaseModel
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
 
@@ -31,6 +31,8 @@ class AuditTypeRequest(PydanticBaseModel):
     code : str
 
 class Audit(BaseModel, table=True):
+    __table_args__ = (Index("ix_audit_created_at", "created_at"),)
+
     ref: str
     type: str
     standard: str
@@ -40,7 +42,7 @@ class Audit(BaseModel, table=True):
     remarks: Optional[str] = None
     plant_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("plant.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("plant.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     plant: "Plant" = Relationship(back_populates="audits")
@@ -85,10 +87,12 @@ class AuditResponse(PydanticBaseModel):
     
     
 class AuditListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data: List["AuditResponse"]
     
     
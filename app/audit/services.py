@@ -13,18 +13,18 @@ from app.audit.models import (
     AuditUpdateRequest,
 )
 from datetime import datetime
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
 
-from app.audit_info.models import AuditInfo, AuditTeam
+from app.audit_info.models import AuditInfo
 from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
+from app.ncr.facts import refresh_ncr_facts
 from app.ncr.models import NCR, NCRStatus
 from app.settings.links import UserDepartment
 from app.settings.models import (
-    Company,
     CompanyResponse,
     Department,
     DepartmentResponse,
@@ -32,15 +32,16 @@ from app.settings.models import (
     PlantResponse,
 )
 from app.utils.serializer import to_naive
-from app.utils.model_graph import ModelGraph
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
 from app.utils.dsl_filter import apply_filters, apply_sort
+from app.utils.export import ExportFormat, export_query
 
 
 class AuditService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build([Audit, AuditInfo, AuditTeam, NCR, Department, Plant, Company])
+        self.graph = get_model_graph()
 
     async def create_audit(self, data: AuditRequest, user_id: UUID):
         user_department = await self.session.execute(
@@ -93,6 +94,8 @@ class AuditService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(Audit).options(
             selectinload(Audit.plant).options(selectinload(Plant.company))
@@ -113,23 +116,26 @@ class AuditService:
         if filters:
             stmt = apply_filters(stmt, filters, Audit, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, Audit, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        audits = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            Audit,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        audits = page_result.items
 
         response = AuditListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 AuditResponse(
                     id=audit.id,
@@ -224,6 +230,43 @@ class AuditService:
         return response
     
     
+    def audit_export_row(self, audit: Audit) -> dict:
+        return {
+            "ref": audit.ref,
+            "created_at": audit.created_at,
+            "type": audit.type,
+            "standard": audit.standard,
+            "schedule": audit.schedule,
+            "start_date": audit.start_date,
+            "end_date": audit.end_date,
+            "company": audit.plant.company.name,
+            "plant": audit.plant.name,
+            "remarks": audit.remarks,
+        }
+
+    def stream_audits(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = "created_at.desc",
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ):
+        stmt = select(Audit).options(
+            selectinload(Audit.plant).options(selectinload(Plant.company))
+        )
+
+        from_date = to_naive(from_date)
+        to_date = to_naive(to_date)
+        if from_date:
+            stmt = stmt.where(Audit.created_at >= from_date)
+        if to_date:
+            stmt = stmt.where(Audit.created_at <= to_date)
+
+        return export_query(
+            stmt, Audit, self.graph, self.audit_export_row, format, "audits", filters, sort
+        )
+
     async def get_all_audit_ids(self, filters: Optional[str] = None, sort: Optional[str] = None, from_date: Optional[datetime] = None, to_date: Optional[datetime] = None):
         stmt = select(Audit).options(
             selectinload(Audit.plant).options(selectinload(Plant.company))
@@ -339,6 +382,7 @@ class AuditService:
           
         if audit.remarks and audit.remarks != data.remarks:
             audit.remarks = data.remarks
+        await refresh_ncr_facts(self.session, Audit.id == audit.id)
         await self.session.commit()
         return audit
 
@@ -19,6 +19,7 @@ from app.audit_info.models import (
 )
 from app.core.security import authenticate
 from app.users.models import User
+from app.utils.export import ExportFormat
 
 
 router = APIRouter()
@@ -55,6 +56,8 @@ async def get_all_audit_info(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     audit_info_service: AuditInfoService = Depends(get_audit_info_service),
@@ -64,6 +67,8 @@ async def get_all_audit_info(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
     )
@@ -75,6 +80,20 @@ async def get_all_audit_info(
     )
 
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def stream_audit_info(
+    format: ExportFormat = ExportFormat.CSV,
+    filters: Optional[str] = None,
+    sort: Optional[str] = "created_at.desc",
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    audit_info_service: AuditInfoService = Depends(get_audit_info_service),
+):
+    return audit_info_service.stream_audit_info(
+        format, filters, sort, from_date, to_date
+    )
+
+
 @router.get(
     "/{audit_info_id}",
     status_code=status.HTTP_200_OK,
@@ -1,7 +1,7 @@
 
 
 from datetime import datetime
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlmodel import Field, Relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
@@ -18,10 +18,12 @@ class AuditInfoStatus(str, Enum):
 
 
 class AuditInfo(BaseModel, table=True):
+    __table_args__ = (Index("ix_auditinfo_created_at", "created_at"),)
+
     ref: str
     department_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("department.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("department.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     department:  "Department" = Relationship(back_populates="audits")
@@ -35,7 +37,7 @@ class AuditInfo(BaseModel, table=True):
     )
     audit_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("audit.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("audit.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     
@@ -71,12 +73,12 @@ class AuditTeamRole(str, Enum):
 class AuditTeam(BaseModel, table=True):
     user_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     audit_info_id: Optional[UUID] = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     role: AuditTeamRole = Field(default=AuditTeamRole.AUDITOR)
@@ -125,10 +127,12 @@ class AuditInfoResponse(PydanticBaseModel):
     
     
 class AuditInfoListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["AuditInfoResponse"]
     
     
@@ -19,13 +19,16 @@ from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
 from app.core.mail import send_email
 from app.ncr.models import NCR, NCRStatus
 from app.settings.links import Department
-from app.settings.models import Company, DepartmentResponse, Plant
+from app.settings.models import DepartmentResponse, Plant
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
 from app.suggestions.models import Suggestion
+from app.utils.background import enqueue_task
 from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
+from app.utils.export import ExportFormat, export_query
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
 
 from app.users.models import UserResponse, User
 from app.utils.serializer import to_naive
@@ -35,8 +38,7 @@ from app.core.config import settings
 class AuditInfoService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build([AuditInfo, AuditTeam, Audit, Department, Plant, Company])
+        self.graph = get_model_graph()
 
     def _count_ncrs(self, ncrs):
         result = {status.value: 0 for status in NCRStatus}
@@ -209,7 +211,8 @@ class AuditInfoService:
             if team.role != AuditTeamRole.AUDITEE:
                 
 
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [user.email],
                     "ARe-Audit Management : Audit Assigned",
@@ -235,7 +238,8 @@ class AuditInfoService:
                     },
                 )
             else:
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [user.email],
                     "ARe-Audit Management : Audit Assigned",
@@ -273,6 +277,8 @@ class AuditInfoService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(AuditInfo).options(
             selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
@@ -295,23 +301,26 @@ class AuditInfoService:
         if filters:
             stmt = apply_filters(stmt, filters, AuditInfo, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, AuditInfo, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        audit_infos = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            AuditInfo,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        audit_infos = page_result.items
 
         response = AuditInfoListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 AuditInfoResponse(
                     id=audit_info.id,
@@ -335,7 +344,6 @@ class AuditInfoService:
                             user=UserResponse(
                                 id=audit_team.user_id,
                                 employee_id=audit_team.user.employee_id,
-                                password=audit_team.user.password,
                                 email=audit_team.user.email,
                                 qualification=audit_team.user.qualification,
                                 designation=audit_team.user.designation,
@@ -403,7 +411,6 @@ class AuditInfoService:
                     user=UserResponse(
                         id=audit_team.user_id,
                         employee_id=audit_team.user.employee_id,
-                        password=audit_team.user.password,
                         email=audit_team.user.email,
                         qualification=audit_team.user.qualification,
                         designation=audit_team.user.designation,
@@ -489,7 +496,8 @@ class AuditInfoService:
             audit_info.closed_date = to_naive(val["closed_date"])
             audit_info.status = "CLOSED"
             if(user_id == auditor.user.id):
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [hod.user.email],
                     f"ARe-Audit Management : Internal Audit Closed - {audit_info.ref}",
@@ -589,7 +597,6 @@ class AuditInfoService:
                         user=UserResponse(
                             id=audit_team.user_id,
                             employee_id=audit_team.user.employee_id,
-                            password=audit_team.user.password,
                             email=audit_team.user.email,
                             qualification=audit_team.user.qualification,
                             designation=audit_team.user.designation,
@@ -612,6 +619,66 @@ class AuditInfoService:
 
         return response
 
+    def audit_info_export_row(self, audit_info: AuditInfo) -> dict:
+        members = {role: [] for role in AuditTeamRole}
+        for member in audit_info.team:
+            members[member.role].append(member.user.name)
+        department = audit_info.department
+        return {
+            "ref": audit_info.ref,
+            "created_at": audit_info.created_at,
+            "status": audit_info.status,
+            "audit_ref": audit_info.audit.ref,
+            "audit_type": audit_info.audit.type,
+            "company": department.plant.company.name,
+            "plant": department.plant.name,
+            "department": department.name,
+            "from_date": audit_info.from_date,
+            "to_date": audit_info.to_date,
+            "closed_date": audit_info.closed_date,
+            "auditor": members[AuditTeamRole.AUDITOR],
+            "trainee": members[AuditTeamRole.TRAINEE],
+            "auditee_coordinator": members[AuditTeamRole.AUDITEE_COORDINATOR],
+            "auditee": members[AuditTeamRole.AUDITEE],
+            "hod": members[AuditTeamRole.HOD],
+            "ncr_count": len(audit_info.ncrs),
+        }
+
+    def stream_audit_info(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = "created_at.desc",
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ):
+        stmt = select(AuditInfo).options(
+            selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
+            selectinload(AuditInfo.department).options(
+                selectinload(Department.plant).options(selectinload(Plant.company))
+            ),
+            selectinload(AuditInfo.audit),
+            # only counted
+            selectinload(AuditInfo.ncrs).load_only(NCR.id),
+        )
+        from_date = to_naive(from_date)
+        to_date = to_naive(to_date)
+        if from_date:
+            stmt = stmt.where(AuditInfo.from_date >= from_date)
+        if to_date:
+            stmt = stmt.where(AuditInfo.to_date <= to_date)
+
+        return export_query(
+            stmt,
+            AuditInfo,
+            self.graph,
+            self.audit_info_export_row,
+            format,
+            "audit_info",
+            filters,
+            sort,
+        )
+
     async def create_audit_team(
         self,
         data: AuditTeamRequest,
@@ -690,7 +757,8 @@ class AuditInfoService:
                 "N/A",
             )
 
-            background_tasks.add_task(
+            enqueue_task(
+                background_tasks,
                 send_email,
                 [user.email],
                 "ARe-Audit Management : Audit Assigned",
@@ -716,7 +784,8 @@ class AuditInfoService:
                 },
             )
         else:
-            background_tasks.add_task(
+            enqueue_task(
+                background_tasks,
                 send_email,
                 [user.email],
                 "ARe-Audit Management : Audit Assigned",
@@ -811,7 +880,6 @@ class AuditInfoService:
                         user=UserResponse(
                             id=audit_team.user_id,
                             employee_id=audit_team.user.employee_id,
-                            password=audit_team.user.password,
                             email=audit_team.user.email,
                             qualification=audit_team.user.qualification,
                             designation=audit_team.user.designation,
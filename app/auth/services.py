@@ -1,5 +1,5 @@
 from app.auth.models import ChangePasswordRequest, ForgotPassword, Login, LoginResponse, PasswordUpdateRequest
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import create_access_token, hash_password, verify_password
 from app.settings.links import UserDepartment
 from app.users.models import User, UserDepartmentResponse, UserResponse
 from fastapi import HTTPException, status
@@ -56,7 +56,6 @@ class AuthService:
             user=UserResponse(
                 id=user.id,
                 employee_id=user.employee_id,
-                password=user.password,
                 email=user.email,
                 qualification=user.qualification,
                 designation=user.designation,
@@ -91,7 +90,7 @@ class AuthService:
                     "data": None,
                 },
             )
-        if not verify_password(data.old_password, user.password):
+        if not await verify_password(data.old_password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -101,7 +100,7 @@ class AuthService:
                     "data": None,
                 },
             )
-        user.password = get_password_hash(data.new_password)
+        user.password = await hash_password(data.new_password)
         await self.session.commit()
         return user
     
@@ -121,7 +120,7 @@ class AuthService:
                     "data": None,
                 },
             )
-        if not verify_password(data.old_password, user.password):
+        if not await verify_password(data.old_password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -131,7 +130,7 @@ class AuthService:
                     "data": None,
                 },
             )
-        user.password = get_password_hash(data.new_password)
+        user.password = await hash_password(data.new_password)
         await self.session.commit()
         return user
     
@@ -86,6 +86,8 @@ async def get_all_internal_auditors_checklists(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     checklist_service: ChecklistService = Depends(get_checklist_service),
@@ -95,6 +97,8 @@ async def get_all_internal_auditors_checklists(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
     )
@@ -228,6 +232,8 @@ async def get_all_internal_audit_observation_checklists(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     checklist_service: ChecklistService = Depends(get_checklist_service),
@@ -238,6 +244,8 @@ async def get_all_internal_audit_observation_checklists(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
         
@@ -371,6 +379,8 @@ async def get_all_franchise_audit_checklists(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     checklist_service: ChecklistService = Depends(get_checklist_service),
@@ -380,6 +390,8 @@ async def get_all_franchise_audit_checklists(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
     )
@@ -462,6 +474,8 @@ async def get_all_brcp_warehouse_checklists(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
     checklist_service: ChecklistService = Depends(get_checklist_service),
@@ -471,6 +485,8 @@ async def get_all_brcp_warehouse_checklists(
         sort=sort,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
         from_date=from_date,
         to_date=to_date,
     )
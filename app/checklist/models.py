@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import Column
 from sqlmodel import Field, ForeignKey, Relationship
 from app.core.schemas import BaseModel
+from app.utils.text_search import add_search_vector, add_trigram_indexes
 from pydantic import BaseModel as PydanticBaseModel
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
@@ -20,16 +21,23 @@ class InternalAuditorsChecklistItem(BaseModel, table=True):
     audit_findings: str
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("internalauditorschecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("internalauditorschecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     checklist: "InternalAuditorsChecklist" = Relationship(back_populates="items")
 
 
+add_search_vector(
+    InternalAuditorsChecklistItem,
+    {"audit_findings": "A", "activity_description": "B", "applicable_functions": "C"},
+)
+add_trigram_indexes(InternalAuditorsChecklistItem, "audit_findings")
+
+
 class InternalAuditorsChecklist(BaseModel, table=True):
     internal_audit_number_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     internal_audit_number: 'AuditInfo' = Relationship(back_populates="internal_audit_checklists")
@@ -43,7 +51,7 @@ class InternalAuditorsChecklist(BaseModel, table=True):
     )
     created_by_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     created_by: "User" = Relationship(back_populates="internal_auditors_checklists")
@@ -58,7 +66,7 @@ class InternalAuditObservationChecklistItem(BaseModel, table=True):
     ncr_type: str
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("internalauditobservationchecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("internalauditobservationchecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     checklist: "InternalAuditObservationChecklist" = Relationship(
@@ -66,10 +74,17 @@ class InternalAuditObservationChecklistItem(BaseModel, table=True):
     )
 
 
+add_search_vector(
+    InternalAuditObservationChecklistItem,
+    {"observation": "A", "qms_check_point": "B", "procedure_ref": "C", "clause_no": "C"},
+)
+add_trigram_indexes(InternalAuditObservationChecklistItem, "observation")
+
+
 class InternalAuditObservationChecklist(BaseModel, table=True):
     internal_audit_number_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     division: str
@@ -83,7 +98,7 @@ class InternalAuditObservationChecklist(BaseModel, table=True):
     auditee_name: str
     created_by_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     created_by: "User" = Relationship(
@@ -106,7 +121,7 @@ class BRCPWarehouseChecklist(BaseModel, table=True):
     )
     created_by_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
 
@@ -126,7 +141,7 @@ class ChargerInfrastructure(BaseModel, table=True) :
     )
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
 
@@ -139,7 +154,7 @@ class MeasuringInstrument(BaseModel, table=True):
     calibration_due_on: Optional[date]
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     checklist: Optional["BRCPWarehouseChecklist"] = Relationship(
@@ -161,13 +176,13 @@ class WarehouseAdditionalInfo(BaseModel, table=True):
     )
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
 
 
 class BatteryRefreshStatus(BaseModel, table=True):
-    checklist_id: UUID = Field(foreign_key="brcpwarehousechecklist.id")
+    checklist_id: UUID = Field(foreign_key="brcpwarehousechecklist.id", index=True)
     type: str  # 2W / 4W
     model: Optional[str] = None  # AM / PZ / Elito
     total_due_qty: Optional[int] = None
@@ -188,7 +203,7 @@ class BatteryRefreshStatus(BaseModel, table=True):
     )
     checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("brcpwarehousechecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     
@@ -213,6 +228,7 @@ class FranchiseAuditChecklist(BaseModel, table=True):
             PG_UUID,
             ForeignKey("user.id", ondelete="CASCADE"),
             nullable=False,
+            index=True,
         )
     )
 
@@ -233,7 +249,7 @@ class FranchiseAuditObservation(BaseModel, table=True):
         checklist: Optional["FranchiseAuditChecklist"] = Relationship(back_populates="observations")
         checklist_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("franchiseauditchecklist.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("franchiseauditchecklist.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
 
@@ -290,10 +306,12 @@ class InternalAuditorsChecklistItemUpdate(PydanticBaseModel):
     
     
 class InternalAuditorsChecklistListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["InternalAuditorsChecklistResponse"]
     
 class InternalAuditObservationChecklistRequest(PydanticBaseModel):
@@ -354,10 +372,12 @@ class InternalAuditObservationChecklistResponse(PydanticBaseModel):
     updated_at: Optional[datetime] = None
     
 class InternalAuditObservationChecklistListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["InternalAuditObservationChecklistResponse"]
     
     
@@ -425,10 +445,12 @@ class FranchiseAuditObservationResponse(PydanticBaseModel):
         observation: Optional[str]
         
 class FranchiseAuditChecklistListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["FranchiseAuditChecklistResponse"]
     
 class BRCPWarehouseChecklistRequest(PydanticBaseModel):
@@ -603,10 +625,12 @@ class BatteryRefreshStatusResponse(PydanticBaseModel):
     checklist_id: UUID
     
 class BRCPWarehouseChecklistListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["BRCPWarehouseChecklistResponse"]
 
 from app.users.models import User
@@ -44,11 +44,12 @@ from app.checklist.models import (
 from app.core.config import settings
 from app.core.mail import send_email
 from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
-from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
+from app.utils.dsl_filter import apply_filters
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
 from app.utils.serializer import to_naive
 from app.users.models import UserResponse, User
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import selectinload
 
 
@@ -56,21 +57,7 @@ from sqlalchemy.orm import selectinload
 class ChecklistService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build(
-            [
-                InternalAuditorsChecklist,
-                InternalAuditorsChecklistItem,
-                InternalAuditObservationChecklist,
-                InternalAuditObservationChecklistItem,
-                BRCPWarehouseChecklist,
-                ChargerInfrastructure,
-                MeasuringInstrument,
-                BatteryRefreshStatus,
-                FranchiseAuditChecklist,
-                FranchiseAuditObservation,
-            ]
-        )
+        self.graph = get_model_graph()
         
         
     async def create_internal_auditors_checklist(
@@ -236,6 +223,8 @@ class ChecklistService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(InternalAuditorsChecklist).options(
             selectinload(InternalAuditorsChecklist.items).options(
@@ -258,23 +247,26 @@ class ChecklistService:
         if filters:
             stmt = apply_filters(stmt, filters, InternalAuditorsChecklist, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, InternalAuditorsChecklist, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        checklists = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            InternalAuditorsChecklist,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        checklists = page_result.items
 
         response = InternalAuditorsChecklistListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 InternalAuditorsChecklistResponse(
                     id=checklist.id,
@@ -564,6 +556,8 @@ class ChecklistService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(InternalAuditObservationChecklist).options(
             selectinload(InternalAuditObservationChecklist.items),
@@ -584,23 +578,26 @@ class ChecklistService:
         if filters:
             stmt = apply_filters(stmt, filters, InternalAuditObservationChecklist, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, InternalAuditObservationChecklist, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        checklists = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            InternalAuditObservationChecklist,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        checklists = page_result.items
 
         response = InternalAuditObservationChecklistListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 InternalAuditObservationChecklistResponse(
                     id=checklist.id,
@@ -907,6 +904,8 @@ class ChecklistService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(FranchiseAuditChecklist).options(
             selectinload(FranchiseAuditChecklist.observations).options(
@@ -928,23 +927,26 @@ class ChecklistService:
         if filters:
             stmt = apply_filters(stmt, filters, FranchiseAuditChecklist, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, FranchiseAuditChecklist, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        checklists = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            FranchiseAuditChecklist,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        checklists = page_result.items
 
         response = FranchiseAuditChecklistListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 FranchiseAuditChecklistResponse(
                     id=checklist.id,
@@ -1260,6 +1262,8 @@ class ChecklistService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ):
         stmt = select(BRCPWarehouseChecklist).options(
             selectinload(BRCPWarehouseChecklist.chargers).options(
@@ -1290,23 +1294,26 @@ class ChecklistService:
         if filters:
             stmt = apply_filters(stmt, filters, BRCPWarehouseChecklist, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, BRCPWarehouseChecklist, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        checklists = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            BRCPWarehouseChecklist,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        checklists = page_result.items
 
         response = BRCPWarehouseChecklistListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 BRCPWarehouseChecklistResponse(
                     id=checklist.id,
@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.core.config import settings
+
+
+class CacheBackend:
+    """Minimal async key/value store used by :class:`ResponseCache`."""
+
+    async def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def generation(self, namespace: str) -> int:
+        raise NotImplementedError
+
+    async def bump_generation(self, namespace: str) -> int:
+        raise NotImplementedError
+
+
+class TTLCache:
+    """Synchronous per-process LRU with a TTL on every entry."""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def discard_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU with a TTL on every entry."""
+
+    def __init__(self, max_entries: int = 256):
+        self._entries = TTLCache(max_entries=max_entries)
+        self._generations: dict[str, int] = {}
+
+    async def get(self, key: str) -> Any:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def bump_generation(self, namespace: str) -> int:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        # old generations can never be read again, drop them eagerly
+        self._entries.discard_prefix(f"{namespace}:")
+        return self._generations[namespace]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared backend so every uvicorn worker sees the same entries.
+
+    Requires the optional ``redis`` package. Eviction is left to the server's
+    ``maxmemory-policy`` (``allkeys-lru`` recommended).
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "CACHE_URL is set but the 'redis' package is not installed"
+            ) from exc
+        self.client = redis.from_url(url)
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(key)
+        return pickle.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.client.set(key, pickle.dumps(value), ex=ttl)
+
+    async def generation(self, namespace: str) -> int:
+        return int(await self.client.get(f"{namespace}:generation") or 0)
+
+    async def bump_generation(self, namespace: str) -> int:
+        return await self.client.incr(f"{namespace}:generation")
+
+
+def get_cache_backend() -> CacheBackend:
+    if settings.CACHE_URL:
+        return RedisCacheBackend(settings.CACHE_URL)
+    return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+class ResponseCache:
+    """
+    Caches coroutine results per namespace.
+
+    Keys embed the namespace's current *generation*; ``invalidate`` bumps it so
+    every entry written before the bump becomes unreachable at once, on every
+    worker sharing the backend.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend: Optional[CacheBackend] = None,
+        ttl: int = settings.CACHE_TTL_SECONDS,
+    ):
+        self.namespace = namespace
+        self.backend = backend or get_cache_backend()
+        self.ttl = ttl
+        self._pending: set[asyncio.Task] = set()
+
+    def make_key(self, name: str, params: dict) -> str:
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{name}:{digest}"
+
+    async def get_or_set(
+        self, name: str, params: dict, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.ttl <= 0:
+            return await factory()
+
+        try:
+            generation = await self.backend.generation(self.namespace)
+            key = f"{self.namespace}:{generation}:{self.make_key(name, params)}"
+            value = await self.backend.get(key)
+        except Exception:
+            logging.exception("Cache lookup failed for %s", name)
+            return await factory()
+
+        if value is not None:
+            return value
+
+        value = await factory()
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except Exception:
+            logging.exception("Cache store failed for %s", name)
+        return value
+
+    async def invalidate(self) -> None:
+        try:
+            await self.backend.bump_generation(self.namespace)
+        except Exception:
+            logging.exception("Cache invalidation failed for %s", self.namespace)
+
+    def invalidate_now(self) -> None:
+        """
+        :meth:`invalidate` from synchronous code (ORM events).
+
+        Under an AsyncSession the event runs in SQLAlchemy's greenlet, so the
+        bump is awaited there and ``await session.commit()`` only returns once
+        it is done: no read can refill the cache from the old generation in
+        between. Elsewhere (sync sessions, scripts) it is scheduled instead.
+        """
+        if in_greenlet():
+            await_only(self.invalidate())
+        else:
+            self.invalidate_soon()
+
+    def invalidate_soon(self) -> None:
+        """Schedule :meth:`invalidate` on the running loop, if any."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.invalidate())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def cached(self, func):
+        """Decorator for ``async`` service methods; ``self`` is not part of the key."""
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+            return await self.get_or_set(
+                func.__name__, params, lambda: func(*args, **kwargs)
+            )
+
+        return wrapper
@@ -1,5 +1,5 @@
 import secrets
-from typing import List
+from typing import Dict, List
 
 from pydantic import  EmailStr
 from pydantic_settings import BaseSettings
@@ -26,6 +26,36 @@ class Settings(BaseSettings):
     FRONTEND_URL: str
     TELEGRAM_BOT_TOKEN: str
     TELEGRAM_CHAT_ID: str
+    TELEGRAM_ERROR_ALERTS: bool = False  # post unhandled exceptions to the Telegram chat
+    SLOW_REQUEST_MS: int = 800  # logged as a warning
+    VERY_SLOW_REQUEST_MS: int = 2000  # logged as an error
+    DASHBOARD_MAX_CONNECTIONS: int = 4
+    CACHE_URL: str | None = None  # e.g. redis://localhost:6379/0, shared by all workers
+    CACHE_TTL_SECONDS: int = 30
+    CACHE_MAX_ENTRIES: int = 256
+    COUNT_ESTIMATE_MIN_ROWS: int = 10000
+    COUNT_ESTIMATE_TTL_SECONDS: int = 60
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # hashing jobs admitted at once; others wait
+    PASSWORD_HASH_USE_PROCESSES: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # per process; bounds staleness on other workers
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 1024
+    TOKEN_CACHE_MAX_ENTRIES: int = 4096
+    INDEX_ADVISOR_ENABLED: bool = True
+    INDEX_ADVISOR_SAMPLE_RATE: float = 0.05  # share of ORM selects inspected for column usage
+    INDEX_ADVISOR_MIN_ROWS: int = 1000  # smaller tables are left to sequential scans
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_MAX_FINGERPRINTS: int = 2000
+    QUERY_STATS_SAMPLES: int = 512  # latest durations kept per statement for percentiles
+    QUERY_EXPLAIN_THRESHOLD_MS: int = 500
+    QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    QUERY_EXPLAIN_INTERVAL_SECONDS: int = 600  # per statement fingerprint
+    QUERY_BUDGET_ENABLED: bool = True
+    QUERY_BUDGET_DEFAULT: int = 30  # statements per request
+    QUERY_BUDGET_ROUTES: Dict[str, int] = {}  # e.g. {"GET /api/dashboard/admin": 80}
+    QUERY_BUDGET_REPEATS: int = 10  # executions of one statement fingerprint (N+1)
+    QUERY_BUDGET_STRICT: bool = False  # raise instead of logging; set in test runs
+    METRICS_ENABLED: bool = True  # Prometheus text format at /metrics
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,10 +1,20 @@
+import asyncio
+import json
 import logging
 from sqlmodel import SQLModel
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from app.core.config import settings
-from typing import AsyncGenerator
+from app.core.metrics import (
+    DB_POOL_ACQUIRE,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+)
+from app.core.query_stats import SKIP_QUERY_STATS, query_stats, request_queries
+from typing import Any, AsyncGenerator, Awaitable, Callable, Sequence
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import time
 from sqlalchemy.ext.asyncio import async_sessionmaker,AsyncEngine
 
@@ -12,27 +22,86 @@ from sqlalchemy.ext.asyncio import async_sessionmaker,AsyncEngine
 DATABASE_URL = settings.DATABASE_URL
 print("DATABASE_URL =", repr(DATABASE_URL))
 
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Default asyncpg pool, timing how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_ACQUIRE.observe(time.perf_counter() - start)
+
+
 engine = create_async_engine(DATABASE_URL, echo=False, future=True,    pool_pre_ping=True,
+    poolclass=TimedQueuePool,
 )
 
-
+DB_POOL_SIZE.set_function(lambda: engine.sync_engine.pool.size())
+DB_POOL_CHECKED_OUT.set_function(lambda: engine.sync_engine.pool.checkedout())
+DB_POOL_OVERFLOW.set_function(lambda: engine.sync_engine.pool.overflow())
 
 
 async_session = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
 )
+# strong references to in-flight plan captures
+_plan_tasks: set = set()
+
+
 @event.listens_for(engine.sync_engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    context._query_start_time = time.time()
+    context._query_start_time = time.perf_counter()
 
 
 @event.listens_for(engine.sync_engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time.time() - context._query_start_time
+    total = time.perf_counter() - context._query_start_time
     if total > 1:
         logging.warning(f"Slow query ({total:.2f}s): {statement}")
 
+    if context.execution_options.get(SKIP_QUERY_STATS):
+        return
+    duration_ms = total * 1000
+    queries = request_queries.get()
+    if queries is not None:
+        queries.record(statement, duration_ms)
+
+    if not settings.QUERY_STATS_ENABLED:
+        return
+    key = query_stats.record(statement, duration_ms, getattr(cursor, "rowcount", None))
+    if not executemany and query_stats.should_explain(key, statement, duration_ms):
+        task = asyncio.get_running_loop().create_task(
+            capture_plan(key, statement, parameters, duration_ms)
+        )
+        _plan_tasks.add(task)
+        task.add_done_callback(_plan_tasks.discard)
+
+
+async def capture_plan(key: str, statement: str, parameters: Any, duration_ms: float) -> None:
+    """EXPLAIN (ANALYZE, BUFFERS) a slow SELECT on its own connection, then roll back."""
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(**{SKIP_QUERY_STATS: True})
+            # the statement runs again; never let a plan capture take much
+            # longer than the query it explains
+            timeout_ms = int(max(duration_ms * 2, 1000))
+            await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                tuple(parameters or ()),
+            )
+            plan = result.scalar()
+            await conn.rollback()
+        query_stats.set_plan(key, json.loads(plan) if isinstance(plan, str) else plan, duration_ms)
+    except Exception:
+        logging.exception("Could not capture query plan")
+    finally:
+        query_stats.explain_done()
+
 
 async def init_db():
     async with engine.begin() as conn:
@@ -43,6 +112,47 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def run_concurrently(
+    sections: Sequence[Callable[[AsyncSession], Awaitable[Any]]],
+    session_factory: async_sessionmaker = async_session,
+    max_connections: int = settings.DASHBOARD_MAX_CONNECTIONS,
+) -> list[Any]:
+    """
+    Run independent read-only sections concurrently and return their results
+    in the order given.
+
+    At most ``max_connections`` short-lived sessions are opened. Each one
+    drains sections from a shared queue, so a single request never holds more
+    than that many pooled connections no matter how many sections it has.
+    """
+    if not sections:
+        return []
+
+    results: list[Any] = [None] * len(sections)
+    pending = list(enumerate(sections))
+    pending.reverse()
+
+    async def worker() -> None:
+        async with session_factory() as session:
+            while pending:
+                index, section = pending.pop()
+                results[index] = await section(session)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(max(1, min(max_connections, len(sections)))):
+                group.create_task(worker())
+    except ExceptionGroup as exc:
+        # re-raise the first failure itself so HTTPException & co. still reach
+        # their handlers; the others are logged and kept on the chain
+        first, *others = exc.exceptions
+        for other in others:
+            logging.error("Concurrent section also failed", exc_info=other)
+        raise first from exc
+
+    return results
+
+
 # redis_client = redis.from_url(settings.REDIS_URL)
 
 # async def get_redis_connection():
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Sequence
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+"""
+# PASSWORD HASHING
+
+Argon2 is CPU- and memory-hard by design (~0.25 s per hash here), so it never
+runs on the event loop. `password_hasher` sends the work to a small process
+pool (threads when processes are unavailable or disabled) and admits at most
+PASSWORD_HASH_MAX_PENDING jobs at a time; further callers wait for a slot
+instead of piling work onto the pool.
+
+Workers are spawned, so each one imports the parent's `__main__` module: a
+script that uses the hasher must keep its top-level code under
+`if __name__ == "__main__":`, or every worker dies on startup and hashing
+falls back to threads (or set PASSWORD_HASH_USE_PROCESSES=false for it).
+"""
+
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+
+# module-level so they can be pickled into worker processes
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _hash_many(passwords: Sequence[str]) -> list[str]:
+    return [pwd_context.hash(password) for password in passwords]
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return pwd_context.verify(password, hashed)
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+        use_processes: bool = settings.PASSWORD_HASH_USE_PROCESSES,
+    ):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    # spawn: never fork the running event loop / DB connections
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError):
+                    logging.exception("Process pool unavailable, hashing in threads")
+                    self.use_processes = False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # every caller queued on the broken pool lands here; only the
+                # first replaces it, later ones must not shut down the new one
+                if self._executor is executor:
+                    logging.exception("Password hashing pool broke, hashing in threads")
+                    self.use_processes = False
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(_verify, password, hashed)
+
+    async def hash_many(self, passwords: Sequence[str]) -> list[str]:
+        """Hash a batch (bulk imports), split across the workers in order."""
+        if not passwords:
+            return []
+        size = -(-len(passwords) // self.workers)
+        chunks = [passwords[i : i + size] for i in range(0, len(passwords), size)]
+        results = await asyncio.gather(
+            *(self._run(_hash_many, list(chunk)) for chunk in chunks)
+        )
+        return [hashed for chunk in results for hashed in chunk]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
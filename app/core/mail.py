@@ -1,9 +1,11 @@
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
 
 from app.core.config import settings
+from app.core.metrics import EMAIL_SEND_DURATION
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +38,7 @@ conf = ConnectionConfig(
 
 async def send_email(to: list[str], subject: str, context: dict):
     print(conf)
+    start = time.perf_counter()
     try:
         logger.info(f"Attempting to send email to: {to} | Subject: {subject}")
         logger.debug(f"Email context: {context}")
@@ -51,7 +54,9 @@ async def send_email(to: list[str], subject: str, context: dict):
         await fm.send_message(message, template_name="base.html")
 
         logger.info(f"Email successfully sent to {to}")
+        EMAIL_SEND_DURATION.observe(time.perf_counter() - start, result="sent")
         return True
     except Exception as e:
         logger.error(f"Failed to send email to {to} | Error: {e}", exc_info=True)
+        EMAIL_SEND_DURATION.observe(time.perf_counter() - start, result="failed")
         return False
\ No newline at end of file
@@ -0,0 +1,256 @@
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+
+"""
+# QUERY STATISTICS
+
+The engine's cursor hooks (app/core/database.py) feed every statement into
+`query_stats`, keyed by a fingerprint of its SQL (literals, bind parameters
+and IN / VALUES lists collapsed):
+
+- calls, total / max time, and p50 / p95 / p99 over the last
+  QUERY_STATS_SAMPLES executions;
+- rows returned and the API routes that issued it (`bind_route` is a
+  router-wide dependency);
+- per request (`request_queries`, set by the observability middleware):
+  statements, DB time and how often each fingerprint repeated. A route over
+  its budget (QUERY_BUDGET_DEFAULT / QUERY_BUDGET_ROUTES statements, or one
+  fingerprint more than QUERY_BUDGET_REPEATS times, the N+1 shape) is logged,
+  or fails with QUERY_BUDGET_STRICT (meant for test runs);
+- for a SELECT slower than QUERY_EXPLAIN_THRESHOLD_MS, a share
+  (QUERY_EXPLAIN_SAMPLE_RATE) is re-run with EXPLAIN (ANALYZE, BUFFERS) on a
+  separate connection, at most one plan at a time and one per fingerprint per
+  QUERY_EXPLAIN_INTERVAL_SECONDS, and the plan is kept with its statistics.
+
+Exposed (admin only) at /api/debug/queries. Numbers are per process.
+"""
+
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A route ran more statements than its budget (raised with QUERY_BUDGET_STRICT)."""
+
+
+@dataclass
+class RequestQueries:
+    """Statements executed on behalf of the current request."""
+
+    count: int = 0
+    duration_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)  # fingerprint -> executions
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.statements[fingerprint(statement)] += 1
+
+    def repeated(self, min_calls: int) -> list[tuple[str, int]]:
+        """Fingerprints executed at least ``min_calls`` times, most repeated first."""
+        return [(fp, calls) for fp, calls in self.statements.most_common() if calls >= min_calls]
+
+    def over_budget(self, route: str) -> Optional[str]:
+        """Why ``route`` exceeded its query budget, or None."""
+        budget = query_budget(route)
+        if self.count > budget:
+            return f"{route} executed {self.count} statements (budget {budget})"
+        repeated = self.repeated(settings.QUERY_BUDGET_REPEATS + 1)
+        if repeated:
+            fp, calls = repeated[0]
+            return (
+                f"{route} executed the same statement {calls} times "
+                f"(budget {settings.QUERY_BUDGET_REPEATS}): {fp[:200]}"
+            )
+        return None
+
+
+def query_budget(route: str) -> int:
+    """Statement budget for a ``"METHOD /route/template"``."""
+    return settings.QUERY_BUDGET_ROUTES.get(route, settings.QUERY_BUDGET_DEFAULT)
+
+
+# set per request by the HTTP middleware; a mutable holder so statements run
+# in copied contexts (threadpool, gathered tasks) still add to it
+request_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries", default=None
+)
+
+# execution option set on connections whose statements must not be recorded
+# (the EXPLAIN runs themselves)
+SKIP_QUERY_STATS = "skip_query_stats"
+
+
+async def bind_route(request: Request) -> None:
+    """Router dependency: label statements with the route template that issued them."""
+    route = request.scope.get("route")
+    current_route.set(
+        f"{request.method} {getattr(route, 'path', request.url.path)}"
+    )
+
+
+_NORMALIZE = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    (re.compile(r"\$\d+|%\(\w+\)s|%s|\?"), "?"),  # driver bind parameters
+    (re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b"), "?"),  # numeric literals
+    (re.compile(r"_staging_[0-9a-f]+\b"), "_staging_?"),  # staged_update tables
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),  # IN lists, VALUES rows
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...)"),  # multi-row VALUES
+    (re.compile(r"\s+"), " "),
+]
+
+_EXPLAINABLE = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE|FOR UPDATE|FOR SHARE)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    for pattern, replacement in _NORMALIZE:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def fingerprint_id(normalized: str) -> str:
+    return hashlib.md5(normalized.encode()).hexdigest()[:16]
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class StatementStats:
+    id: str
+    fingerprint: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    samples: deque = field(default_factory=lambda: deque(maxlen=settings.QUERY_STATS_SAMPLES))
+    routes: Counter = field(default_factory=Counter)
+    last_seen: Optional[datetime] = None
+    plan: Optional[Any] = None
+    plan_ms: Optional[float] = None
+    plan_captured_at: Optional[datetime] = None
+
+    def summary(self, include_plan: bool = False) -> dict:
+        ordered = sorted(self.samples)
+        data = {
+            "id": self.id,
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(_percentile(ordered, 0.50), 3),
+            "p95_ms": round(_percentile(ordered, 0.95), 3),
+            "p99_ms": round(_percentile(ordered, 0.99), 3),
+            "rows": self.rows,
+            "routes": dict(self.routes.most_common()),
+            "last_seen": self.last_seen,
+            "has_plan": self.plan is not None,
+            "plan_ms": self.plan_ms,
+            "plan_captured_at": self.plan_captured_at,
+        }
+        if include_plan:
+            data["plan"] = self.plan
+        return data
+
+
+class QueryStatsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._explaining = False
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.since = datetime.now()
+            self.statements: dict[str, StatementStats] = {}
+            self.untracked = 0  # statements dropped once the registry was full
+            self._last_explain: dict[str, float] = {}
+
+    def record(self, statement: str, duration_ms: float, rows: Optional[int]) -> Optional[str]:
+        """Account one execution; returns its fingerprint id (None if untracked)."""
+        normalized = fingerprint(statement)
+        key = fingerprint_id(normalized)
+        route = current_route.get()
+        with self._lock:
+            stats = self.statements.get(key)
+            if stats is None:
+                if len(self.statements) >= settings.QUERY_STATS_MAX_FINGERPRINTS:
+                    self.untracked += 1
+                    return None
+                stats = self.statements[key] = StatementStats(id=key, fingerprint=normalized)
+            stats.calls += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.samples.append(duration_ms)
+            if rows is not None and rows > 0:
+                stats.rows += rows
+            if route:
+                stats.routes[route] += 1
+            stats.last_seen = datetime.now()
+        return key
+
+    def should_explain(self, key: Optional[str], statement: str, duration_ms: float) -> bool:
+        """Claims the (single) EXPLAIN slot; release it with ``explain_done``."""
+        if key is None or duration_ms < settings.QUERY_EXPLAIN_THRESHOLD_MS:
+            return False
+        if not _EXPLAINABLE.match(statement) or _WRITES.search(statement):
+            return False
+        if random.random() >= settings.QUERY_EXPLAIN_SAMPLE_RATE:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if self._explaining:
+                return False
+            last = self._last_explain.get(key)
+            if last is not None and now - last < settings.QUERY_EXPLAIN_INTERVAL_SECONDS:
+                return False
+            self._explaining = True
+            self._last_explain[key] = now
+        return True
+
+    def set_plan(self, key: str, plan: Any, duration_ms: float) -> None:
+        with self._lock:
+            stats = self.statements.get(key)
+            if stats is not None:
+                stats.plan = plan
+                stats.plan_ms = duration_ms
+                stats.plan_captured_at = datetime.now()
+
+    def explain_done(self) -> None:
+        with self._lock:
+            self._explaining = False
+
+    def top(self, sort: str = "total_ms", limit: int = 50) -> list[dict]:
+        with self._lock:
+            summaries = [stats.summary() for stats in self.statements.values()]
+        summaries.sort(key=lambda s: s[sort], reverse=True)
+        return summaries[:limit]
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            stats = self.statements.get(key)
+            return stats.summary(include_plan=True) if stats else None
+
+
+query_stats = QueryStatsRegistry()
@@ -5,7 +5,6 @@ from enum import Enum
 from typing import Optional
 from pydantic import BaseModel as PydanticBaseModel
 from typing import Generic, TypeVar
-from pydantic.generics import GenericModel
 
 T = TypeVar("T")
 
@@ -42,7 +41,7 @@ class ResponseStatus(Enum):
     
 
 
-class Response(GenericModel, Generic[T]):
+class Response(PydanticBaseModel, Generic[T]):
     message: str
     success: bool
     status: ResponseStatus
@@ -1,4 +1,5 @@
 import secrets
+import time
 from datetime import datetime, timedelta
 from hashlib import md5
 from typing import Any, Optional, Union
@@ -6,24 +7,24 @@ from typing import Any, Optional, Union
 from fastapi import Depends, HTTPException,status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
-from passlib.context import CryptContext
 from sqlmodel import select
+from app.core.cache import TTLCache
 from app.core.database import async_session
 from app.core.config import settings
+from app.core.hashing import password_hasher
 from app.core.schemas import ResponseStatus
+from app.users.cache import principal_cache
 from app.users.models import User
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
 ALGORITHM = "HS256"
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await password_hasher.hash(password)
 
 
 def create_access_token(
@@ -58,11 +59,24 @@ def verify_token(access_token: str):
     
 
 
+# bearer token -> subject, kept until the token's own expiry
+_token_subjects = TTLCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+def token_subject(access_token: str) -> Optional[str]:
+    """Verified ``sub`` of a bearer token; repeated tokens skip the HMAC check."""
+    sub = _token_subjects.get(access_token)
+    if sub is None:
+        payload = jwt.decode(access_token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        sub = payload.get("sub")
+        if sub and payload.get("exp"):
+            _token_subjects.set(access_token, sub, ttl=payload["exp"] - time.time())
+    return sub
+
+
 async def authenticate(credentials : HTTPAuthorizationCredentials = Depends(HTTPBearer())):
     try:
-        payload = jwt.decode(credentials.credentials, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        employee_id: str = payload.get("sub")
-        print(employee_id)
+        employee_id: str = token_subject(credentials.credentials)
         if not employee_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -74,6 +88,10 @@ async def authenticate(credentials : HTTPAuthorizationCredentials = Depends(HTTP
                 },
             )
         
+        employee = principal_cache.get(employee_id)
+        if employee is not None:
+            return employee
+
         async with async_session() as session:
             stmt = select(User).where(User.employee_id == employee_id)
             result = await session.execute(stmt)
@@ -88,7 +106,8 @@ async def authenticate(credentials : HTTPAuthorizationCredentials = Depends(HTTP
                         "data": None,
                     },
                 )
-       
+
+        principal_cache.set(employee)
         return employee
         
         return
@@ -0,0 +1,65 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.audit.models import Audit
+from app.audit_info.models import AuditInfo, AuditTeam
+from app.core.cache import ResponseCache
+from app.edc_request.models import EdcRequest
+from app.followup.models import Followup
+from app.ncr.models import NCR, NCRFact, NCRTeam
+from app.users.models import User
+
+dashboard_cache = ResponseCache("dashboard")
+
+# Writes to any of these tables make cached dashboards stale. The auditee /
+# auditor dashboards filter on the teams; ncr_fact is also rewritten by
+# company / plant / department renames; audits are counted and user names
+# label the auditor breakdowns.
+TRACKED_MODELS = (
+    NCR,
+    NCRTeam,
+    NCRFact,
+    EdcRequest,
+    Followup,
+    Audit,
+    AuditInfo,
+    AuditTeam,
+    User,
+)
+TRACKED_TABLES = {model.__tablename__ for model in TRACKED_MODELS}
+
+_STALE_FLAG = "dashboard_cache_stale"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_stale_on_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TRACKED_MODELS):
+            session.info[_STALE_FLAG] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_stale_on_bulk_write(orm_execute_state):
+    # statement writes bypass the flush: bulk UPDATE/DELETE (the NCR Excel
+    # upload) and INSERT ... ON CONFLICT (the ncr_fact refresh)
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in TRACKED_TABLES:
+        orm_execute_state.session.info[_STALE_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop(_STALE_FLAG, False):
+        dashboard_cache.invalidate_now()
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_on_rollback(session):
+    session.info.pop(_STALE_FLAG, None)
@@ -1,26 +1,36 @@
 from sqlalchemy import (
+    and_,
     select,
     func,
     case,
     text,
+    true,
+    tuple_,
     Numeric,
     cast,
 )
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from datetime import datetime, timedelta
 
 from app.audit.models import Audit
 from app.audit_info.models import AuditInfo, AuditInfoStatus, AuditTeam, AuditTeamRole
+from app.core.database import async_session, run_concurrently
+from app.dashboard.cache import dashboard_cache
 from app.edc_request.models import EDCStatus, EdcRequest
 from app.followup.models import Followup
-from app.ncr.models import NCR, NCRStatus, NCRTeam, NCRTeamRole
-from app.settings.models import Department, Plant
+from app.ncr.models import NCR, NCRFact, NCRStatus, NCRTeam, NCRTeamRole
+from app.settings.models import Department
 from app.users.models import User
 
 
 class DashboardService:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker = async_session,
+    ):
         self.session = session
+        self.session_factory = session_factory
 
     # -------------------------------------------------
     # COMMON DATE FILTER
@@ -34,453 +44,306 @@ class DashboardService:
         return filters
 
     # -------------------------------------------------
-    # ADMIN DASHBOARD
+    # CONCURRENT FAN-OUT
     # -------------------------------------------------
-    async def get_admin_dashboard(
-        self,
-        from_date: datetime | None = None,
-        to_date: datetime | None = None,
-    ):
-
-        ncr_date_filters = self._date_filters(NCR.created_at, from_date, to_date)
+    # Dashboard sections are independent reads, so each one is run on its own
+    # short-lived session instead of one after another on ``self.session``.
+    @staticmethod
+    def _scalar(stmt):
+        async def section(session: AsyncSession):
+            return await session.scalar(stmt)
 
-        # =========================
-        # STATS
-        # =========================
+        return section
 
-        total_audits = await self.session.scalar(select(func.count(Audit.id)))
+    @staticmethod
+    def _one(stmt):
+        async def section(session: AsyncSession):
+            return (await session.execute(stmt)).one()
 
-        total_ncrs = await self.session.scalar(
-            select(func.count(NCR.id)).where(*ncr_date_filters)
-        )
+        return section
 
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id)).where(
-                NCR.status != NCRStatus.CLOSED, *ncr_date_filters
-            )
-        )
+    @staticmethod
+    def _all(stmt):
+        async def section(session: AsyncSession):
+            return (await session.execute(stmt)).all()
 
-        closed_ncrs = await self.session.scalar(
-            select(func.count(NCR.id)).where(
-                NCR.status == NCRStatus.CLOSED, *ncr_date_filters
-            )
-        )
+        return section
 
-        overdue_ncrs = await self.session.scalar(
-            select(func.count(NCR.id)).where(
-                NCR.edc_given_date < func.now(),
-                NCR.status != NCRStatus.CLOSED,
-                *ncr_date_filters,
-            )
-        )
+    async def _fan_out(self, *sections):
+        return await run_concurrently(sections, session_factory=self.session_factory)
 
-        raw_edc_compliance = await self.session.scalar(
-            select(
-                (
-                    func.count(NCR.id).filter(
-                        NCR.actual_date_of_completion <= NCR.edc_given_date
-                    )
-                    * 100.0
-                    / func.nullif(func.count(NCR.id), 0)
-                )
-            ).where(NCR.status == NCRStatus.CLOSED, *ncr_date_filters)
-        )
+    # -------------------------------------------------
+    # ADMIN DASHBOARD
+    # -------------------------------------------------
+    @dashboard_cache.cached
+    async def get_admin_dashboard(
+        self,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ):
 
-        edc_compliance_pct = round(raw_edc_compliance or 0, 2)
+        ncr_date_filters = self._date_filters(NCRFact.created_at, from_date, to_date)
 
-        raw_avg_days = await self.session.scalar(
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        NCR.actual_date_of_completion - NCR.created_at,
-                    )
-                    / 86400
-                )
-            ).where(NCR.status == NCRStatus.CLOSED, *ncr_date_filters)
-        )
+        in_range = and_(*ncr_date_filters) if ncr_date_filters else true()
+        is_closed = NCRFact.status == NCRStatus.CLOSED
+        is_open = NCRFact.status != NCRStatus.CLOSED
+        is_overdue = and_(NCRFact.edc_given_date < func.now(), is_open)
+        closure_days = NCRFact.closure_days
 
-        avg_closure_days = round(raw_avg_days or 0, 2)
-
-        raw_rejection_rate = await self.session.scalar(
-            select(
-                func.sum(NCR.rejected_count)
-                * 100.0
-                / func.nullif(func.count(NCR.id), 0)
-            ).where(*ncr_date_filters)
-        )
+        today = datetime.utcnow()
+        start_current = today.replace(day=1)
+        start_prev = (start_current - timedelta(days=1)).replace(day=1)
 
-        rejection_rate_pct = round(raw_rejection_rate or 0, 2)
+        # =========================
+        # STATS (single pass over ncr_fact)
+        # =========================
 
-        edc_extension_requests = await self.session.scalar(
-            select(func.count(EdcRequest.id)).where(
-                EdcRequest.status == EDCStatus.PENDING
-            )
+        stats_stmt = select(
+            select(func.count(Audit.id)).scalar_subquery(),
+            select(func.count(EdcRequest.id))
+            .where(EdcRequest.status == EDCStatus.PENDING)
+            .scalar_subquery(),
+            func.count(NCRFact.ncr_id),
+            func.count(NCRFact.ncr_id).filter(in_range),
+            func.count(NCRFact.ncr_id).filter(in_range, is_open),
+            func.count(NCRFact.ncr_id).filter(in_range, is_closed),
+            func.count(NCRFact.ncr_id).filter(in_range, is_overdue),
+            func.count(NCRFact.ncr_id).filter(
+                in_range,
+                is_closed,
+                NCRFact.actual_date_of_completion <= NCRFact.edc_given_date,
+            ),
+            func.avg(closure_days).filter(in_range, is_closed),
+            func.sum(NCRFact.rejected_count).filter(in_range),
+            func.count(NCRFact.ncr_id).filter(in_range, NCRFact.rejected_count > 0),
+            func.count(NCRFact.ncr_id).filter(in_range, is_closed, closure_days <= 7),
+            func.count(NCRFact.ncr_id).filter(in_range, is_closed, closure_days <= 15),
+            func.count(NCRFact.ncr_id).filter(in_range, is_closed, closure_days > 15),
+            func.count(NCRFact.ncr_id).filter(
+                NCRFact.created_at.between(start_prev, start_current)
+            ),
+            func.count(NCRFact.ncr_id).filter(NCRFact.created_at >= start_current),
+            func.count(NCRFact.ncr_id).filter(
+                is_closed,
+                NCRFact.created_at.between(start_prev, start_current),
+            ),
+            func.count(NCRFact.ncr_id).filter(
+                is_closed,
+                NCRFact.created_at >= start_current,
+            ),
         )
 
         # =========================
-        # OVERVIEW GRAPHS
+        # BREAKDOWNS (grouping sets over one CTE)
         # =========================
 
-        status_dist = (
-            await self.session.execute(
-                select(NCR.status, func.count(NCR.id))
-                .where(*ncr_date_filters)
-                .group_by(NCR.status)
-            )
-        ).all()
-
-        month_expr = func.to_char(
-            func.date_trunc("month", NCR.created_at), "YYYY-MM"
-        ).label("month")
-
-        monthly_trend = (
-            await self.session.execute(
-                select(
-                    month_expr,
-                    func.count(NCR.id),
-                    func.count(NCR.id).filter(NCR.status == NCRStatus.CLOSED),
-                )
-                .where(*ncr_date_filters)
-                .group_by(month_expr)
-                .order_by(month_expr)
-            )
-        ).all()
-
-        date_expr = func.to_char(NCR.edc_given_date, "YYYY-MM-DD").label("date")
-
-        overdue_trend = (
-            await self.session.execute(
-                select(
-                    date_expr,
-                    func.count(NCR.id),
-                )
-                .where(
-                    NCR.edc_given_date < func.now(),
-                    NCR.status != NCRStatus.CLOSED,
-                    *ncr_date_filters,
-                )
-                .group_by(date_expr)
-                .order_by(date_expr)
-            )
-        ).all()
-
-        plant_wise = (
-            await self.session.execute(
-                select(
-                    Plant.name,
-                    func.count(NCR.id),
-                )
-                .join(AuditInfo, AuditInfo.id == NCR.audit_info_id)
-                .join(Audit, Audit.id == AuditInfo.audit_id)
-                .join(Plant, Plant.id == Audit.plant_id)
-                .where(*ncr_date_filters)
-                .group_by(Plant.name)
-            )
-        ).all()
-
-        dept_wise = (
-            await self.session.execute(
-                select(
-                    Department.name,
-                    func.count(NCR.id),
-                )
-                .join(AuditInfo, AuditInfo.id == NCR.audit_info_id)
-                .join(Department, Department.id == AuditInfo.department_id)
-                .where(*ncr_date_filters)
-                .group_by(Department.name)
-            )
-        ).all()
+        facts = (
+            select(
+                NCRFact.ncr_id.label("id"),
+                NCRFact.status,
+                func.to_char(func.date_trunc("month", NCRFact.created_at), "YYYY-MM").label(
+                    "month"
+                ),
+                func.to_char(NCRFact.edc_given_date, "YYYY-MM-DD").label("edc_date"),
+                case(
+                    (func.now() - NCRFact.created_at <= text("interval '7 days'"), "0-7"),
+                    (func.now() - NCRFact.created_at <= text("interval '15 days'"), "8-15"),
+                    (func.now() - NCRFact.created_at <= text("interval '30 days'"), "16-30"),
+                    else_="30+",
+                ).label("aging_bucket"),
+                NCRFact.root_cause,
+                NCRFact.rejected_reson,
+                NCRFact.main_clause,
+                NCRFact.plant_name.label("plant"),
+                NCRFact.department_name.label("department"),
+                NCRFact.audit_type,
+                is_closed.label("is_closed"),
+                is_overdue.label("is_overdue"),
+                closure_days.label("closure_days"),
+            )
+            .where(*ncr_date_filters)
+            .cte("admin_ncr_facts")
+        )
 
-        aging = (
-            await self.session.execute(
-                select(
-                    case(
-                        (
-                            func.now() - NCR.created_at <= text("interval '7 days'"),
-                            "0-7",
-                        ),
-                        (
-                            func.now() - NCR.created_at <= text("interval '15 days'"),
-                            "8-15",
-                        ),
-                        (
-                            func.now() - NCR.created_at <= text("interval '30 days'"),
-                            "16-30",
-                        ),
-                        else_="30+",
-                    ).label("bucket"),
-                    func.count(NCR.id),
-                )
-                .where(NCR.status != NCRStatus.CLOSED, *ncr_date_filters)
-                .group_by("bucket")
-            )
-        ).all()
+        dimensions = [
+            facts.c.status,
+            facts.c.month,
+            facts.c.edc_date,
+            facts.c.aging_bucket,
+            facts.c.root_cause,
+            facts.c.rejected_reson,
+            facts.c.main_clause,
+            facts.c.plant,
+            facts.c.department,
+            facts.c.audit_type,
+        ]
 
-        root_cause = (
-            await self.session.execute(
-                select(NCR.root_cause, func.count(NCR.id))
-                .where(NCR.root_cause.isnot(None), *ncr_date_filters)
-                .group_by(NCR.root_cause)
-            )
-        ).all()
+        breakdown_stmt = select(
+            func.grouping(*dimensions),
+            *dimensions,
+            func.count(facts.c.id),
+            func.count(facts.c.id).filter(facts.c.is_closed),
+            func.count(facts.c.id).filter(~facts.c.is_closed),
+            func.count(facts.c.id).filter(facts.c.is_overdue),
+            func.avg(facts.c.closure_days),
+        ).group_by(func.grouping_sets(*[tuple_(d) for d in dimensions]))
 
         # =========================
-        # EXTRA ADMIN GRAPHS
+        # NON-NCR GRAPHS
         # =========================
 
-        audit_type_ncrs = (
-            await self.session.execute(
-                select(
-                    Audit.type,
-                    func.count(NCR.id),
-                )
-                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-                .join(NCR, NCR.audit_info_id == AuditInfo.id)
-                .where(*ncr_date_filters)
-                .group_by(Audit.type)
-            )
-        ).all()
-
-        auditor_workload = (
-            await self.session.execute(
-                select(
-                    User.name,
-                    func.count(Followup.id),
-                    func.count(Followup.id).filter(Followup.completed_on.isnot(None)),
-                )
-                .join(Followup, Followup.auditor_id == User.id)
-                .group_by(User.name)
-            )
-        ).all()
-
-        auditee_compliance = (
-            await self.session.execute(
-                select(
-                    Department.name,
-                    (
-                        func.count(NCR.id).filter(NCR.status == NCRStatus.CLOSED)
-                        * 100.0
-                        / func.nullif(func.count(NCR.id), 0)
-                    ),
-                    (
-                        func.count(NCR.id).filter(
-                            NCR.edc_given_date < func.now(),
-                            NCR.status != NCRStatus.CLOSED,
-                        )
-                        * 100.0
-                        / func.nullif(func.count(NCR.id), 0)
-                    ),
-                )
-                .join(AuditInfo, AuditInfo.department_id == Department.id)
-                .join(NCR, NCR.audit_info_id == AuditInfo.id)
-                .where(*ncr_date_filters)
-                .group_by(Department.name)
+        auditor_workload_stmt = (
+            select(
+                User.name,
+                func.count(Followup.id),
+                func.count(Followup.id).filter(Followup.completed_on.isnot(None)),
             )
-        ).all()
+            .join(Followup, Followup.auditor_id == User.id)
+            .group_by(User.name)
+        )
 
-        followup_cycles = (
-            await self.session.execute(
-                select(
-                    func.count(Followup.id),
-                    func.count(NCR.id),
-                )
-                .join(NCR, NCR.id == Followup.ncr_id)
-                .group_by(Followup.ncr_id)
+        followup_cycles_stmt = (
+            select(
+                func.count(Followup.id),
+                func.count(NCR.id),
             )
-        ).all()
+            .join(NCR, NCR.id == Followup.ncr_id)
+            .group_by(Followup.ncr_id)
+        )
 
         edc_month_expr = func.to_char(
             func.date_trunc("month", EdcRequest.created_at), "YYYY-MM"
         ).label("month")
 
-        edc_trend = (
-            await self.session.execute(
-                select(
-                    edc_month_expr,
-                    func.count(EdcRequest.id),
-                )
-                .group_by(edc_month_expr)
-                .order_by(edc_month_expr)
-            )
-        ).all()
-
-        rejection_reasons = (
-            await self.session.execute(
-                select(NCR.rejected_reson, func.count(NCR.id).label("count"))
-                .where(NCR.rejected_reson.isnot(None), *ncr_date_filters)
-                .group_by(NCR.rejected_reson)
+        edc_trend_stmt = (
+            select(
+                edc_month_expr,
+                func.count(EdcRequest.id),
             )
-        ).all()
-
-        audit_count = await self.session.scalar(
-    select(func.count(Audit.id))
-)
-
-        ncr_count = await self.session.scalar(
-            select(func.count(NCR.id))
+            .group_by(edc_month_expr)
+            .order_by(edc_month_expr)
         )
 
-        audit_vs_ncr_ratio = (
-            audit_count or 0,
-            ncr_count or 0,
+        (
+            stats,
+            breakdown_rows,
+            auditor_workload,
+            followup_cycles,
+            edc_trend,
+        ) = await self._fan_out(
+            self._one(stats_stmt),
+            self._all(breakdown_stmt),
+            self._all(auditor_workload_stmt),
+            self._all(followup_cycles_stmt),
+            self._all(edc_trend_stmt),
         )
-   
-
-        sla_buckets = (
-            await self.session.execute(
-                select(
-                    func.count(NCR.id).filter(
-                        func.extract(
-                            "epoch",
-                            NCR.actual_date_of_completion - NCR.created_at,
-                        )
-                        / 86400
-                        <= 7
-                    ),
-                    func.count(NCR.id).filter(
-                        func.extract(
-                            "epoch",
-                            NCR.actual_date_of_completion - NCR.created_at,
-                        )
-                        / 86400
-                        <= 15
-                    ),
-                    func.count(NCR.id).filter(
-                        func.extract(
-                            "epoch",
-                            NCR.actual_date_of_completion - NCR.created_at,
-                        )
-                        / 86400
-                        > 15
-                    ),
-                ).where(NCR.status == NCRStatus.CLOSED, *ncr_date_filters)
-            )
-        ).one()
 
-        repeat_ncrs = (
-            await self.session.execute(
-                select(
-                    NCR.main_clause,
-                    func.count(NCR.id),
-                )
-                .where(*ncr_date_filters)
-                .group_by(NCR.main_clause)
-                .having(func.count(NCR.id) > 1)
-            )
-        ).all()
-
-        # =========================
-        # COMPARISON (MONTH VS LAST)
-        # =========================
+        (
+            total_audits,
+            edc_extension_requests,
+            ncr_count,
+            total_ncrs,
+            open_ncrs,
+            closed_ncrs,
+            overdue_ncrs,
+            closed_on_time,
+            raw_avg_days,
+            rejected_sum,
+            rejected_ncrs,
+            sla_7,
+            sla_15,
+            sla_15_plus,
+            prev_r,
+            curr_r,
+            prev_c,
+            curr_c,
+        ) = stats
+
+        edc_compliance_pct = (
+            round(closed_on_time * 100.0 / closed_ncrs, 2) if closed_ncrs else 0
+        )
+        avg_closure_days = round(raw_avg_days or 0, 2)
+        rejection_rate_pct = (
+            round((rejected_sum or 0) * 100.0 / total_ncrs, 2) if total_ncrs else 0
+        )
 
-        today = datetime.utcnow()
-        start_current = today.replace(day=1)
-        start_prev = (start_current - timedelta(days=1)).replace(day=1)
+        # GROUPING() sets a bit for every dimension that is *not* part of the
+        # current grouping set; the leftmost argument is the most significant bit.
+        all_bits = (1 << len(dimensions)) - 1
+        breakdowns: dict[str, list] = {d.name: [] for d in dimensions}
+        for row in breakdown_rows:
+            grouping_id, values, aggregates = (
+                row[0],
+                row[1 : len(dimensions) + 1],
+                row[len(dimensions) + 1 :],
+            )
+            for i, dimension in enumerate(dimensions):
+                if grouping_id == all_bits ^ (1 << (len(dimensions) - 1 - i)):
+                    breakdowns[dimension.name].append((values[i], *aggregates))
+                    break
+
+        def pct(part, whole):
+            return round(part * 100.0 / whole, 2) if whole else 0
+
+        status_dist = [(s, total) for s, total, *_ in breakdowns["status"]]
+        monthly_trend = sorted(
+            (m, total, closed) for m, total, closed, *_ in breakdowns["month"]
+        )
+        overdue_trend = sorted(
+            (d, overdue)
+            for d, _total, _closed, _open, overdue, _avg in breakdowns["edc_date"]
+            if overdue
+        )
+        aging = [
+            (b, open_)
+            for b, _total, _closed, open_, *_ in breakdowns["aging_bucket"]
+            if open_
+        ]
+        root_cause = [
+            (r, total)
+            for r, total, *_ in breakdowns["root_cause"]
+            if r is not None
+        ]
+        rejection_reasons = [
+            (r, total)
+            for r, total, *_ in breakdowns["rejected_reson"]
+            if r is not None
+        ]
+        repeat_ncrs = [
+            (c, total) for c, total, *_ in breakdowns["main_clause"] if total > 1
+        ]
+        plant_wise = [(p, total) for p, total, *_ in breakdowns["plant"]]
+        dept_wise = [(d, total) for d, total, *_ in breakdowns["department"]]
+        audit_type_ncrs = [(t, total) for t, total, *_ in breakdowns["audit_type"]]
 
-        prev_r, curr_r, prev_c, curr_c = (
-            await self.session.execute(
-                select(
-                    func.count(NCR.id).filter(
-                        NCR.created_at.between(start_prev, start_current)
-                    ),
-                    func.count(NCR.id).filter(NCR.created_at >= start_current),
-                    func.count(NCR.id).filter(
-                        NCR.status == NCRStatus.CLOSED,
-                        NCR.created_at.between(start_prev, start_current),
-                    ),
-                    func.count(NCR.id).filter(
-                        NCR.status == NCRStatus.CLOSED,
-                        NCR.created_at >= start_current,
-                    ),
-                )
-            )
-        ).one()
-        plant_comparison_rows = (
-            await self.session.execute(
-                select(
-                    Plant.name,
-                    (
-                        func.count(NCR.id).filter(
-                            NCR.edc_given_date < func.now(),
-                            NCR.status != NCRStatus.CLOSED,
-                        )
-                        * 100.0
-                        / func.nullif(func.count(NCR.id), 0)
-                    ),
-                    func.avg(
-                        func.extract(
-                            "epoch",
-                            NCR.actual_date_of_completion - NCR.created_at,
-                        )
-                        / 86400
-                    ),
-                )
-                .join(AuditInfo, AuditInfo.id == NCR.audit_info_id)
-                .join(Audit, Audit.id == AuditInfo.audit_id)
-                .join(Plant, Plant.id == Audit.plant_id)
-                .where(*ncr_date_filters)
-                .group_by(Plant.name)
-            )
-        ).all()
+        auditee_compliance = [
+            (d, pct(closed, total), pct(overdue, total))
+            for d, total, closed, _open, overdue, _avg in breakdowns["department"]
+        ]
 
         plant_comparison = [
             {
                 "plant": name,
-                "overdue_pct": round(overdue or 0, 2),
+                "overdue_pct": pct(overdue, total),
                 "avg_closure_days": round(avg_days or 0, 2),
             }
-            for name, overdue, avg_days in plant_comparison_rows
+            for name, total, _closed, _open, overdue, avg_days in breakdowns["plant"]
         ]
-        department_comparison_rows = (
-            await self.session.execute(
-                select(
-                    Department.name,
-                    (
-                        func.count(NCR.id).filter(
-                            NCR.edc_given_date < func.now(),
-                            NCR.status != NCRStatus.CLOSED,
-                        )
-                        * 100.0
-                        / func.nullif(func.count(NCR.id), 0)
-                    ),
-                    func.avg(
-                        func.extract(
-                            "epoch",
-                            NCR.actual_date_of_completion - NCR.created_at,
-                        )
-                        / 86400
-                    ),
-                )
-                .join(AuditInfo, AuditInfo.id == NCR.audit_info_id)
-                .join(Audit, Audit.id == AuditInfo.audit_id)
-                .join(Department, Department.id == AuditInfo.department_id)
-                .where(*ncr_date_filters)
-                .group_by(Department.name)
-            )
-        ).all()
 
         department_comparison = [
             {
                 "department": name,
-                "overdue_pct": round(overdue or 0, 2),
+                "overdue_pct": pct(overdue, total),
                 "avg_closure_days": round(avg_days or 0, 2),
             }
-            for name, overdue, avg_days in department_comparison_rows
+            for name, total, _closed, _open, overdue, avg_days in breakdowns[
+                "department"
+            ]
         ]
 
-        before_after = (
-            await self.session.execute(
-                select(
-                    func.count(NCR.id).filter(NCR.rejected_count > 0),
-                    func.count(NCR.id).filter(NCR.status == NCRStatus.CLOSED),
-                ).where(*ncr_date_filters)
-            )
-        ).one()
-
         before_after_corrective_action = {
-            "before": before_after[0] or 0,
-            "after": before_after[1] or 0,
+            "before": rejected_ncrs or 0,
+            "after": closed_ncrs or 0,
         }
 
         TARGET_DAYS = 10
@@ -532,8 +395,8 @@ class DashboardService:
                 "auditee_compliance": [
                     {
                         "auditee": n,
-                        "closure_rate": round(cr or 0, 2),
-                        "overdue_pct": round(op or 0, 2),
+                        "closure_rate": cr,
+                        "overdue_pct": op,
                     }
                     for n, cr, op in auditee_compliance
                 ],
@@ -545,13 +408,13 @@ class DashboardService:
                     {"label": r or "Unknown", "value": c} for r, c in rejection_reasons
                 ],
                 "audit_vs_ncr_ratio": [
-                    {"label": "Audits", "value": audit_vs_ncr_ratio[0]},
-                    {"label": "NCRs", "value": audit_vs_ncr_ratio[1]},
+                    {"label": "Audits", "value": total_audits or 0},
+                    {"label": "NCRs", "value": ncr_count or 0},
                 ],
                 "sla_buckets": [
-                    {"label": "0-7 Days", "value": sla_buckets[0]},
-                    {"label": "8-15 Days", "value": sla_buckets[1]},
-                    {"label": "15+ Days", "value": sla_buckets[2]},
+                    {"label": "0-7 Days", "value": sla_7},
+                    {"label": "8-15 Days", "value": sla_15},
+                    {"label": "15+ Days", "value": sla_15_plus},
                 ],
                 "repeat_ncrs": [{"label": c, "value": n} for c, n in repeat_ncrs],
             },
@@ -574,185 +437,141 @@ class DashboardService:
         }
 
 
+    @dashboard_cache.cached
     async def get_hod_dashboard(
         self,
         plant_id: str,
         from_date: datetime | None = None,
         to_date: datetime | None = None,
     ):
-        df = self._date_filters(NCR.created_at, from_date, to_date)
-
-        # ---------------- KPIs ----------------
-
-        total_audits = await self.session.scalar(
-            select(func.count(Audit.id)).where(Audit.plant_id == plant_id)
-        )
-
-        audits_completed = await self.session.scalar(
-            select(func.count(Audit.id))
-            .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .where(Audit.plant_id == plant_id, AuditInfo.status == AuditInfoStatus.CLOSED)
-        )
-
-        audits_in_progress = await self.session.scalar(
-            select(func.count(Audit.id))
-             .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .where(Audit.plant_id == plant_id, AuditInfo.status == AuditInfoStatus.OPEN)
-        )
-
-        total_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(Audit.plant_id == plant_id, *df)
-        )
-
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(
-                Audit.plant_id == plant_id,
-                NCR.status != NCRStatus.CLOSED,
-                *df
-            )
-        )
-
-        overdue_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(
-                Audit.plant_id == plant_id,
-                NCR.edc_given_date < func.now(),
-                NCR.status != NCRStatus.CLOSED,
-                *df
-            )
-        )
-
-        rejected_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(
-                Audit.plant_id == plant_id,
-                NCR.rejected_count > 0,
-                *df
-            )
-        )
-
-        avg_closure_days = await self.session.scalar(
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        NCR.actual_date_of_completion - NCR.created_at
-                    ) / 86400
-                )
-            )
-            .join(AuditInfo).join(Audit)
-            .where(
-                Audit.plant_id == plant_id,
-                NCR.status == NCRStatus.CLOSED,
-                *df
-            )
-        )
-
-        # ---------------- Charts ----------------
-
-        audit_status = await self.session.execute(
-            select(AuditInfo.status, func.count(Audit.id))
-            .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .where(Audit.plant_id == plant_id)
-            .group_by(AuditInfo.status)
-        )
-
-        dept_audit_coverage = await self.session.execute(
-            select(Department.name, func.count(Audit.id))
-            .join(AuditInfo, AuditInfo.department_id == Department.id)
-            .join(Audit, Audit.id == AuditInfo.audit_id)
-            .where(Audit.plant_id == plant_id)
-            .group_by(Department.name)
-        )
-
-        dept_ncr = await self.session.execute(
-            select(Department.name, func.count(NCR.id))
-            .join(AuditInfo, AuditInfo.department_id == Department.id)
-            .join(NCR, NCR.audit_info_id == AuditInfo.id)
-            .join(Audit, Audit.id == AuditInfo.audit_id)
-            .where(Audit.plant_id == plant_id, *df)
-            .group_by(Department.name)
-        )
-
-        ncr_status = await self.session.execute(
-            select(NCR.status, func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(Audit.plant_id == plant_id, *df)
-            .group_by(NCR.status)
-        )
-
-        aging = await self.session.execute(
-            select(
-                case(
-                    (func.now() - NCR.created_at <= text("interval '7 days'"), "0-7"),
-                    (func.now() - NCR.created_at <= text("interval '15 days'"), "8-15"),
-                    (func.now() - NCR.created_at <= text("interval '30 days'"), "16-30"),
-                    else_="30+"
-                ),
-                func.count(NCR.id)
-            )
-            .join(AuditInfo).join(Audit)
-            .where(
-                Audit.plant_id == plant_id,
-                NCR.status != NCRStatus.CLOSED,
-                *df
-            )
-            .group_by(text("1"))
-        )
-
-        edc_status = await self.session.execute(
-            select(EdcRequest.status, func.count(EdcRequest.id))
-            .join(NCR).join(AuditInfo).join(Audit)
-            .where(Audit.plant_id == plant_id)
-            .group_by(EdcRequest.status)
-        )
-
-        followup_effectiveness = await self.session.execute(
-            select(
-                case(
-                    (NCR.status == NCRStatus.CLOSED, "Closed"),
-                    else_="Rejected"
-                ),
-                func.count(Followup.id)
-            )
-            .join(NCR).join(AuditInfo).join(Audit)
-            .where(Audit.plant_id == plant_id)
-            .group_by(text("1"))
-        )
-
-        auditor_workload = await self.session.execute(
-            select(
-                User.name,
-                func.count(func.distinct(Audit.id)),
-                func.count(NCR.id)
-            )
-            .join(AuditTeam, AuditTeam.user_id == User.id)
-            .join(AuditInfo, AuditInfo.id == AuditTeam.audit_info_id)
-            .join(Audit, Audit.id == AuditInfo.audit_id)
-            .outerjoin(NCR, NCR.audit_info_id == AuditInfo.id)
-            .where(Audit.plant_id == plant_id)
-            .group_by(User.name)
-        )
-
-        clause_wise = await self.session.execute(
-            select(NCR.main_clause, func.count(NCR.id))
-            .join(AuditInfo).join(Audit)
-            .where(Audit.plant_id == plant_id)
-            .group_by(NCR.main_clause)
+        df = self._date_filters(NCRFact.created_at, from_date, to_date)
+        fact_is_open = NCRFact.status != NCRStatus.CLOSED
+
+        (
+            # ---------------- KPIs ----------------
+            total_audits,
+            audits_completed,
+            audits_in_progress,
+            ncr_kpis,
+            # ---------------- Charts ----------------
+            audit_status,
+            dept_audit_coverage,
+            dept_ncr,
+            ncr_status,
+            aging,
+            edc_status,
+            followup_effectiveness,
+            auditor_workload,
+            clause_wise,
+            audit_delay,
+        ) = await self._fan_out(
+            self._scalar(
+                select(func.count(Audit.id)).where(Audit.plant_id == plant_id)
+            ),
+            self._scalar(
+                select(func.count(Audit.id))
+                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
+                .where(Audit.plant_id == plant_id, AuditInfo.status == AuditInfoStatus.CLOSED)
+            ),
+            self._scalar(
+                select(func.count(Audit.id))
+                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
+                .where(Audit.plant_id == plant_id, AuditInfo.status == AuditInfoStatus.OPEN)
+            ),
+            self._one(
+                select(
+                    func.count(NCRFact.ncr_id),
+                    func.count(NCRFact.ncr_id).filter(fact_is_open),
+                    func.count(NCRFact.ncr_id).filter(
+                        NCRFact.edc_given_date < func.now(), fact_is_open
+                    ),
+                    func.count(NCRFact.ncr_id).filter(NCRFact.rejected_count > 0),
+                    func.avg(NCRFact.closure_days).filter(
+                        NCRFact.status == NCRStatus.CLOSED
+                    ),
+                ).where(NCRFact.plant_id == plant_id, *df)
+            ),
+            self._all(
+                select(AuditInfo.status, func.count(Audit.id))
+                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
+                .where(Audit.plant_id == plant_id)
+                .group_by(AuditInfo.status)
+            ),
+            self._all(
+                select(Department.name, func.count(Audit.id))
+                .join(AuditInfo, AuditInfo.department_id == Department.id)
+                .join(Audit, Audit.id == AuditInfo.audit_id)
+                .where(Audit.plant_id == plant_id)
+                .group_by(Department.name)
+            ),
+            self._all(
+                select(NCRFact.department_name, func.count(NCRFact.ncr_id))
+                .where(NCRFact.plant_id == plant_id, *df)
+                .group_by(NCRFact.department_name)
+            ),
+            self._all(
+                select(NCRFact.status, func.count(NCRFact.ncr_id))
+                .where(NCRFact.plant_id == plant_id, *df)
+                .group_by(NCRFact.status)
+            ),
+            self._all(
+                select(
+                    case(
+                        (func.now() - NCRFact.created_at <= text("interval '7 days'"), "0-7"),
+                        (func.now() - NCRFact.created_at <= text("interval '15 days'"), "8-15"),
+                        (func.now() - NCRFact.created_at <= text("interval '30 days'"), "16-30"),
+                        else_="30+"
+                    ),
+                    func.count(NCRFact.ncr_id)
+                )
+                .where(NCRFact.plant_id == plant_id, fact_is_open, *df)
+                .group_by(text("1"))
+            ),
+            self._all(
+                select(EdcRequest.status, func.count(EdcRequest.id))
+                .join(NCR).join(AuditInfo).join(Audit)
+                .where(Audit.plant_id == plant_id)
+                .group_by(EdcRequest.status)
+            ),
+            self._all(
+                select(
+                    case(
+                        (NCR.status == NCRStatus.CLOSED, "Closed"),
+                        else_="Rejected"
+                    ),
+                    func.count(Followup.id)
+                )
+                .join(NCR).join(AuditInfo).join(Audit)
+                .where(Audit.plant_id == plant_id)
+                .group_by(text("1"))
+            ),
+            self._all(
+                select(
+                    User.name,
+                    func.count(func.distinct(Audit.id)),
+                    func.count(NCR.id)
+                )
+                .join(AuditTeam, AuditTeam.user_id == User.id)
+                .join(AuditInfo, AuditInfo.id == AuditTeam.audit_info_id)
+                .join(Audit, Audit.id == AuditInfo.audit_id)
+                .outerjoin(NCR, NCR.audit_info_id == AuditInfo.id)
+                .where(Audit.plant_id == plant_id)
+                .group_by(User.name)
+            ),
+            self._all(
+                select(NCRFact.main_clause, func.count(NCRFact.ncr_id))
+                .where(NCRFact.plant_id == plant_id)
+                .group_by(NCRFact.main_clause)
+            ),
+            self._all(
+                select(Audit.end_date, NCR.actual_date_of_completion)
+                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
+                .join(NCR, NCR.audit_info_id == AuditInfo.id)
+                .where(Audit.plant_id == plant_id, NCR.status == NCRStatus.CLOSED)
+            ),
         )
 
-        audit_delay = await self.session.execute(
-            select(Audit.end_date, NCR.actual_date_of_completion)
-            .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .join(NCR, NCR.audit_info_id == AuditInfo.id)
-            .where(Audit.plant_id == plant_id, NCR.status == NCRStatus.CLOSED)
-        )
+        total_ncrs, open_ncrs, overdue_ncrs, rejected_ncrs, avg_closure_days = ncr_kpis
 
         # ---------------- RETURN ----------------
 
@@ -829,6 +648,7 @@ class DashboardService:
 
 
 
+    @dashboard_cache.cached
     async def get_auditee_dashboard(
         self,
         auditee_id: str,
@@ -851,60 +671,63 @@ class DashboardService:
             .subquery()
         )
 
-        # ==================================================
-        # KPIs
-        # ==================================================
-
-        total_ncrs = await self.session.scalar(
-            select(func.count(auditee_ncr_ids.c.id))
-        )
-
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.id.in_(select(auditee_ncr_ids.c.id)),
-                NCR.status != NCRStatus.CLOSED,
-            )
-        )
-
-        overdue_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.id.in_(select(auditee_ncr_ids.c.id)),
-                NCR.edc_given_date < func.now(),
-                NCR.status != NCRStatus.CLOSED,
-            )
-        )
-
-        rejected_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.id.in_(select(auditee_ncr_ids.c.id)),
-                NCR.rejected_count > 0,
-            )
-        )
-
-        avg_closure_days = await self.session.scalar(
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        NCR.actual_date_of_completion - NCR.created_at,
-                    ) / 86400
+        (
+            # ==================================================
+            # KPIs
+            # ==================================================
+            total_ncrs,
+            open_ncrs,
+            overdue_ncrs,
+            rejected_ncrs,
+            avg_closure_days,
+            # ==================================================
+            # CHARTS
+            # ==================================================
+            lifecycle,
+            corrective_delay,
+            root_causes,
+            edc_status,
+            rejection_reasons,
+            clause_wise,
+        ) = await self._fan_out(
+            self._scalar(select(func.count(auditee_ncr_ids.c.id))),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.id.in_(select(auditee_ncr_ids.c.id)),
+                    NCR.status != NCRStatus.CLOSED,
                 )
-            )
-            .where(
-                NCR.id.in_(select(auditee_ncr_ids.c.id)),
-                NCR.status == NCRStatus.CLOSED,
-            )
-        )
-
-        # ==================================================
-        # CHARTS
-        # ==================================================
-
-        lifecycle = (
-            await self.session.execute(
+            ),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.id.in_(select(auditee_ncr_ids.c.id)),
+                    NCR.edc_given_date < func.now(),
+                    NCR.status != NCRStatus.CLOSED,
+                )
+            ),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.id.in_(select(auditee_ncr_ids.c.id)),
+                    NCR.rejected_count > 0,
+                )
+            ),
+            self._scalar(
+                select(
+                    func.avg(
+                        func.extract(
+                            "epoch",
+                            NCR.actual_date_of_completion - NCR.created_at,
+                        ) / 86400
+                    )
+                )
+                .where(
+                    NCR.id.in_(select(auditee_ncr_ids.c.id)),
+                    NCR.status == NCRStatus.CLOSED,
+                )
+            ),
+            self._one(
                 select(
                     func.count(NCR.id),
                     func.count(NCR.id).filter(NCR.root_cause.isnot(None)),
@@ -915,11 +738,8 @@ class DashboardService:
                 )
                 .outerjoin(Followup, Followup.ncr_id == NCR.id)
                 .where(NCR.id.in_(select(auditee_ncr_ids.c.id)))
-            )
-        ).one()
-
-        corrective_delay = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(
                     case(
                         (NCR.actual_date_of_completion <= NCR.followup_date, "On Time"),
@@ -929,47 +749,35 @@ class DashboardService:
                 )
                 .where(NCR.id.in_(select(auditee_ncr_ids.c.id)))
                 .group_by(text("1"))
-            )
-        ).all()
-
-        root_causes = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.root_cause, func.count(NCR.id))
                 .where(
                     NCR.id.in_(select(auditee_ncr_ids.c.id)),
                     NCR.root_cause.isnot(None),
                 )
                 .group_by(NCR.root_cause)
-            )
-        ).all()
-
-        edc_status = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(EdcRequest.status, func.count(EdcRequest.id))
                 .join(NCR)
                 .where(NCR.id.in_(select(auditee_ncr_ids.c.id)))
                 .group_by(EdcRequest.status)
-            )
-        ).all()
-
-        rejection_reasons = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.rejected_reson, func.count(NCR.id))
                 .where(
                     NCR.id.in_(select(auditee_ncr_ids.c.id)),
                     NCR.rejected_reson.isnot(None),
                 )
                 .group_by(NCR.rejected_reson)
-            )
-        ).all()
-
-        clause_wise = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.main_clause, func.count(NCR.id))
                 .where(NCR.id.in_(select(auditee_ncr_ids.c.id)))
                 .group_by(NCR.main_clause)
-            )
-        ).all()
+            ),
+        )
 
         # ==================================================
         # RETURN
@@ -1018,6 +826,7 @@ class DashboardService:
 
 
 
+    @dashboard_cache.cached
     async def get_auditor_dashboard(
         self,
         auditor_id: str,
@@ -1035,7 +844,7 @@ class DashboardService:
             select(Audit.id)
             .join(AuditInfo, AuditInfo.audit_id == Audit.id)
             .join(AuditTeam, AuditTeam.audit_info_id == AuditInfo.id)
-            
+
             .where(
                 AuditTeam.user_id == auditor_id,
                 AuditInfo.department_id.in_([department_ids]),
@@ -1059,70 +868,70 @@ class DashboardService:
             .subquery()
         )
 
-        # ==================================================
-        # KPIs
-        # ==================================================
-
-        assigned_audits = await self.session.scalar(
-            select(func.count(func.distinct(auditor_audit_ids.c.id)))
-        )
-
-        audits_completed = await self.session.scalar(
-            select(func.count(Audit.id))
-            .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .where(
-                Audit.id.in_(select(auditor_audit_ids.c.id)),
-                AuditInfo.status == "CLOSED",
-            )
-        )
-
-        ncrs_raised = await self.session.scalar(
-            select(func.count(auditor_ncr_ids.c.id))
-        )
-
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.id.in_(select(auditor_ncr_ids.c.id)),
-                NCR.status != NCRStatus.CLOSED,
-            )
-        )
-
-        avg_closure_days = await self.session.scalar(
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        NCR.actual_date_of_completion - NCR.created_at,
-                    ) / 86400
+        (
+            # ==================================================
+            # KPIs
+            # ==================================================
+            assigned_audits,
+            audits_completed,
+            ncrs_raised,
+            open_ncrs,
+            avg_closure_days,
+            followups_assigned,
+            # ==================================================
+            # CHARTS
+            # ==================================================
+            audit_status,
+            ncr_trend,
+            ncr_status,
+            severity_mode,
+            aging,
+            clause_wise,
+            followup_outcome,
+            pending_edc_reviews,
+        ) = await self._fan_out(
+            self._scalar(select(func.count(func.distinct(auditor_audit_ids.c.id)))),
+            self._scalar(
+                select(func.count(Audit.id))
+                .join(AuditInfo, AuditInfo.audit_id == Audit.id)
+                .where(
+                    Audit.id.in_(select(auditor_audit_ids.c.id)),
+                    AuditInfo.status == "CLOSED",
                 )
-            )
-            .where(
-                NCR.id.in_(select(auditor_ncr_ids.c.id)),
-                NCR.status == NCRStatus.CLOSED,
-            )
-        )
-
-        followups_assigned = await self.session.scalar(
-            select(func.count(Followup.id))
-            .where(Followup.auditor_id == auditor_id)
-        )
-
-        # ==================================================
-        # CHARTS
-        # ==================================================
-
-        audit_status = (
-            await self.session.execute(
+            ),
+            self._scalar(select(func.count(auditor_ncr_ids.c.id))),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.id.in_(select(auditor_ncr_ids.c.id)),
+                    NCR.status != NCRStatus.CLOSED,
+                )
+            ),
+            self._scalar(
+                select(
+                    func.avg(
+                        func.extract(
+                            "epoch",
+                            NCR.actual_date_of_completion - NCR.created_at,
+                        ) / 86400
+                    )
+                )
+                .where(
+                    NCR.id.in_(select(auditor_ncr_ids.c.id)),
+                    NCR.status == NCRStatus.CLOSED,
+                )
+            ),
+            self._scalar(
+                select(func.count(Followup.id))
+                .where(Followup.auditor_id == auditor_id)
+            ),
+            self._all(
                 select(AuditInfo.status, func.count(Audit.id))
                 .join(AuditInfo, AuditInfo.audit_id == Audit.id)
                 .where(Audit.id.in_(select(auditor_audit_ids.c.id)))
                 .group_by(AuditInfo.status)
-            )
-        ).all()
-
-        ncr_trend = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(
                     func.to_char(func.date_trunc("month", NCR.created_at), "YYYY-MM"),
                     func.count(NCR.id),
@@ -1130,27 +939,18 @@ class DashboardService:
                 .where(NCR.id.in_(select(auditor_ncr_ids.c.id)))
                 .group_by(text("1"))
                 .order_by(text("1"))
-            )
-        ).all()
-
-        ncr_status = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.status, func.count(NCR.id))
                 .where(NCR.id.in_(select(auditor_ncr_ids.c.id)))
                 .group_by(NCR.status)
-            )
-        ).all()
-
-        severity_mode = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.mode, func.count(NCR.id))
                 .where(NCR.id.in_(select(auditor_ncr_ids.c.id)))
                 .group_by(NCR.mode)
-            )
-        ).all()
-
-        aging = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(
                     case(
                         (func.now() - NCR.created_at <= text("interval '7 days'"), "0-7"),
@@ -1165,37 +965,28 @@ class DashboardService:
                     NCR.status != NCRStatus.CLOSED,
                 )
                 .group_by(text("1"))
-            )
-        ).all()
-
-        clause_wise = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.main_clause, func.count(NCR.id))
                 .where(NCR.id.in_(select(auditor_ncr_ids.c.id)))
                 .group_by(NCR.main_clause)
-            )
-        ).all()
-
-        followup_outcome = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(Followup.status, func.count(Followup.id))
                 .where(Followup.auditor_id == auditor_id)
                 .group_by(Followup.status)
-            )
-        ).all()
-
-        pending_edc_reviews = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(EdcRequest.id, NCR.id)
                 .join(NCR)
                 .where(
                     NCR.id.in_(select(auditor_ncr_ids.c.id)),
                     EdcRequest.status == EDCStatus.PENDING,
                 )
-            )
-        ).all()
+            ),
+        )
+
 
-     
         return {
             "stats": {
                 "assigned_audits": assigned_audits or 0,
@@ -1235,89 +1026,86 @@ class DashboardService:
             },
         }
 
+    @dashboard_cache.cached
     async def get_audit_info_dashboard(self, audit_info_id: str):
 
-
-        total_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(NCR.audit_info_id == audit_info_id)
-        )
-
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.audit_info_id == audit_info_id,
-                NCR.status != NCRStatus.CLOSED
-            )
-        )
-
-        closed_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.audit_info_id == audit_info_id,
-                NCR.status == NCRStatus.CLOSED
-            )
-        )
-
-        overdue_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .where(
-                NCR.audit_info_id == audit_info_id,
-                NCR.edc_given_date < func.now(),
-                NCR.status != NCRStatus.CLOSED
-            )
-        )
-
-        total_edc = await self.session.scalar(
-            select(func.count(EdcRequest.id))
-            .join(NCR)
-            .where(NCR.audit_info_id == audit_info_id)
-        )
-
-        pending_edc = await self.session.scalar(
-            select(func.count(EdcRequest.id))
-            .join(NCR)
-            .where(
-                NCR.audit_info_id == audit_info_id,
-                EdcRequest.status == EDCStatus.PENDING
-            )
-        )
-
-        total_followups = await self.session.scalar(
-            select(func.count(Followup.id))
-            .join(NCR)
-            .where(NCR.audit_info_id == audit_info_id)
-        )
-
-
-        ncr_status = (
-            await self.session.execute(
+        (
+            total_ncrs,
+            open_ncrs,
+            closed_ncrs,
+            overdue_ncrs,
+            total_edc,
+            pending_edc,
+            total_followups,
+            ncr_status,
+            edc_status,
+            followup_status,
+            aging,
+            root_cause,
+            clause,
+        ) = await self._fan_out(
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(NCR.audit_info_id == audit_info_id)
+            ),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.audit_info_id == audit_info_id,
+                    NCR.status != NCRStatus.CLOSED
+                )
+            ),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.audit_info_id == audit_info_id,
+                    NCR.status == NCRStatus.CLOSED
+                )
+            ),
+            self._scalar(
+                select(func.count(NCR.id))
+                .where(
+                    NCR.audit_info_id == audit_info_id,
+                    NCR.edc_given_date < func.now(),
+                    NCR.status != NCRStatus.CLOSED
+                )
+            ),
+            self._scalar(
+                select(func.count(EdcRequest.id))
+                .join(NCR)
+                .where(NCR.audit_info_id == audit_info_id)
+            ),
+            self._scalar(
+                select(func.count(EdcRequest.id))
+                .join(NCR)
+                .where(
+                    NCR.audit_info_id == audit_info_id,
+                    EdcRequest.status == EDCStatus.PENDING
+                )
+            ),
+            self._scalar(
+                select(func.count(Followup.id))
+                .join(NCR)
+                .where(NCR.audit_info_id == audit_info_id)
+            ),
+            self._all(
                 select(NCR.status, func.count())
                 .where(NCR.audit_info_id == audit_info_id)
                 .group_by(NCR.status)
-            )
-        ).all()
-
-        edc_status = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(EdcRequest.status, func.count())
                 .join(NCR)
                 .where(NCR.audit_info_id == audit_info_id)
                 .group_by(EdcRequest.status)
-            )
-        ).all()
-
-        followup_status = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(Followup.status, func.count())
                 .join(NCR)
                 .where(NCR.audit_info_id == audit_info_id)
                 .group_by(Followup.status)
-            )
-        ).all()
-
-        aging = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(
                     case(
                         (func.now() - NCR.created_at <= text("interval '7 days'"), "0-7"),
@@ -1332,24 +1120,18 @@ class DashboardService:
                     NCR.status != NCRStatus.CLOSED
                 )
                 .group_by(text("1"))
-            )
-        ).all()
-
-        root_cause = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.root_cause, func.count())
                 .where(NCR.audit_info_id == audit_info_id)
                 .group_by(NCR.root_cause)
-            )
-        ).all()
-
-        clause = (
-            await self.session.execute(
+            ),
+            self._all(
                 select(NCR.main_clause, func.count())
                 .where(NCR.audit_info_id == audit_info_id)
                 .group_by(NCR.main_clause)
-            )
-        ).all()
+            ),
+        )
 
         return {
             "stats": {
@@ -1384,48 +1166,11 @@ class DashboardService:
                 ],
             }
         }
-            
+
+    @dashboard_cache.cached
     async def get_audit_dashboard(self, audit_id: str):
         # 1. Base query filter for reuse
         # Note: We filter by AuditInfo.audit_id which is the UUID passed in.
-        
-        # Total NCRs
-        total_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .where(AuditInfo.audit_id == audit_id)
-        )
-
-        # Open NCRs
-        open_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .where(
-                AuditInfo.audit_id == audit_id,
-                NCR.status != NCRStatus.CLOSED
-            )
-        )
-
-        # Overdue NCRs
-        overdue_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .where(
-                AuditInfo.audit_id == audit_id,
-                NCR.edc_given_date < func.now(),
-                NCR.status != NCRStatus.CLOSED
-            )
-        )
-
-        # Rejected NCRs
-        rejected_ncrs = await self.session.scalar(
-            select(func.count(NCR.id))
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .where(
-                AuditInfo.audit_id == audit_id,
-                NCR.rejected_count > 0
-            )
-        )
 
         # Repeat NCRs (Count of clauses appearing more than once)
         # We use a subquery here to correctly count how many clauses are "repeats"
@@ -1436,22 +1181,55 @@ class DashboardService:
             .group_by(NCR.main_clause)
             .having(func.count(NCR.id) > 1)
         ).subquery()
-        
-        repeat_ncr = await self.session.scalar(
-            select(func.count()).select_from(repeat_ncr_query)
-        )
-
-        # Calculate Risk Score
-        risk_score = (
-            (open_ncrs or 0) * 2 +
-            (overdue_ncrs or 0) * 3 +
-            (rejected_ncrs or 0) * 2 +
-            (repeat_ncr or 0) * 4
-        )
 
-        # Department Risk Breakdown
-        dept_risk = (
-            await self.session.execute(
+        (
+            total_ncrs,
+            open_ncrs,
+            overdue_ncrs,
+            rejected_ncrs,
+            repeat_ncr,
+            dept_risk,
+            clause_heatmap,
+            edc_by_dept,
+        ) = await self._fan_out(
+            # Total NCRs
+            self._scalar(
+                select(func.count(NCR.id))
+                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
+                .where(AuditInfo.audit_id == audit_id)
+            ),
+            # Open NCRs
+            self._scalar(
+                select(func.count(NCR.id))
+                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
+                .where(
+                    AuditInfo.audit_id == audit_id,
+                    NCR.status != NCRStatus.CLOSED
+                )
+            ),
+            # Overdue NCRs
+            self._scalar(
+                select(func.count(NCR.id))
+                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
+                .where(
+                    AuditInfo.audit_id == audit_id,
+                    NCR.edc_given_date < func.now(),
+                    NCR.status != NCRStatus.CLOSED
+                )
+            ),
+            # Rejected NCRs
+            self._scalar(
+                select(func.count(NCR.id))
+                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
+                .where(
+                    AuditInfo.audit_id == audit_id,
+                    NCR.rejected_count > 0
+                )
+            ),
+            # Repeat NCRs
+            self._scalar(select(func.count()).select_from(repeat_ncr_query)),
+            # Department Risk Breakdown
+            self._all(
                 select(
                     Department.name,
                     func.count(NCR.id),
@@ -1463,12 +1241,9 @@ class DashboardService:
                 .join(NCR, NCR.audit_info_id == AuditInfo.id)
                 .where(AuditInfo.audit_id == audit_id)
                 .group_by(Department.name)
-            )
-        ).all()
-
-        # Clause Heatmap
-        clause_heatmap = (
-            await self.session.execute(
+            ),
+            # Clause Heatmap
+            self._all(
                 select(
                     NCR.main_clause,
                     Department.name,
@@ -1478,12 +1253,9 @@ class DashboardService:
                 .join(Department, Department.id == AuditInfo.department_id)
                 .where(AuditInfo.audit_id == audit_id)
                 .group_by(NCR.main_clause, Department.name)
-            )
-        ).all()
-
-        # EDC Requests by Department
-        edc_by_dept = (
-            await self.session.execute(
+            ),
+            # EDC Requests by Department
+            self._all(
                 select(
                     Department.name,
                     func.count(EdcRequest.id)
@@ -1493,8 +1265,16 @@ class DashboardService:
                 .join(EdcRequest, EdcRequest.ncr_id == NCR.id)
                 .where(AuditInfo.audit_id == audit_id)
                 .group_by(Department.name)
-            )
-        ).all()
+            ),
+        )
+
+        # Calculate Risk Score
+        risk_score = (
+            (open_ncrs or 0) * 2 +
+            (overdue_ncrs or 0) * 3 +
+            (rejected_ncrs or 0) * 2 +
+            (repeat_ncr or 0) * 4
+        )
 
         return {
             "stats": {
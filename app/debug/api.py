@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.schemas import Response, ResponseStatus
+from app.debug.dependencies import get_debug_service, require_admin
+from app.debug.models import (
+    IndexAdvisorReport,
+    QuerySort,
+    QueryStatsDetail,
+    QueryStatsReport,
+)
+from app.debug.services import DebugService
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/index-advisor", response_model=Response[IndexAdvisorReport])
+async def index_advisor_report(
+    service: DebugService = Depends(get_debug_service),
+):
+    data = await service.index_advisor_report()
+    return Response(
+        message="Index advisor report retrieved successfully",
+        status=ResponseStatus.SUCCESS,
+        data=data,
+        success=True,
+    )
+
+
+@router.get("/index-advisor/migration", response_class=PlainTextResponse)
+async def index_advisor_migration(
+    service: DebugService = Depends(get_debug_service),
+):
+    filename, source = await service.index_advisor_migration()
+    return PlainTextResponse(
+        source,
+        media_type="text/x-python",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.delete("/index-advisor", response_model=Response[None])
+async def reset_index_advisor(
+    service: DebugService = Depends(get_debug_service),
+):
+    service.reset_index_advisor()
+    return Response(
+        message="Index advisor usage reset",
+        status=ResponseStatus.SUCCESS,
+        data=None,
+        success=True,
+    )
+
+
+@router.get("/queries", response_model=Response[QueryStatsReport])
+async def query_stats_report(
+    sort: QuerySort = QuerySort.TOTAL,
+    limit: int = 50,
+    service: DebugService = Depends(get_debug_service),
+):
+    data = service.query_stats_report(sort, limit)
+    return Response(
+        message="Query statistics retrieved successfully",
+        status=ResponseStatus.SUCCESS,
+        data=data,
+        success=True,
+    )
+
+
+@router.get("/queries/{query_id}", response_model=Response[QueryStatsDetail])
+async def query_stats_detail(
+    query_id: str,
+    service: DebugService = Depends(get_debug_service),
+):
+    data = service.query_stats_detail(query_id)
+    return Response(
+        message="Query statistics retrieved successfully",
+        status=ResponseStatus.SUCCESS,
+        data=data,
+        success=True,
+    )
+
+
+@router.delete("/queries", response_model=Response[None])
+async def reset_query_stats(
+    service: DebugService = Depends(get_debug_service),
+):
+    service.reset_query_stats()
+    return Response(
+        message="Query statistics reset",
+        status=ResponseStatus.SUCCESS,
+        data=None,
+        success=True,
+    )
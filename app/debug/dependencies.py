@@ -0,0 +1,27 @@
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.core.schemas import ResponseStatus
+from app.core.security import authenticate
+from app.debug.services import DebugService
+from app.users.models import RoleEnum, User
+
+async def get_debug_service(
+    session: AsyncSession = Depends(get_session),
+) -> DebugService:
+    return DebugService(session=session)
+
+
+async def require_admin(user: User = Depends(authenticate)) -> User:
+    if user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "message": "Admin access required",
+                "success": False,
+                "status": ResponseStatus.FORBIDDEN.value,
+                "data": None,
+            },
+        )
+    return user
@@ -0,0 +1,71 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel as PydanticBaseModel
+
+
+class DslPathUsage(PydanticBaseModel):
+    model: str
+    path: str
+    op: str
+    hits: int
+
+
+class IndexSuggestionResponse(PydanticBaseModel):
+    table: str
+    column: str
+    method: str
+    name: str
+    uses: Dict[str, int]
+    live_rows: int
+    seq_scan: int
+    seq_tup_read: int
+    idx_scan: int
+    ddl: str
+
+
+class IndexAdvisorReport(PydanticBaseModel):
+    since: datetime
+    sample_rate: float
+    dsl_paths: List[DslPathUsage]
+    suggestions: List[IndexSuggestionResponse]
+
+
+class QuerySort(str, Enum):
+    TOTAL = "total_ms"
+    MEAN = "mean_ms"
+    P95 = "p95_ms"
+    P99 = "p99_ms"
+    MAX = "max_ms"
+    CALLS = "calls"
+    ROWS = "rows"
+
+
+class QueryStats(PydanticBaseModel):
+    id: str
+    fingerprint: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rows: int
+    routes: Dict[str, int]
+    last_seen: Optional[datetime] = None
+    has_plan: bool
+    plan_ms: Optional[float] = None
+    plan_captured_at: Optional[datetime] = None
+
+
+class QueryStatsDetail(QueryStats):
+    plan: Optional[Any] = None
+
+
+class QueryStatsReport(PydanticBaseModel):
+    since: datetime
+    tracked: int
+    untracked: int
+    queries: List[QueryStats]
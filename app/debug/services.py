@@ -0,0 +1,93 @@
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.query_stats import query_stats
+from app.debug.models import (
+    DslPathUsage,
+    IndexAdvisorReport,
+    IndexSuggestionResponse,
+    QuerySort,
+    QueryStats,
+    QueryStatsDetail,
+    QueryStatsReport,
+)
+from app.utils.index_advisor import (
+    advise,
+    current_revision,
+    render_migration,
+    suggestion_indexes,
+    usage_recorder,
+)
+
+
+class DebugService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def index_advisor_report(self) -> IndexAdvisorReport:
+        suggestions = await advise(self.session)
+        return IndexAdvisorReport(
+            since=usage_recorder.since,
+            sample_rate=settings.INDEX_ADVISOR_SAMPLE_RATE,
+            dsl_paths=[
+                DslPathUsage(model=model, path=path, op=op, hits=hits)
+                for (model, path, op), hits in usage_recorder.path_usage().most_common()
+            ],
+            suggestions=[
+                IndexSuggestionResponse(
+                    table=s.table,
+                    column=s.column,
+                    method=s.method,
+                    name=s.name,
+                    uses=s.uses,
+                    live_rows=s.live_rows,
+                    seq_scan=s.seq_scan,
+                    seq_tup_read=s.seq_tup_read,
+                    idx_scan=s.idx_scan,
+                    ddl=s.ddl,
+                )
+                for s in suggestions
+            ],
+        )
+
+    async def index_advisor_migration(self) -> tuple[str, str]:
+        """``(filename, source)`` of a revision creating the suggested indexes."""
+        suggestions = await advise(self.session)
+        revision = uuid.uuid4().hex[:12]
+        source = render_migration(
+            suggestion_indexes(suggestions),
+            revision=revision,
+            down_revision=await current_revision(self.session),
+        )
+        return f"{revision}_index_advisor.py", source
+
+    def reset_index_advisor(self) -> None:
+        usage_recorder.reset()
+
+    def query_stats_report(self, sort: QuerySort, limit: int) -> QueryStatsReport:
+        return QueryStatsReport(
+            since=query_stats.since,
+            tracked=len(query_stats),
+            untracked=query_stats.untracked,
+            queries=[QueryStats(**q) for q in query_stats.top(sort.value, limit)],
+        )
+
+    def query_stats_detail(self, query_id: str) -> QueryStatsDetail:
+        data = query_stats.get(query_id)
+        if data is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": "Query not found",
+                    "success": False,
+                    "status": status.HTTP_404_NOT_FOUND,
+                    "data": None,
+                },
+            )
+        return QueryStatsDetail(**data)
+
+    def reset_query_stats(self) -> None:
+        query_stats.reset()
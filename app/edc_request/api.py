@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks, Depends
@@ -12,6 +13,8 @@ from app.edc_request.models import (
 )
 from app.edc_request.services import EdcRequestService
 from app.edc_request.dependencies import get_edc_request_service
+from app.utils.export import ExportFormat
+from app.utils.serializer import typed_response
 from app.users.models import User
 from app.core.security import authenticate
 
@@ -41,18 +44,47 @@ async def get_all_edc_requests(
     sort: Optional[str] = None,
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
+    include: Optional[str] = None,
     edc_request_service: EdcRequestService = Depends(get_edc_request_service),
 ):
     edc_requests = await edc_request_service.get_all_edc_requests(
-        filters, sort, page, page_size, from_date, to_date
+        filters,
+        sort,
+        page,
+        page_size,
+        from_date,
+        to_date,
+        cursor=cursor,
+        include_total=include_total,
+        include=include,
     )
-    return Response(
-        message="Edc requests fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=edc_requests,
+    return typed_response(
+        Response[EdcRequestListResponse],
+        Response(
+            message="Edc requests fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=edc_requests,
+        ),
+        exclude_unset=include is not None,
+    )
+
+
+@router.get("/export")
+async def stream_edc_requests(
+    format: ExportFormat = ExportFormat.CSV,
+    filters: Optional[str] = None,
+    sort: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    edc_request_service: EdcRequestService = Depends(get_edc_request_service),
+):
+    return edc_request_service.stream_edc_requests(
+        format, filters, sort, from_date, to_date
     )
 
 
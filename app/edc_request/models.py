@@ -2,7 +2,7 @@
 from enum import Enum
 from typing import Optional
 from sqlmodel import Field, Relationship
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
 from app.core.schemas import BaseModel
@@ -15,15 +15,17 @@ class EDCStatus(str, Enum):
     REJECTED = "REJECTED"
 
 class EdcRequest(BaseModel, table=True):
+    __table_args__ = (Index("ix_edcrequest_created_at", "created_at"),)
+
     ncr_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     
     requested_by_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     requested_by: "User" = Relationship(back_populates="requested_edc_requests",sa_relationship_kwargs={
@@ -60,10 +62,12 @@ class EdcRequestResponse(PydanticBaseModel):
     requested_by: "UserResponse" = None
     
 class EdcRequestListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["EdcRequestResponse"] = []
     
 from app.users.models import User, UserResponse
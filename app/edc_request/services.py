@@ -21,43 +21,39 @@ from app.edc_request.models import (
     EdcRequestResponse,
     UpdateEDCRequestRequest,
 )
+from app.ncr.facts import refresh_ncr_facts
 from app.ncr.models import (
     NCR,
-    DocumentReference,
-    NCRFiles,
     NCRResponse,
     NCRTeam,
     NCRTeamResponse,
     NCRTeamRole,
 )
 from app.core.config import settings
-from app.settings.models import Department, DepartmentResponse, Plant
+from app.settings.models import DepartmentResponse, Plant
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from app.users.models import User, UserResponse
+from app.utils.background import enqueue_task
 from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
-from app.utils.serializer import to_naive
+from app.utils.export import ExportFormat, export_query
+from app.utils.includes import include_options
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
+from app.utils.serializer import from_orm, to_naive
+
+
+# relationships the list loads without `include=`
+EDC_REQUEST_LIST_INCLUDE = (
+    "ncr.audit_info.audit.plant.company,ncr.audit_info.department,"
+    "ncr.audit_info.team.user,requested_by"
+)
 
 
 class EdcRequestService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build(
-            [
-                EdcRequest,
-                NCR,
-                AuditInfo,
-                AuditTeam,
-                NCRTeam,
-                DocumentReference,
-                NCRFiles,
-                Department,
-                Plant,
-                Audit,
-            ]
-        )
+        self.graph = get_model_graph()
 
     async def create_edc_request(
         self,
@@ -144,7 +140,8 @@ class EdcRequestService:
             (member for member in ncr.team if member.role == NCRTeamRole.AUDITEE), None
         )
 
-        background_tasks.add_task(
+        enqueue_task(
+            background_tasks,
             send_email,
             [hod.user.email],
             f"ARe-Audit Management : EDC Extension Request ({ncr.ref})",
@@ -206,10 +203,12 @@ class EdcRequestService:
             if data.status == EDCStatus.APPROVED:
 
                 ncr.expected_date_of_completion = to_naive(data.new_edc)
+                await refresh_ncr_facts(self.session, NCR.id == ncr.id)
                 await self.session.commit()
                 await self.session.refresh(ncr)
 
-            background_tasks.add_task(
+            enqueue_task(
+                background_tasks,
                 send_email,
                 [edc_request.requested_by.email],
                 f"ARe-Audit Management : EDC Extension Request ({ncr.ref}) - {data.status}",
@@ -234,18 +233,12 @@ class EdcRequestService:
         page_size: int = DEFAULT_PAGE_SIZE,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        include: Optional[str] = None,
     ):
         stmt = select(EdcRequest).options(
-            selectinload(EdcRequest.ncr).options(
-                selectinload(NCR.audit_info).options(
-                    selectinload(AuditInfo.audit).options(
-                        selectinload(Audit.plant).options(selectinload(Plant.company))
-                    ),
-                    selectinload(AuditInfo.department),
-                    selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
-                ),
-            ),
-            selectinload(EdcRequest.requested_by),
+            *include_options(EdcRequest, include, self.graph, EDC_REQUEST_LIST_INCLUDE)
         )
         from_date = to_naive(from_date)
         to_date = to_naive(to_date)
@@ -257,87 +250,27 @@ class EdcRequestService:
         if filters:
             stmt = apply_filters(stmt, filters, EdcRequest, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, EdcRequest, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        edc_requests = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            EdcRequest,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        edc_requests = page_result.items
 
         response = EdcRequestListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
-            data=[
-                EdcRequestResponse(
-                    id=edc_request.id,
-                    created_at=edc_request.created_at,
-                    ncr_id=edc_request.ncr_id,
-                    requested_by_id=edc_request.requested_by_id,
-                    new_edc=edc_request.new_edc,
-                    old_edc=edc_request.old_edc,
-                    comment=edc_request.comment,
-                    status=edc_request.status,
-                    requested_by=UserResponse(
-                        id=edc_request.requested_by_id,
-                        employee_id=edc_request.requested_by.employee_id,
-                        name=edc_request.requested_by.name,
-                    ),
-                    ncr=NCRResponse(
-                        id=edc_request.ncr_id,
-                        ref=edc_request.ncr.ref,
-                        repeat=edc_request.ncr.repeat,
-                        status=edc_request.ncr.status,
-                        mode=edc_request.ncr.mode,
-                        shift=edc_request.ncr.shift,
-                        type=edc_request.ncr.type,
-                        audit_info_id=edc_request.ncr.audit_info_id,
-                        description=edc_request.ncr.description,
-                        objective_evidence=edc_request.ncr.objective_evidence,
-                        requirement=edc_request.ncr.requirement,
-                        main_clause=edc_request.ncr.main_clause,
-                        sub_clause=edc_request.ncr.sub_clause,
-                        ss_clause=edc_request.ncr.ss_clause,
-                        correction=edc_request.ncr.correction,
-                        root_cause=edc_request.ncr.root_cause,
-                        systematic_corrective_action=edc_request.ncr.systematic_corrective_action,
-                        corrective_action_details=edc_request.ncr.corrective_action_details,
-                        expected_date_of_completion=edc_request.ncr.expected_date_of_completion,
-                        actual_date_of_completion=edc_request.ncr.actual_date_of_completion,
-                        edc_given_date=edc_request.ncr.edc_given_date,
-                        remarks=edc_request.ncr.remarks,
-                        followup_observations=edc_request.ncr.followup_observations,
-                        followup_date=edc_request.ncr.followup_date,
-                        rejected_reson=edc_request.ncr.rejected_reson,
-                        rejected_count=edc_request.ncr.rejected_count,
-                        closed_on=edc_request.ncr.closed_on,
-                        audit_info=AuditInfoResponse(
-                            id=edc_request.ncr.audit_info_id,
-                            ref=edc_request.ncr.audit_info.ref,
-                            department_id=edc_request.ncr.audit_info.department_id,
-                            department=DepartmentResponse(
-                                id=edc_request.ncr.audit_info.department.id,
-                                name=edc_request.ncr.audit_info.department.name,
-                                code=edc_request.ncr.audit_info.department.code,
-                                created_at=edc_request.ncr.audit_info.department.created_at,
-                                updated_at=edc_request.ncr.audit_info.department.updated_at,
-                                slug=edc_request.ncr.audit_info.department.slug,
-                            ),
-                            from_date=edc_request.ncr.audit_info.from_date,
-                            to_date=edc_request.ncr.audit_info.to_date,
-                            closed_date=edc_request.ncr.audit_info.closed_date,
-                            status=edc_request.ncr.audit_info.status,
-                        ),
-                    ),
-                )
-                for edc_request in edc_requests
-            ],
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
+            data=from_orm(list[EdcRequestResponse], edc_requests),
         )
 
         return response
@@ -444,6 +377,61 @@ class EdcRequestService:
 
         return response
 
+    def edc_request_export_row(self, edc_request: EdcRequest) -> dict:
+        ncr = edc_request.ncr
+        audit = ncr.audit_info.audit
+        return {
+            "ncr_ref": ncr.ref,
+            "ncr_status": ncr.status,
+            "audit_ref": audit.ref,
+            "company": audit.plant.company.name,
+            "plant": audit.plant.name,
+            "department": ncr.audit_info.department.name,
+            "status": edc_request.status,
+            "created_at": edc_request.created_at,
+            "requested_by": edc_request.requested_by.name,
+            "old_edc": edc_request.old_edc,
+            "new_edc": edc_request.new_edc,
+            "comment": edc_request.comment,
+        }
+
+    def stream_edc_requests(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = "created_at.desc",
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ):
+        stmt = select(EdcRequest).options(
+            selectinload(EdcRequest.ncr).options(
+                selectinload(NCR.audit_info).options(
+                    selectinload(AuditInfo.audit).options(
+                        selectinload(Audit.plant).options(selectinload(Plant.company))
+                    ),
+                    selectinload(AuditInfo.department),
+                ),
+            ),
+            selectinload(EdcRequest.requested_by),
+        )
+        from_date = to_naive(from_date)
+        to_date = to_naive(to_date)
+        if from_date:
+            stmt = stmt.where(EdcRequest.created_at >= from_date)
+        if to_date:
+            stmt = stmt.where(EdcRequest.created_at <= to_date)
+
+        return export_query(
+            stmt,
+            EdcRequest,
+            self.graph,
+            self.edc_request_export_row,
+            format,
+            "edc_requests",
+            filters,
+            sort,
+        )
+
     async def get_edc_request_by_id(self, edc_request_id: UUID):
         edc_request = await self.session.execute(
             select(EdcRequest)
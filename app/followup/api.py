@@ -8,6 +8,8 @@ from app.followup.services import FollowupService
 from app.followup.dependencies import get_followup_service
 from app.users.models import User
 from app.core.security import authenticate
+from app.utils.export import ExportFormat
+from app.utils.serializer import typed_response
 
 router = APIRouter()
 
@@ -32,16 +34,41 @@ async def get_all_followups(
     sort: Optional[str] = None,
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    include: Optional[str] = None,
     followup_service: FollowupService = Depends(get_followup_service),
 ):
-    followups = await followup_service.get_all_followups(filters, sort, page, page_size)
-    return Response(
-        message="Followups fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=followups,
+    followups = await followup_service.get_all_followups(
+        filters,
+        sort,
+        page,
+        page_size,
+        cursor=cursor,
+        include_total=include_total,
+        include=include,
+    )
+    return typed_response(
+        Response[FollowupListResponse],
+        Response(
+            message="Followups fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=followups,
+        ),
+        exclude_unset=include is not None,
     )
     
+@router.get("/export")
+async def stream_followups(
+    format: ExportFormat = ExportFormat.CSV,
+    filters: Optional[str] = None,
+    sort: Optional[str] = None,
+    followup_service: FollowupService = Depends(get_followup_service),
+):
+    return followup_service.stream_followups(format, filters, sort)
+
+
 @router.get("/{followup_id}", response_model=Response[FollowupResponse])
 async def get_followup(
     followup_id: UUID,
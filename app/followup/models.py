@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlmodel import Field, Relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from uuid import UUID
@@ -17,11 +17,13 @@ class FollowupStatus(str, Enum):
 
 
 class Followup(BaseModel, table=True):
+    __table_args__ = (Index("ix_followup_created_at", "created_at"),)
+
     requested_date: datetime = Field(default_factory=datetime.now)
     status: str = Field(default=FollowupStatus.NONASSIGNED)
     ncr_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
      
@@ -31,7 +33,7 @@ class Followup(BaseModel, table=True):
     completed_on: datetime = Field(default_factory=datetime.now)
     auditor_id: Optional[UUID] = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=True
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=True, index=True
         )
     )
     auditor:  Optional["User"] = Relationship(back_populates="followup_auditor",sa_relationship_kwargs={
@@ -39,7 +41,7 @@ class Followup(BaseModel, table=True):
     })
     requested_by_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     requested_by: "User" = Relationship(back_populates="requested_followup",sa_relationship_kwargs={
@@ -72,10 +74,12 @@ class FollowupResponse(PydanticBaseModel):
     
     
 class FollowupListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["FollowupResponse"] = []
 
     
@@ -3,8 +3,8 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import BackgroundTasks, HTTPException, status
-from sqlalchemy import func, select
-from app.audit.models import Audit, AuditResponse
+from sqlalchemy import select
+from app.audit.models import AuditResponse
 from app.audit_info.models import (
     AuditInfo,
     AuditInfoResponse,
@@ -25,6 +25,7 @@ from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from app.core.config import settings
+from app.ncr.facts import refresh_ncr_facts
 from app.ncr.models import (
     NCR,
     DocumentReference,
@@ -35,31 +36,27 @@ from app.ncr.models import (
     NCRTeamResponse,
     NCRTeamRole,
 )
-from app.settings.models import Department, DepartmentResponse, Plant
+from app.settings.models import DepartmentResponse
 from app.users.models import User, UserResponse
+from app.utils.background import enqueue_task
 from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
-from app.utils.serializer import to_naive
+from app.utils.export import ExportFormat, export_query
+from app.utils.includes import include_options
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
+from app.utils.serializer import from_orm, to_naive
+
+
+# relationships the list loads without `include=`
+FOLLOWUP_LIST_INCLUDE = (
+    "ncr.team.user,ncr.audit_info.audit,ncr.audit_info.department,auditor,requested_by"
+)
 
 
 class FollowupService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build(
-            [
-                Followup,
-                NCR,
-                AuditInfo,
-                AuditTeam,
-                NCRTeam,
-                DocumentReference,
-                NCRFiles,
-                Audit,
-                Department,
-                Plant,
-            ]
-        )
+        self.graph = get_model_graph()
 
     async def create_followup(
         self, data: CreateFollowupRequest, user_id: UUID, background_tasks
@@ -96,6 +93,7 @@ class FollowupService:
 
         ncr.status = NCRStatus.FOLLOWUP_REQUESTED
 
+        await refresh_ncr_facts(self.session, NCR.id == ncr.id)
         await self.session.commit()
         
         hod = next(
@@ -116,7 +114,8 @@ class FollowupService:
             (member for member in ncr.team if member.role == NCRTeamRole.AUDITEE), None
         )
         
-        background_tasks.add_task(
+        enqueue_task(
+            background_tasks,
             send_email,
             [hod.user.email],
             f"ARe-Audit Management : Followup Request for ({ncr.ref})",
@@ -208,10 +207,12 @@ class FollowupService:
                 ncr_id=followup.ncr_id,
             )
             self.session.add(update_ncr_team)
+            await refresh_ncr_facts(self.session, NCR.id == followup.ncr_id)
             await self.session.commit()
             
             if(user_id == hod.user.id):
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [followup_auditor.email],
                     f"ARe-Audit Management : Followup Assigned for ({ncr.ref})",
@@ -234,7 +235,8 @@ class FollowupService:
                 )
                 
                 
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [auditee.user.email],
                     f"ARe-Audit Management : Followup Auditor Assigned for ({ncr.ref})",
@@ -265,7 +267,8 @@ class FollowupService:
             ncr.followup_date = to_naive(datetime.now())
             
             if(user_id == followup.auditor_id):
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [hod.user.email],
                     f"ARe-Audit Management : Followup Completed for ({ncr.ref})",
@@ -291,6 +294,7 @@ class FollowupService:
         if data.completed_on:
             followup.completed_on = to_naive(data.completed_on)
             ncr.followup_date = to_naive(datetime.now())
+        await refresh_ncr_facts(self.session, NCR.id == followup.ncr_id)
         await self.session.commit()
         return followup
 
@@ -300,129 +304,38 @@ class FollowupService:
         sort: Optional[str] = "created_at.desc",
         page: int = DEFAULT_PAGE,
         page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        include: Optional[str] = None,
     ):
         stmt = select(Followup).options(
-            selectinload(Followup.ncr).options(
-                selectinload(NCR.team).options(selectinload(NCRTeam.user)),
-                selectinload(NCR.audit_info).options(
-                    selectinload(AuditInfo.audit), selectinload(AuditInfo.department)
-                ),
-            ),
-            selectinload(Followup.auditor),
-            selectinload(Followup.requested_by),
+            *include_options(Followup, include, self.graph, FOLLOWUP_LIST_INCLUDE)
         )
 
         if filters:
             stmt = apply_filters(stmt, filters, Followup, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, Followup, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        followups = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            Followup,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        followups = page_result.items
 
         response = FollowupListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
-            data=[
-                FollowupResponse(
-                    id=followup.id,
-                    requested_date=followup.requested_date,
-                    status=followup.status,
-                    ncr_id=followup.ncr_id,
-                    auditor_id=followup.auditor_id,
-                    observations=followup.observations,
-                    auditor=(
-                        UserResponse(
-                            id=followup.auditor.id,
-                            employee_id=followup.auditor.employee_id,
-                            name=followup.auditor.name,
-                        )
-                        if followup.auditor
-                        else None
-                    ),
-                    requested_by_id=followup.requested_by_id,
-                    assgined_on=followup.assgined_on,
-                    completed_on=followup.completed_on,
-                    requested_by=UserResponse(
-                        id=followup.requested_by.id,
-                        employee_id=followup.requested_by.employee_id,
-                        name=followup.requested_by.name,
-                    ),
-                    ncr=NCRResponse(
-                        id=followup.ncr_id,
-                        ref=followup.ncr.ref,
-                        repeat=followup.ncr.repeat,
-                        status=followup.ncr.status,
-                        mode=followup.ncr.mode,
-                        shift=followup.ncr.shift,
-                        type=followup.ncr.type,
-                        audit_info_id=followup.ncr.audit_info_id,
-                        description=followup.ncr.description,
-                        objective_evidence=followup.ncr.objective_evidence,
-                        requirement=followup.ncr.requirement,
-                        main_clause=followup.ncr.main_clause,
-                        sub_clause=followup.ncr.sub_clause,
-                        ss_clause=followup.ncr.ss_clause,
-                        correction=followup.ncr.correction,
-                        root_cause=followup.ncr.root_cause,
-                        systematic_corrective_action=followup.ncr.systematic_corrective_action,
-                        corrective_action_details=followup.ncr.corrective_action_details,
-                        expected_date_of_completion=followup.ncr.expected_date_of_completion,
-                        actual_date_of_completion=followup.ncr.actual_date_of_completion,
-                        edc_given_date=followup.ncr.edc_given_date,
-                        remarks=followup.ncr.remarks,
-                        followup_observations=followup.ncr.followup_observations,
-                        followup_date=followup.ncr.followup_date,
-                        rejected_reson=followup.ncr.rejected_reson,
-                        rejected_count=followup.ncr.rejected_count,
-                        closed_on=followup.ncr.closed_on,
-                        files=[],
-                        document_references=[],
-                        team=[
-                            NCRTeamResponse(
-                                id=ncr_team.id,
-                                user_id=ncr_team.user_id,
-                                role=ncr_team.role,
-                                ncr_id=ncr_team.ncr_id,
-                                user=UserResponse(
-                                    id=ncr_team.user.id,
-                                    employee_id=ncr_team.user.employee_id,
-                                    name=ncr_team.user.name,
-                                ),
-                            )
-                            for ncr_team in followup.ncr.team
-                        ],
-                        audit_info=AuditInfoResponse(
-                            id=followup.ncr.audit_info_id,
-                            ref=followup.ncr.audit_info.ref,
-                            department_id=followup.ncr.audit_info.department_id,
-                            department=DepartmentResponse(
-                                id=followup.ncr.audit_info.department.id,
-                                name=followup.ncr.audit_info.department.name,
-                                code=followup.ncr.audit_info.department.code,
-                                created_at=followup.ncr.audit_info.department.created_at,
-                                updated_at=followup.ncr.audit_info.department.updated_at,
-                                slug=followup.ncr.audit_info.department.slug,
-                            ),
-                            from_date=followup.ncr.audit_info.from_date,
-                            to_date=followup.ncr.audit_info.to_date,
-                            closed_date=followup.ncr.audit_info.closed_date,
-                            status=followup.ncr.audit_info.status,
-                        ),
-                    ),
-                    created_at=followup.created_at,
-                )
-                for followup in followups
-            ],
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
+            data=from_orm(list[FollowupResponse], followups),
         )
 
         return response
@@ -546,6 +459,49 @@ class FollowupService:
 
         return response
 
+    def followup_export_row(self, followup: Followup) -> dict:
+        audit_info = followup.ncr.audit_info
+        return {
+            "ncr_ref": followup.ncr.ref,
+            "ncr_status": followup.ncr.status,
+            "audit_ref": audit_info.audit.ref,
+            "audit_info_ref": audit_info.ref,
+            "department": audit_info.department.name,
+            "status": followup.status,
+            "requested_date": followup.requested_date,
+            "requested_by": followup.requested_by.name,
+            "auditor": followup.auditor.name if followup.auditor else None,
+            "assgined_on": followup.assgined_on,
+            "completed_on": followup.completed_on,
+            "observations": followup.observations,
+        }
+
+    def stream_followups(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = "created_at.desc",
+    ):
+        stmt = select(Followup).options(
+            selectinload(Followup.ncr).options(
+                selectinload(NCR.audit_info).options(
+                    selectinload(AuditInfo.audit), selectinload(AuditInfo.department)
+                ),
+            ),
+            selectinload(Followup.auditor),
+            selectinload(Followup.requested_by),
+        )
+        return export_query(
+            stmt,
+            Followup,
+            self.graph,
+            self.followup_export_row,
+            format,
+            "followups",
+            filters,
+            sort,
+        )
+
     async def get_followup_by_id(self, followup_id: UUID):
         followup = await self.session.execute(
             select(Followup)
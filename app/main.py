@@ -3,16 +3,23 @@ import logging
 from typing import Set
 
 from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    PlainTextResponse,
+    RedirectResponse,
+)
 from sqlalchemy import select, text
 
 from app.core.config import settings
 from app.core.database import get_session, init_db, engine, async_session
+from app.core.hashing import password_hasher
 from app.core.logging import configure_logging
-from app.middlewares.slow_request import SlowRequestMiddleware
-from app.middlewares.telegram_error import TelegramErrorMiddleware
-from app.middlewares.tracing import TraceAndTimingMiddleware
+from app.core import metrics
+from app.middlewares.observability import ObservabilityMiddleware
 from app.router import api_router
+from app.utils.model_graph import get_model_graph
 from starlette.middleware.sessions import SessionMiddleware
 import time
 
@@ -20,7 +27,9 @@ import time
 async def lifespan(application: FastAPI): 
 
     configure_logging()
+    get_model_graph()
     yield
+    password_hasher.shutdown()
 
 
 responses: Set[int] = {
@@ -34,6 +43,7 @@ responses: Set[int] = {
 app = FastAPI(
     titale=" E- audit management system API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 if settings.CORS_ORIGINS:
@@ -54,15 +64,8 @@ if settings.USE_CORRELATION_ID:
 
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
-
-# app.add_middleware(
-#     TelegramErrorMiddleware,
-#     telegram_bot_token=settings.TELEGRAM_BOT_TOKEN,
-#     telegram_chat_id=settings.TELEGRAM_CHAT_ID,
-# )
-
-# app.add_middleware(TraceAndTimingMiddleware)
-# app.add_middleware(SlowRequestMiddleware)
+# outermost, so the timing covers every other middleware
+app.add_middleware(ObservabilityMiddleware)
 
 
 app.include_router(api_router)
@@ -169,6 +172,21 @@ async def health_check():
     )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "Metrics are disabled",
+                "success": False,
+                "status": status.HTTP_404_NOT_FOUND,
+                "data": None,
+            },
+        )
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/", include_in_schema=False)
 async def custom_docs():
     html_content = """
@@ -0,0 +1,247 @@
+import asyncio
+import re
+import time
+import traceback
+from typing import TYPE_CHECKING, Optional, Tuple
+from uuid import uuid4
+
+import httpx
+import structlog
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.logging import span_id_ctx, trace_id_ctx
+from app.core.query_stats import QueryBudgetExceeded, RequestQueries, request_queries
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+    from structlog.stdlib import BoundLogger
+
+logger: "BoundLogger" = structlog.get_logger("request")
+
+# W3C trace context: version-trace_id-parent_id-flags
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+TRACE_HEADER = "X-Trace-Id"
+
+# label for requests no route matched (404s, scanners); keeps raw paths out
+# of the metrics
+UNMATCHED_ROUTE = "<unmatched>"
+
+# strong references to in-flight alert posts
+_alert_tasks: set = set()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """``(trace_id, parent_span_id)`` of a valid ``traceparent`` header."""
+    match = TRACEPARENT.match(value or "")
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+def route_template(scope: "Scope") -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def request_route(scope: "Scope") -> str:
+    """``"METHOD /route/template"``, the key of the query budgets and statistics."""
+    return f"{scope['method']} {route_template(scope)}"
+
+
+async def send_error_alert(text: str) -> None:
+    try:
+        async with httpx.AsyncClient(timeout=10) as client:
+            await client.post(
+                f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage",
+                json={"chat_id": settings.TELEGRAM_CHAT_ID, "text": text},
+            )
+    except Exception as exc:
+        await logger.awarning("error_alert_failed", error=repr(exc))
+
+
+class ObservabilityMiddleware:
+    """
+    Trace context, timing, slow request logging, metrics, query budgets and
+    error capture in one ASGI layer. Only ``send`` is wrapped (response headers, status and
+    size), so streaming responses pass through chunk by chunk; timing stops at
+    the last body chunk, before background tasks run.
+    """
+
+    __slots__ = ("app", "slow_ms", "very_slow_ms", "error_alerts", "metrics_exclude")
+
+    def __init__(
+        self,
+        app: "ASGIApp",
+        *,
+        slow_ms: int = settings.SLOW_REQUEST_MS,
+        very_slow_ms: int = settings.VERY_SLOW_REQUEST_MS,
+        error_alerts: bool = settings.TELEGRAM_ERROR_ALERTS,
+        metrics_exclude: tuple = ("/metrics", "/health"),
+    ) -> None:
+        self.app = app
+        self.slow_ms = slow_ms
+        self.very_slow_ms = very_slow_ms
+        self.error_alerts = error_alerts
+        self.metrics_exclude = metrics_exclude
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        headers = Headers(scope=scope)
+        parent = parse_traceparent(headers.get("traceparent"))
+        trace_id = parent[0] if parent else uuid4().hex
+        span_id = uuid4().hex[:16]
+        trace_token = trace_id_ctx.set(trace_id)
+        span_token = span_id_ctx.set(span_id)
+        client = scope.get("client")
+        log_context = {
+            "path": scope["path"],
+            "method": scope["method"],
+            "client_ip": client[0] if client else None,
+            "user_agent": headers.get("user-agent"),
+        }
+        if parent:
+            log_context["parent_span_id"] = parent[1]
+        log_tokens = structlog.contextvars.bind_contextvars(**log_context)
+        queries = RequestQueries()
+        queries_token = request_queries.set(queries)
+
+        status_code = 500
+        response_size = 0
+        response_started = False
+        finished: Optional[float] = None
+
+        async def send_wrapper(message: "Message") -> None:
+            nonlocal status_code, response_size, response_started, finished
+            if message["type"] == "http.response.start":
+                if (
+                    settings.QUERY_BUDGET_ENABLED
+                    and settings.QUERY_BUDGET_STRICT
+                    and scope.get("route") is not None
+                ):
+                    # fail before anything is sent, so the test sees the reason
+                    reason = queries.over_budget(request_route(scope))
+                    if reason:
+                        raise QueryBudgetExceeded(reason)
+                response_started = True
+                status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers[TRACE_HEADER] = trace_id
+                response_headers["traceparent"] = f"00-{trace_id}-{span_id}-01"
+                response_headers.append(
+                    "Server-Timing",
+                    f'db;dur={queries.duration_ms:.1f};desc="{queries.count} queries", '
+                    f"app;dur={(time.perf_counter() - start) * 1000:.1f}",
+                )
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished = time.perf_counter()
+            await send(message)
+
+        if settings.METRICS_ENABLED:
+            metrics.HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except QueryBudgetExceeded:
+            raise
+        except Exception as exc:
+            status_code = 500
+            await self.capture_error(scope, exc)
+            if response_started:
+                raise
+            response = JSONResponse(
+                status_code=500,
+                content={
+                    "detail": {
+                        "message": "Internal Server Error",
+                        "success": False,
+                        "status": 500,
+                        "data": None,
+                    }
+                },
+            )
+            await response(scope, receive, send_wrapper)
+        finally:
+            if settings.METRICS_ENABLED:
+                metrics.HTTP_REQUESTS_IN_PROGRESS.dec()
+            duration = (finished or time.perf_counter()) - start
+            try:
+                self.finish(scope, status_code, response_size, duration, queries)
+            finally:
+                request_queries.reset(queries_token)
+                structlog.contextvars.reset_contextvars(**log_tokens)
+                span_id_ctx.reset(span_token)
+                trace_id_ctx.reset(trace_token)
+
+    def finish(
+        self,
+        scope: "Scope",
+        status_code: int,
+        response_size: int,
+        duration: float,
+        queries: RequestQueries,
+    ) -> None:
+        route = route_template(scope)
+        if settings.METRICS_ENABLED and scope["path"] not in self.metrics_exclude:
+            method = scope["method"]
+            metrics.HTTP_REQUEST_DURATION.observe(duration, method=method, route=route)
+            metrics.HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            metrics.DB_QUERIES_PER_REQUEST.observe(queries.count, route=route)
+            metrics.DB_TIME_PER_REQUEST.observe(queries.duration_ms / 1000, route=route)
+
+        if (
+            settings.QUERY_BUDGET_ENABLED
+            and not settings.QUERY_BUDGET_STRICT
+            and route != UNMATCHED_ROUTE
+        ):
+            reason = queries.over_budget(request_route(scope))
+            if reason:
+                logger.warning(
+                    "query_budget_exceeded",
+                    route=route,
+                    reason=reason,
+                    db_queries=queries.count,
+                    db_ms=round(queries.duration_ms, 2),
+                    repeated=[
+                        {"calls": calls, "statement": fp[:200]}
+                        for fp, calls in queries.repeated(2)[:5]
+                    ],
+                )
+
+        duration_ms = round(duration * 1000, 2)
+        if duration_ms < self.slow_ms:
+            return
+        log = logger.error if duration_ms >= self.very_slow_ms else logger.warning
+        log(
+            "very_slow_request" if duration_ms >= self.very_slow_ms else "slow_request",
+            route=route,
+            duration_ms=duration_ms,
+            status_code=status_code,
+            response_size=response_size,
+            db_queries=queries.count,
+            db_ms=round(queries.duration_ms, 2),
+        )
+
+    async def capture_error(self, scope: "Scope", exc: Exception) -> None:
+        await logger.aerror("unhandled_exception", route=route_template(scope), exc_info=exc)
+        if not self.error_alerts:
+            return
+        query = scope.get("query_string", b"").decode("latin-1")
+        text = (
+            f"🚨 Error Occurred\n\n"
+            f"Path: {scope['method']} {scope['path']}{'?' + query if query else ''}\n"
+            f"Trace: {trace_id_ctx.get()}\n"
+            f"Error: {exc!r}\n\n"
+            f"{''.join(traceback.format_exception(exc))[-3000:]}"
+        )
+        # posted off the request path; the client gets its 500 right away
+        task = asyncio.get_running_loop().create_task(send_error_alert(text))
+        _alert_tasks.add(task)
+        task.add_done_callback(_alert_tasks.discard)
@@ -26,6 +26,8 @@ from app.ncr.services import NCRService
 from app.ncr.dependencies import get_ncr_service
 from app.core.security import authenticate
 from app.users.models import User
+from app.utils.export import ExportFormat
+from app.utils.serializer import typed_response
 from app.utils.upload import save_file
 
 router = APIRouter()
@@ -53,18 +55,36 @@ async def get_all_ncrs(
     sort: Optional[str] = None,
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     ncr_service: NCRService = Depends(get_ncr_service),
 ):
     ncrs = await ncr_service.get_all_ncrs(
-        filters, sort, from_date, to_date, page, page_size
+        filters,
+        sort,
+        from_date,
+        to_date,
+        page,
+        page_size,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+        include=include,
     )
-    return Response(
-        message="NCRs fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=ncrs,
+    return typed_response(
+        Response[NCRListResponse],
+        Response(
+            message="NCRs fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=ncrs,
+        ),
+        sparse=bool(fields),
+        exclude_unset=include is not None,
     )
 
 
@@ -72,28 +92,42 @@ async def get_all_ncrs(
 async def export_all_ncrs(
     filters: Optional[str] = None,
     sort: Optional[str] = None,
+    format: Optional[ExportFormat] = None,
+    fields: Optional[str] = None,
     ncr_service: NCRService = Depends(get_ncr_service),
 ):
-    ncrs = await ncr_service.export_all_ncrs(filters, sort)
-    return Response(
-        message="NCRs fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=ncrs,
+    if format:
+        return ncr_service.stream_ncrs(format, filters, sort)
+
+    ncrs = await ncr_service.export_all_ncrs(filters, sort, fields)
+    return typed_response(
+        Response[list[NCRResponse]],
+        Response(
+            message="NCRs fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=ncrs,
+        ),
+        sparse=bool(fields),
     )
 
 
 @router.get("/{ncr_id}", response_model=Response[NCRResponse])
 async def get_ncr(
     ncr_id: UUID,
+    fields: Optional[str] = None,
     ncr_service: NCRService = Depends(get_ncr_service),
 ):
-    ncr = await ncr_service.get_ncr(ncr_id)
-    return Response(
-        message="NCR fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=ncr,
+    ncr = await ncr_service.get_ncr(ncr_id, fields)
+    return typed_response(
+        Response[NCRResponse],
+        Response(
+            message="NCR fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=ncr,
+        ),
+        sparse=bool(fields),
     )
 
 
@@ -0,0 +1,122 @@
+from typing import Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit.models import Audit
+from app.audit_info.models import AuditInfo
+from app.ncr.models import NCR, NCRFact
+from app.settings.models import Company, Department, Plant
+
+# Keeps the ``IN (...)`` list of a bulk refresh well below asyncpg's
+# 32767 bind-parameter limit.
+REFRESH_CHUNK_SIZE = 5000
+
+
+def _days_between(end, start):
+    return func.extract("epoch", end - start) / 86400
+
+
+def ncr_fact_select(*criteria):
+    """SELECT producing ``ncr_fact`` rows for every NCR matching ``criteria``."""
+    return (
+        select(
+            NCR.id,
+            NCR.ref,
+            NCR.status,
+            NCR.mode,
+            NCR.type,
+            NCR.repeat,
+            NCR.root_cause,
+            NCR.rejected_reson,
+            func.coalesce(NCR.rejected_count, 0),
+            NCR.main_clause,
+            NCR.sub_clause,
+            NCR.ss_clause,
+            NCR.created_at,
+            NCR.expected_date_of_completion,
+            NCR.actual_date_of_completion,
+            NCR.edc_given_date,
+            NCR.closed_on,
+            _days_between(NCR.actual_date_of_completion, NCR.created_at),
+            _days_between(NCR.actual_date_of_completion, NCR.edc_given_date),
+            AuditInfo.id,
+            Audit.id,
+            Audit.ref,
+            Audit.type,
+            Company.id,
+            Company.name,
+            Plant.id,
+            Plant.name,
+            Department.id,
+            Department.name,
+        )
+        .join(AuditInfo, AuditInfo.id == NCR.audit_info_id)
+        .join(Audit, Audit.id == AuditInfo.audit_id)
+        .join(Plant, Plant.id == Audit.plant_id)
+        .join(Company, Company.id == Plant.company_id)
+        .join(Department, Department.id == AuditInfo.department_id)
+        .where(*criteria)
+    )
+
+
+FACT_COLUMNS = [
+    "ncr_id",
+    "ref",
+    "status",
+    "mode",
+    "type",
+    "repeat",
+    "root_cause",
+    "rejected_reson",
+    "rejected_count",
+    "main_clause",
+    "sub_clause",
+    "ss_clause",
+    "created_at",
+    "expected_date_of_completion",
+    "actual_date_of_completion",
+    "edc_given_date",
+    "closed_on",
+    "closure_days",
+    "overdue_days",
+    "audit_info_id",
+    "audit_id",
+    "audit_ref",
+    "audit_type",
+    "company_id",
+    "company_name",
+    "plant_id",
+    "plant_name",
+    "department_id",
+    "department_name",
+]
+
+
+async def refresh_ncr_facts(session: AsyncSession, *criteria) -> None:
+    """Upsert the ``ncr_fact`` rows of the NCRs matching ``criteria``.
+
+    Runs inside the caller's transaction so the fact rows are committed (or
+    rolled back) together with the change that made them stale.
+    """
+    await session.flush()
+
+    stmt = insert(NCRFact.__table__).from_select(
+        FACT_COLUMNS, ncr_fact_select(*criteria)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NCRFact.__table__.c.ncr_id],
+        set_={
+            name: stmt.excluded[name] for name in FACT_COLUMNS if name != "ncr_id"
+        },
+    )
+    await session.execute(stmt)
+
+
+async def refresh_ncr_facts_by_ref(session: AsyncSession, refs: Iterable[str]) -> None:
+    refs = list(dict.fromkeys(refs))
+    for start in range(0, len(refs), REFRESH_CHUNK_SIZE):
+        await refresh_ncr_facts(
+            session, NCR.ref.in_(refs[start : start + REFRESH_CHUNK_SIZE])
+        )
@@ -5,9 +5,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy import Column, ForeignKey
-from sqlmodel import Field, Relationship
+from sqlalchemy import Column, ForeignKey, Index
+from sqlmodel import Field, Relationship, SQLModel
 from app.core.schemas import BaseModel
+from app.utils.text_search import add_search_vector, add_trigram_indexes
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 
@@ -39,13 +40,13 @@ class NCRTeamRole(str, Enum):
 class NCRTeam(BaseModel, table=True):
     user_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     user: "User" = Relationship(back_populates="ncr_teams")
     ncr_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     ncr: "NCR" = Relationship(back_populates="team")
@@ -58,7 +59,7 @@ class NCRFileType(str, Enum):
 class NCRFiles(BaseModel, table=True):
         ncr_id : UUID = Field(
             sa_column=Column(
-                PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False
+                PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False, index=True
             )
         )
         ncr: "NCR" = Relationship(back_populates="files")
@@ -66,7 +67,9 @@ class NCRFiles(BaseModel, table=True):
         file_type: NCRFileType
     
 class NCR(BaseModel, table=True):
-    ref: str
+    __table_args__ = (Index("ix_ncr_created_at", "created_at"),)
+
+    ref: str = Field(index=True)
     status: NCRStatus = Field(default=NCRStatus.CREATED)
     mode : NCRMode = Field(default=NCRMode.NCR)
     shift : str
@@ -74,7 +77,7 @@ class NCR(BaseModel, table=True):
     repeat : bool = Field(default=False)
     audit_info_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     audit_info: "AuditInfo" = Relationship(back_populates="ncrs")
@@ -118,13 +121,75 @@ class NCR(BaseModel, table=True):
         sa_relationship_kwargs={"cascade": "all, delete-orphan"},
     )
 
+
+add_search_vector(
+    NCR,
+    {
+        "ref": "A",
+        "description": "B",
+        "objective_evidence": "B",
+        "root_cause": "C",
+        "requirement": "D",
+    },
+)
+add_trigram_indexes(NCR, "ref", "description", "objective_evidence", "root_cause")
+
+
+class NCRFact(SQLModel, table=True):
+    """Denormalised, one-row-per-NCR copy used by the analytics reads.
+
+    Rows are rewritten by ``app.ncr.facts.refresh_ncr_facts`` whenever an NCR
+    (or an entity whose name is copied here) changes. Overdue state depends on
+    ``now()`` and is therefore still derived at query time from
+    ``edc_given_date``.
+    """
+
+    __tablename__ = "ncr_fact"
+
+    ncr_id: UUID = Field(
+        sa_column=Column(
+            PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    ref: str
+    status: NCRStatus = Field(index=True)
+    mode: NCRMode = Field(index=True)
+    type: str
+    repeat: bool = Field(default=False)
+    root_cause: Optional[str] = None
+    rejected_reson: Optional[str] = None
+    rejected_count: int = Field(default=0)
+    main_clause: Optional[str] = None
+    sub_clause: Optional[str] = None
+    ss_clause: Optional[str] = None
+    created_at: datetime = Field(index=True)
+    expected_date_of_completion: Optional[datetime] = None
+    actual_date_of_completion: Optional[datetime] = None
+    edc_given_date: Optional[datetime] = None
+    closed_on: Optional[datetime] = None
+    # (actual_date_of_completion - created_at) in days
+    closure_days: Optional[float] = None
+    # (actual_date_of_completion - edc_given_date) in days, > 0 when late
+    overdue_days: Optional[float] = None
+    audit_info_id: UUID
+    audit_id: UUID
+    audit_ref: str
+    audit_type: str
+    company_id: UUID = Field(index=True)
+    company_name: str
+    plant_id: UUID = Field(index=True)
+    plant_name: str
+    department_id: UUID = Field(index=True)
+    department_name: str
+
+
 class DocumentReference(BaseModel, table=True):
         ref: str
         page: str
         paragraph: str
         ncr_id : UUID = Field(
             sa_column=Column(
-                PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False
+                PG_UUID, ForeignKey("ncr.id", ondelete="CASCADE"), nullable=False, index=True
             )
         )
         ncr: "NCR" = Relationship(back_populates="document_references")
@@ -265,10 +330,12 @@ class NCRResponse(PydanticBaseModel):
     
 
 class NCRListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["NCRResponse"] = []
     
 class NCRDetail(PydanticBaseModel):
@@ -5,22 +5,21 @@ import traceback
 from typing import Optional
 
 from sqlalchemy import and_, case, func, literal, or_, union_all
-from app.audit.models import Audit, AuditResponse
+from app.audit.models import Audit
 from app.audit_info.models import (
     AuditInfo,
-    AuditInfoResponse,
     AuditTeam,
-    AuditTeamResponse,
     AuditTeamRole,
 )
 import pandas as pd
-from sqlalchemy import update, bindparam
 from app.core.config import settings
 from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
 from app.core.mail import send_email
 from app.core.schemas import Response, ResponseStatus
+from app.ncr.facts import refresh_ncr_facts, refresh_ncr_facts_by_ref
 from app.ncr.models import (
     NCR,
+    NCRFact,
     CreateDocumentReferenceRequest,
     DocumentReference,
     NCRClauses,
@@ -33,7 +32,6 @@ from app.ncr.models import (
     NCRStatus,
     NCRTeam,
     NCRTeamCreateRequest,
-    NCRTeamResponse,
     NCRTeamRole,
     NCRUpdateRequest,
     NCRResponse,
@@ -46,36 +44,64 @@ from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy.orm import aliased
 from app.settings.models import (
     Company,
-    CompanyResponse,
-    DepartmentResponse,
     Plant,
-    PlantResponse,
     Department,
 )
-from app.users.models import User, UserResponse
+from app.users.models import User
+from app.utils.background import enqueue_task
 from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
-from app.utils.serializer import to_naive
+from app.utils.bulk_update import format_missing_refs, staged_update
+from app.utils.export import ExportFormat, export_query
+from app.utils.fieldsets import FieldSet
+from app.utils.includes import include_options
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
+from app.utils.serializer import from_orm, to_naive
 from app.audit.models import Audit
 
+# Excel bulk update: column-level conversions
+NCR_STATUSES = {ncr_status.value: ncr_status for ncr_status in NCRStatus}
+NCR_EXCEL_CLAUSE_FIELDS = ("main_clause", "sub_clause", "ss_clause")
+NCR_EXCEL_DATE_FIELDS = (
+    "expected_date_of_completion",
+    "actual_date_of_completion",
+    "edc_given_date",
+    "followup_date",
+    "closed_on",
+    "created_at",
+    "updated_at",
+)
+
+
+# relationships the NCR list loads without `include=`
+NCR_LIST_INCLUDE = (
+    "team.user,document_references,files,"
+    "audit_info.audit.plant.company,audit_info.department,audit_info.team.user"
+)
+
+
+def ncr_load_options(fieldset: Optional[FieldSet] = None) -> list:
+    """Loaders for ``NCRResponse``; only what ``fieldset`` names when given."""
+    if fieldset:
+        return fieldset.load_options(NCR)
+    return [
+        selectinload(NCR.team).options(selectinload(NCRTeam.user)),
+        selectinload(NCR.document_references),
+        selectinload(NCR.files),
+        selectinload(NCR.audit_info).options(
+            selectinload(AuditInfo.audit).options(
+                selectinload(Audit.plant).options(selectinload(Plant.company))
+            ),
+            selectinload(AuditInfo.department),
+            selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
+        ),
+    ]
+
 
 class NCRService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build(
-            [
-                NCR,
-                AuditInfo,
-                AuditTeam,
-                NCRTeam,
-                DocumentReference,
-                NCRFiles,
-                Audit,
-                Plant,
-                Department,
-            ]
-        )
+        self.graph = get_model_graph()
         self.CLAUSE_TYPE_MAP = {
             "MAIN": "MAIN CLAUSE",
             "MAIN CLAUSE": "MAIN CLAUSE",
@@ -173,6 +199,7 @@ class NCRService:
             ss_clause=data.ss_clause,
         )
         self.session.add(ncr_new)
+        await refresh_ncr_facts(self.session, NCR.id == ncr_new.id)
         await self.session.commit()
 
         for document_reference in data.document_references:
@@ -203,7 +230,8 @@ class NCRService:
 
         await self.session.refresh(ncr_new)
 
-        background_tasks.add_task(
+        enqueue_task(
+            background_tasks,
             send_email,
             [auditee.email],
             f"Non-Conformity Raised {ncr_new.ref} by {created_by.name}",
@@ -308,7 +336,8 @@ class NCRService:
             if data.status == NCRStatus.REJECTED:
                 ncr.rejected_count = ncr.rejected_count + 1
                 
-                background_tasks.add_task(
+                enqueue_task(
+                background_tasks,
                 send_email,
                 [auditee.user.email],
                 f"Non-Conformity Rejects {ncr.ref}",
@@ -336,7 +365,8 @@ class NCRService:
             if data.status == NCRStatus.CLOSED:
                 ncr.closed_on = datetime.now()
                 
-                background_tasks.add_task(
+                enqueue_task(
+                background_tasks,
                 send_email,
                 [auditee.user.email],
                 f"Non-Conformity Closed {ncr.ref}",
@@ -409,7 +439,8 @@ class NCRService:
             ncr.edc_given_date = to_naive(data.expected_date_of_completion)
 
             if auditee.user.id == user_id:
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [hod.user.email],
                     f"EDC Submitted for {ncr.ref}",
@@ -433,7 +464,8 @@ class NCRService:
                     },
                 )
 
-                background_tasks.add_task(
+                enqueue_task(
+                    background_tasks,
                     send_email,
                     [auditor.user.email],
                     f"EDC Submitted for {ncr.ref}",
@@ -488,27 +520,18 @@ class NCRService:
                 self.session.add(document_reference)
             await self.session.commit()
 
+        await refresh_ncr_facts(self.session, NCR.id == ncr_id)
         await self.session.commit()
         await self.session.refresh(ncr)
 
         return ncr
 
-    async def get_ncr(self, ncr_id: UUID):
+    async def get_ncr(self, ncr_id: UUID, fields: Optional[str] = None):
+        fieldset = FieldSet.parse(fields, NCRResponse)
         ncr = await self.session.execute(
             select(NCR)
             .where(NCR.id == ncr_id)
-            .options(
-                selectinload(NCR.team).options(selectinload(NCRTeam.user)),
-                selectinload(NCR.document_references),
-                selectinload(NCR.files),
-                selectinload(NCR.audit_info).options(
-                    selectinload(AuditInfo.audit).options(
-                        selectinload(Audit.plant).options(selectinload(Plant.company))
-                    ),
-                    selectinload(AuditInfo.department),
-                    selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
-                ),
-            )
+            .options(*ncr_load_options(fieldset))
         )
         ncr = ncr.scalar_one_or_none()
         if not ncr:
@@ -521,142 +544,9 @@ class NCRService:
                     "data": None,
                 },
             )
-        return NCRResponse(
-            id=ncr.id,
-            created_at=ncr.created_at,
-            ref=ncr.ref,
-            mode=ncr.mode,
-            shift=ncr.shift,
-            type=ncr.type,
-            status=ncr.status,
-            repeat=ncr.repeat,
-            audit_info_id=ncr.audit_info_id,
-            description=ncr.description,
-            objective_evidence=ncr.objective_evidence,
-            requirement=ncr.requirement,
-            main_clause=ncr.main_clause,
-            sub_clause=ncr.sub_clause,
-            ss_clause=ncr.ss_clause,
-            correction=ncr.correction,
-            root_cause=ncr.root_cause,
-            systematic_corrective_action=ncr.systematic_corrective_action,
-            corrective_action_details=ncr.corrective_action_details,
-            expected_date_of_completion=ncr.expected_date_of_completion,
-            actual_date_of_completion=ncr.actual_date_of_completion,
-            edc_given_date=ncr.edc_given_date,
-            remarks=ncr.remarks,
-            followup_observations=ncr.followup_observations,
-            followup_date=ncr.followup_date,
-            rejected_reson=ncr.rejected_reson,
-            rejected_count=ncr.rejected_count,
-            closed_on=ncr.closed_on,
-            files=[
-                NCRFiles(
-                    id=ncr_file.id,
-                    created_at=ncr_file.created_at,
-                    updated_at=ncr_file.updated_at,
-                    path=ncr_file.path,
-                    file_type=ncr_file.file_type,
-                )
-                for ncr_file in ncr.files
-            ],
-            document_references=[
-                DocumentReference(
-                    id=document_reference.id,
-                    created_at=document_reference.created_at,
-                    updated_at=document_reference.updated_at,
-                    ref=document_reference.ref,
-                    page=document_reference.page,
-                    paragraph=document_reference.paragraph,
-                )
-                for document_reference in ncr.document_references
-            ],
-            team=[
-                NCRTeamResponse(
-                    id=ncr_team.id,
-                    user_id=ncr_team.user_id,
-                    ncr_id=ncr.id,
-                    role=ncr_team.role,
-                    user=UserResponse(
-                        id=ncr_team.user_id,
-                        employee_id=ncr_team.user.employee_id,
-                        password=ncr_team.user.password,
-                        email=ncr_team.user.email,
-                        qualification=ncr_team.user.qualification,
-                        designation=ncr_team.user.designation,
-                        is_active=ncr_team.user.is_active,
-                        role=ncr_team.user.role,
-                        departments=[],
-                        name=ncr_team.user.name,
-                    ),
-                )
-                for ncr_team in ncr.team
-            ],
-            audit_info=AuditInfoResponse(
-                id=ncr.audit_info_id,
-                ref=ncr.audit_info.ref,
-                department_id=ncr.audit_info.department_id,
-                department=DepartmentResponse(
-                    id=ncr.audit_info.department.id,
-                    name=ncr.audit_info.department.name,
-                    code=ncr.audit_info.department.code,
-                    created_at=ncr.audit_info.department.created_at,
-                    updated_at=ncr.audit_info.department.updated_at,
-                    slug=ncr.audit_info.department.slug,
-                ),
-                from_date=ncr.audit_info.from_date,
-                to_date=ncr.audit_info.to_date,
-                closed_date=ncr.audit_info.closed_date,
-                status=ncr.audit_info.status,
-                team=[
-                    AuditTeamResponse(
-                        id=audit_team.id,
-                        user_id=audit_team.user_id,
-                        role=audit_team.role,
-                        user=UserResponse(
-                            id=audit_team.user_id,
-                            employee_id=audit_team.user.employee_id,
-                            password=audit_team.user.password,
-                            email=audit_team.user.email,
-                            qualification=audit_team.user.qualification,
-                            designation=audit_team.user.designation,
-                            is_active=audit_team.user.is_active,
-                            role=audit_team.user.role,
-                            departments=[],
-                            name=audit_team.user.name,
-                        ),
-                    )
-                    for audit_team in ncr.audit_info.team
-                ],
-                audit=AuditResponse(
-                    id=ncr.audit_info.audit.id,
-                    ref=ncr.audit_info.audit.ref,
-                    type=ncr.audit_info.audit.type,
-                    schedule=ncr.audit_info.audit.schedule,
-                    created_at=ncr.audit_info.audit.created_at,
-                    updated_at=ncr.audit_info.audit.updated_at,
-                    standard=ncr.audit_info.audit.standard,
-                    start_date=ncr.audit_info.audit.start_date,
-                    end_date=ncr.audit_info.audit.end_date,
-                    plant=PlantResponse(
-                        id=ncr.audit_info.audit.plant.id,
-                        name=ncr.audit_info.audit.plant.name,
-                        code=ncr.audit_info.audit.plant.code,
-                        created_at=ncr.audit_info.audit.plant.created_at,
-                        updated_at=ncr.audit_info.audit.plant.updated_at,
-                        company_id=ncr.audit_info.audit.plant.company.id,
-                        company=CompanyResponse(
-                            id=ncr.audit_info.audit.plant.company.id,
-                            name=ncr.audit_info.audit.plant.company.name,
-                            code=ncr.audit_info.audit.plant.company.code,
-                            created_at=ncr.audit_info.audit.plant.company.created_at,
-                            updated_at=ncr.audit_info.audit.plant.company.updated_at,
-                        ),
-                    ),
-                    plant_id=ncr.audit_info.audit.plant.id,
-                ),
-            ),
-        )
+        if fieldset:
+            return fieldset.project(ncr)
+        return from_orm(NCRResponse, ncr)
 
     async def get_all_ncrs(
         self,
@@ -666,19 +556,17 @@ class NCRService:
         to_date: Optional[datetime] = None,
         page: int = DEFAULT_PAGE,
         page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[str] = None,
+        include: Optional[str] = None,
     ):
-        stmt = select(NCR).options(
-            selectinload(NCR.team).options(selectinload(NCRTeam.user)),
-            selectinload(NCR.document_references),
-            selectinload(NCR.files),
-            selectinload(NCR.audit_info).options(
-                selectinload(AuditInfo.audit).options(
-                    selectinload(Audit.plant).options(selectinload(Plant.company))
-                ),
-                selectinload(AuditInfo.department),
-                selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
-            ),
-        )
+        fieldset = FieldSet.parse(fields, NCRResponse)
+        if fieldset:
+            options = fieldset.load_options(NCR)
+        else:
+            options = include_options(NCR, include, self.graph, NCR_LIST_INCLUDE)
+        stmt = select(NCR).options(*options)
         if from_date:
             form_date = to_naive(from_date)
             stmt = stmt.where(NCR.created_at >= form_date)
@@ -690,181 +578,41 @@ class NCRService:
         if filters:
             stmt = apply_filters(stmt, filters, NCR, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, NCR, self.graph)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size).distinct()
-
-        result = await self.session.execute(stmt)
-        ncrs = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            NCR,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        ncrs = page_result.items
+        if fieldset:
+            return fieldset.page(page_result, page, page_size)
 
         response = NCRListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
-            data=[
-                NCRResponse(
-                    id=ncr.id,
-                    created_at=ncr.created_at,
-                    ref=ncr.ref,
-                    mode=ncr.mode,
-                    shift=ncr.shift,
-                    type=ncr.type,
-                    status=ncr.status,
-                    repeat=ncr.repeat,
-                    audit_info_id=ncr.audit_info_id,
-                    description=ncr.description,
-                    objective_evidence=ncr.objective_evidence,
-                    requirement=ncr.requirement,
-                    main_clause=ncr.main_clause,
-                    sub_clause=ncr.sub_clause,
-                    ss_clause=ncr.ss_clause,
-                    correction=ncr.correction,
-                    root_cause=ncr.root_cause,
-                    systematic_corrective_action=ncr.systematic_corrective_action,
-                    corrective_action_details=ncr.corrective_action_details,
-                    expected_date_of_completion=ncr.expected_date_of_completion,
-                    actual_date_of_completion=ncr.actual_date_of_completion,
-                    edc_given_date=ncr.edc_given_date,
-                    remarks=ncr.remarks,
-                    followup_observations=ncr.followup_observations,
-                    followup_date=ncr.followup_date,
-                    rejected_reson=ncr.rejected_reson,
-                    rejected_count=ncr.rejected_count,
-                    closed_on=ncr.closed_on,
-                    files=[
-                        NCRFiles(
-                            id=ncr_file.id,
-                            created_at=ncr_file.created_at,
-                            updated_at=ncr_file.updated_at,
-                            path=ncr_file.path,
-                            file_type=ncr_file.file_type,
-                        )
-                        for ncr_file in ncr.files
-                    ],
-                    document_references=[
-                        DocumentReference(
-                            id=document_reference.id,
-                            created_at=document_reference.created_at,
-                            updated_at=document_reference.updated_at,
-                            ref=document_reference.ref,
-                            page=document_reference.page,
-                            paragraph=document_reference.paragraph,
-                        )
-                        for document_reference in ncr.document_references
-                    ],
-                    team=[
-                        NCRTeamResponse(
-                            id=ncr_team.id,
-                            user_id=ncr_team.user_id,
-                            ncr_id=ncr.id,
-                            role=ncr_team.role,
-                            user=UserResponse(
-                                id=ncr_team.user_id,
-                                employee_id=ncr_team.user.employee_id,
-                                password=ncr_team.user.password,
-                                email=ncr_team.user.email,
-                                qualification=ncr_team.user.qualification,
-                                designation=ncr_team.user.designation,
-                                is_active=ncr_team.user.is_active,
-                                role=ncr_team.user.role,
-                                departments=[],
-                                name=ncr_team.user.name,
-                            ),
-                        )
-                        for ncr_team in ncr.team
-                    ],
-                    audit_info=AuditInfoResponse(
-                        id=ncr.audit_info_id,
-                        ref=ncr.audit_info.ref,
-                        department_id=ncr.audit_info.department_id,
-                        department=DepartmentResponse(
-                            id=ncr.audit_info.department.id,
-                            name=ncr.audit_info.department.name,
-                            code=ncr.audit_info.department.code,
-                            created_at=ncr.audit_info.department.created_at,
-                            updated_at=ncr.audit_info.department.updated_at,
-                            slug=ncr.audit_info.department.slug,
-                        ),
-                        from_date=ncr.audit_info.from_date,
-                        to_date=ncr.audit_info.to_date,
-                        closed_date=ncr.audit_info.closed_date,
-                        status=ncr.audit_info.status,
-                        team=[
-                            AuditTeamResponse(
-                                id=audit_team.id,
-                                user_id=audit_team.user_id,
-                                role=audit_team.role,
-                                user=UserResponse(
-                                    id=audit_team.user_id,
-                                    employee_id=audit_team.user.employee_id,
-                                    password=audit_team.user.password,
-                                    email=audit_team.user.email,
-                                    qualification=audit_team.user.qualification,
-                                    designation=audit_team.user.designation,
-                                    is_active=audit_team.user.is_active,
-                                    role=audit_team.user.role,
-                                    departments=[],
-                                    name=audit_team.user.name,
-                                ),
-                            )
-                            for audit_team in ncr.audit_info.team
-                        ],
-                        audit=AuditResponse(
-                            id=ncr.audit_info.audit.id,
-                            ref=ncr.audit_info.audit.ref,
-                            type=ncr.audit_info.audit.type,
-                            schedule=ncr.audit_info.audit.schedule,
-                            created_at=ncr.audit_info.audit.created_at,
-                            updated_at=ncr.audit_info.audit.updated_at,
-                            standard=ncr.audit_info.audit.standard,
-                            start_date=ncr.audit_info.audit.start_date,
-                            end_date=ncr.audit_info.audit.end_date,
-                            plant=PlantResponse(
-                                id=ncr.audit_info.audit.plant.id,
-                                name=ncr.audit_info.audit.plant.name,
-                                code=ncr.audit_info.audit.plant.code,
-                                created_at=ncr.audit_info.audit.plant.created_at,
-                                updated_at=ncr.audit_info.audit.plant.updated_at,
-                                company_id=ncr.audit_info.audit.plant.company.id,
-                                company=CompanyResponse(
-                                    id=ncr.audit_info.audit.plant.company.id,
-                                    name=ncr.audit_info.audit.plant.company.name,
-                                    code=ncr.audit_info.audit.plant.company.code,
-                                    created_at=ncr.audit_info.audit.plant.company.created_at,
-                                    updated_at=ncr.audit_info.audit.plant.company.updated_at,
-                                ),
-                            ),
-                            plant_id=ncr.audit_info.audit.plant.id,
-                        ),
-                    ),
-                )
-                for ncr in ncrs
-            ],
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
+            data=from_orm(list[NCRResponse], ncrs),
         )
 
         return response
 
     async def export_all_ncrs(
-        self, filters: Optional[str] = None, sort: Optional[str] = None
+        self,
+        filters: Optional[str] = None,
+        sort: Optional[str] = None,
+        fields: Optional[str] = None,
     ):
-        stmt = select(NCR).options(
-            selectinload(NCR.team).options(selectinload(NCRTeam.user)),
-            selectinload(NCR.document_references),
-            selectinload(NCR.files),
-            selectinload(NCR.audit_info).options(
-                selectinload(AuditInfo.audit).options(
-                    selectinload(Audit.plant).options(selectinload(Plant.company))
-                ),
-                selectinload(AuditInfo.department),
-                selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
-            ),
-        )
+        fieldset = FieldSet.parse(fields, NCRResponse)
+        stmt = select(NCR).options(*ncr_load_options(fieldset))
 
         if filters:
             stmt = apply_filters(stmt, filters, NCR, self.graph)
@@ -874,148 +622,76 @@ class NCRService:
 
         result = await self.session.execute(stmt)
         ncrs = result.scalars().all()
-        response = [
-            NCRResponse(
-                id=ncr.id,
-                ref=ncr.ref,
-                created_at=ncr.created_at,
-                mode=ncr.mode,
-                shift=ncr.shift,
-                type=ncr.type,
-                status=ncr.status,
-                repeat=ncr.repeat,
-                audit_info_id=ncr.audit_info_id,
-                description=ncr.description,
-                objective_evidence=ncr.objective_evidence,
-                requirement=ncr.requirement,
-                main_clause=ncr.main_clause,
-                sub_clause=ncr.sub_clause,
-                ss_clause=ncr.ss_clause,
-                correction=ncr.correction,
-                root_cause=ncr.root_cause,
-                systematic_corrective_action=ncr.systematic_corrective_action,
-                corrective_action_details=ncr.corrective_action_details,
-                expected_date_of_completion=ncr.expected_date_of_completion,
-                actual_date_of_completion=ncr.actual_date_of_completion,
-                edc_given_date=ncr.edc_given_date,
-                remarks=ncr.remarks,
-                followup_observations=ncr.followup_observations,
-                followup_date=ncr.followup_date,
-                rejected_reson=ncr.rejected_reson,
-                rejected_count=ncr.rejected_count,
-                closed_on=ncr.closed_on,
-                files=[
-                    NCRFiles(
-                        id=ncr_file.id,
-                        created_at=ncr_file.created_at,
-                        updated_at=ncr_file.updated_at,
-                        path=ncr_file.path,
-                        file_type=ncr_file.file_type,
-                    )
-                    for ncr_file in ncr.files
-                ],
-                document_references=[
-                    DocumentReference(
-                        id=document_reference.id,
-                        created_at=document_reference.created_at,
-                        updated_at=document_reference.updated_at,
-                        ref=document_reference.ref,
-                        page=document_reference.page,
-                        paragraph=document_reference.paragraph,
-                    )
-                    for document_reference in ncr.document_references
-                ],
-                team=[
-                    NCRTeamResponse(
-                        id=ncr_team.id,
-                        user_id=ncr_team.user_id,
-                        ncr_id=ncr.id,
-                        role=ncr_team.role,
-                        user=UserResponse(
-                            id=ncr_team.user_id,
-                            employee_id=ncr_team.user.employee_id,
-                            password=ncr_team.user.password,
-                            email=ncr_team.user.email,
-                            qualification=ncr_team.user.qualification,
-                            designation=ncr_team.user.designation,
-                            is_active=ncr_team.user.is_active,
-                            role=ncr_team.user.role,
-                            departments=[],
-                            name=ncr_team.user.name,
-                        ),
-                    )
-                    for ncr_team in ncr.team
-                ],
-                audit_info=AuditInfoResponse(
-                    id=ncr.audit_info_id,
-                    ref=ncr.audit_info.ref,
-                    department_id=ncr.audit_info.department_id,
-                    department=DepartmentResponse(
-                        id=ncr.audit_info.department.id,
-                        name=ncr.audit_info.department.name,
-                        code=ncr.audit_info.department.code,
-                        created_at=ncr.audit_info.department.created_at,
-                        updated_at=ncr.audit_info.department.updated_at,
-                        slug=ncr.audit_info.department.slug,
-                    ),
-                    from_date=ncr.audit_info.from_date,
-                    to_date=ncr.audit_info.to_date,
-                    closed_date=ncr.audit_info.closed_date,
-                    status=ncr.audit_info.status,
-                    team=[
-                        AuditTeamResponse(
-                            id=audit_team.id,
-                            user_id=audit_team.user_id,
-                            role=audit_team.role,
-                            user=UserResponse(
-                                id=audit_team.user_id,
-                                employee_id=audit_team.user.employee_id,
-                                password=audit_team.user.password,
-                                email=audit_team.user.email,
-                                qualification=audit_team.user.qualification,
-                                designation=audit_team.user.designation,
-                                is_active=audit_team.user.is_active,
-                                role=audit_team.user.role,
-                                departments=[],
-                                name=audit_team.user.name,
-                            ),
-                        )
-                        for audit_team in ncr.audit_info.team
-                    ],
-                    audit=AuditResponse(
-                        id=ncr.audit_info.audit.id,
-                        ref=ncr.audit_info.audit.ref,
-                        type=ncr.audit_info.audit.type,
-                        schedule=ncr.audit_info.audit.schedule,
-                        created_at=ncr.audit_info.audit.created_at,
-                        updated_at=ncr.audit_info.audit.updated_at,
-                        standard=ncr.audit_info.audit.standard,
-                        start_date=ncr.audit_info.audit.start_date,
-                        end_date=ncr.audit_info.audit.end_date,
-                        plant=PlantResponse(
-                            id=ncr.audit_info.audit.plant.id,
-                            name=ncr.audit_info.audit.plant.name,
-                            code=ncr.audit_info.audit.plant.code,
-                            created_at=ncr.audit_info.audit.plant.created_at,
-                            updated_at=ncr.audit_info.audit.plant.updated_at,
-                            company_id=ncr.audit_info.audit.plant.company.id,
-                            company=CompanyResponse(
-                                id=ncr.audit_info.audit.plant.company.id,
-                                name=ncr.audit_info.audit.plant.company.name,
-                                code=ncr.audit_info.audit.plant.company.code,
-                                created_at=ncr.audit_info.audit.plant.company.created_at,
-                                updated_at=ncr.audit_info.audit.plant.company.updated_at,
-                            ),
-                        ),
-                        plant_id=ncr.audit_info.audit.plant.id,
-                    ),
-                ),
-            )
-            for ncr in ncrs
-        ]
+        if fieldset:
+            return fieldset.project(list(ncrs))
+        response = from_orm(list[NCRResponse], ncrs)
 
         return response
 
+    def ncr_export_row(self, ncr: NCR) -> dict:
+        audit_info = ncr.audit_info
+        audit = audit_info.audit
+        members = {role: [] for role in NCRTeamRole}
+        for member in ncr.team:
+            members[member.role].append(member.user.name)
+        return {
+            "ref": ncr.ref,
+            "created_at": ncr.created_at,
+            "mode": ncr.mode,
+            "status": ncr.status,
+            "type": ncr.type,
+            "shift": ncr.shift,
+            "repeat": ncr.repeat,
+            "company": audit.plant.company.name,
+            "plant": audit.plant.name,
+            "department": audit_info.department.name,
+            "audit_ref": audit.ref,
+            "audit_type": audit.type,
+            "audit_info_ref": audit_info.ref,
+            "created_by": members[NCRTeamRole.CREATED_BY],
+            "auditee": members[NCRTeamRole.AUDITEE],
+            "hod": members[NCRTeamRole.HOD],
+            "followup_auditor": members[NCRTeamRole.FOLLOWUP_AUDITOR],
+            "description": ncr.description,
+            "objective_evidence": ncr.objective_evidence,
+            "requirement": ncr.requirement,
+            "main_clause": ncr.main_clause,
+            "sub_clause": ncr.sub_clause,
+            "ss_clause": ncr.ss_clause,
+            "correction": ncr.correction,
+            "root_cause": ncr.root_cause,
+            "systematic_corrective_action": ncr.systematic_corrective_action,
+            "corrective_action_details": ncr.corrective_action_details,
+            "expected_date_of_completion": ncr.expected_date_of_completion,
+            "actual_date_of_completion": ncr.actual_date_of_completion,
+            "edc_given_date": ncr.edc_given_date,
+            "remarks": ncr.remarks,
+            "followup_observations": ncr.followup_observations,
+            "followup_date": ncr.followup_date,
+            "rejected_reson": ncr.rejected_reson,
+            "rejected_count": ncr.rejected_count,
+            "closed_on": ncr.closed_on,
+        }
+
+    def stream_ncrs(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = None,
+    ):
+        stmt = select(NCR).options(
+            selectinload(NCR.team).options(selectinload(NCRTeam.user)),
+            selectinload(NCR.audit_info).options(
+                selectinload(AuditInfo.audit).options(
+                    selectinload(Audit.plant).options(selectinload(Plant.company))
+                ),
+                selectinload(AuditInfo.department),
+            ),
+        )
+        return export_query(
+            stmt, NCR, self.graph, self.ncr_export_row, format, "ncrs", filters, sort
+        )
+
     async def delete_ncr(self, ncr_id: UUID):
         ncr = await self.session.execute(select(NCR).where(NCR.id == ncr_id))
         ncr = ncr.scalar_one_or_none()
@@ -1301,23 +977,18 @@ class NCRService:
         filters = []
 
         if created_from:
-            filters.append(NCR.created_at >= to_naive(created_from))
+            filters.append(NCRFact.created_at >= to_naive(created_from))
 
         if created_to:
-            filters.append(NCR.created_at <= to_naive(created_to))
+            filters.append(NCRFact.created_at <= to_naive(created_to))
 
         if plant_id:
-            filters.append(Plant.id == plant_id)
+            filters.append(NCRFact.plant_id == plant_id)
 
         audit_refs = (
             (
                 await self.session.execute(
-                    select(Audit.ref)
-                    .join(AuditInfo, Audit.id == AuditInfo.audit_id)
-                    .join(NCR, NCR.audit_info_id == AuditInfo.id)
-                    .join(Plant, Audit.plant_id == Plant.id)
-                    .where(*filters)
-                    .distinct()
+                    select(NCRFact.audit_ref).where(*filters).distinct()
                 )
             )
             .scalars()
@@ -1341,20 +1012,17 @@ class NCRService:
                 select(
                     literal(label).label("ctype"),
                     column.label("cvalue"),
-                    Audit.ref.label("audit_ref"),
-                    func.count(NCR.id).label("cnt"),
+                    NCRFact.audit_ref,
+                    func.count(NCRFact.ncr_id).label("cnt"),
                 )
-                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-                .join(Audit, AuditInfo.audit_id == Audit.id)
-                .join(Plant, Audit.plant_id == Plant.id)
                 .where(column.isnot(None), *filters)
-                .group_by(column, Audit.ref)
+                .group_by(column, NCRFact.audit_ref)
             )
 
         union_agg = union_all(
-            agg_query("MAIN CLAUSE", NCR.main_clause),
-            agg_query("SUB CLAUSE", NCR.sub_clause),
-            agg_query("SUB-SUB CLAUSE", NCR.ss_clause),
+            agg_query("MAIN CLAUSE", NCRFact.main_clause),
+            agg_query("SUB CLAUSE", NCRFact.sub_clause),
+            agg_query("SUB-SUB CLAUSE", NCRFact.ss_clause),
         ).subquery()
 
         agg_rows = (
@@ -1384,20 +1052,18 @@ class NCRService:
                 select(
                     literal(label).label("ctype"),
                     column.label("cvalue"),
-                    Audit.ref.label("audit_ref"),
-                    NCR.ref,
-                    NCR.created_at,
+                    NCRFact.audit_ref,
+                    NCRFact.ref,
+                    NCRFact.created_at,
                     creator.name.label("created_by"),
                     NCR.description,
-                    NCR.status,
+                    NCRFact.status,
                 )
-                .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-                .join(Audit, AuditInfo.audit_id == Audit.id)
-                .join(Plant, Audit.plant_id == Plant.id)
+                .join(NCR, NCR.id == NCRFact.ncr_id)
                 .outerjoin(
                     ncr_team,
                     and_(
-                        ncr_team.ncr_id == NCR.id,
+                        ncr_team.ncr_id == NCRFact.ncr_id,
                         ncr_team.role == NCRTeamRole.CREATED_BY,
                     ),
                 )
@@ -1406,9 +1072,9 @@ class NCRService:
             )
 
         detail_union = union_all(
-            detail_query("MAIN CLAUSE", NCR.main_clause),
-            detail_query("SUB CLAUSE", NCR.sub_clause),
-            detail_query("SUB-SUB CLAUSE", NCR.ss_clause),
+            detail_query("MAIN CLAUSE", NCRFact.main_clause),
+            detail_query("SUB CLAUSE", NCRFact.sub_clause),
+            detail_query("SUB-SUB CLAUSE", NCRFact.ss_clause),
         )
 
         detail_rows = (await self.session.execute(detail_union)).all()
@@ -1421,7 +1087,7 @@ class NCRService:
             created_at,
             created_by,
             desc,
-            status,
+            ncr_status,
         ) in detail_rows:
             key = (ctype, clause)
             if key in master:
@@ -1433,7 +1099,7 @@ class NCRService:
                                 "created_at": created_at,
                                 "created_by": created_by,
                                 "description": desc,
-                                "status": status,
+                                "status": ncr_status,
                             }
                         )
                         break
@@ -1606,7 +1272,7 @@ class NCRService:
             created_at,
             created_by,
             desc,
-            status,
+            ncr_status,
         ) in detail_rows:
             ctype = self.CLAUSE_TYPE_MAP.get(raw_type)
             if not ctype:
@@ -1622,7 +1288,7 @@ class NCRService:
                                 "created_at": created_at,
                                 "created_by": created_by,
                                 "description": desc,
-                                "status": status,
+                                "status": ncr_status,
                             }
                         )
                         break
@@ -1654,7 +1320,7 @@ class NCRService:
         return final_response
 
     def empty_status_counts(self) -> dict[str, int]:
-        return {status: 0 for status in self.ALL_NCR_STATUSES}
+        return {ncr_status: 0 for ncr_status in self.ALL_NCR_STATUSES}
 
     def apply_common_filters(
         self,
@@ -1680,6 +1346,42 @@ class NCRService:
             stmt = stmt.where(NCR.created_at <= to_naive(to_date))
         return stmt
 
+    def apply_fact_filters(
+        self,
+        stmt,
+        company_id: UUID | None = None,
+        plant_id: UUID | None = None,
+        audit_id: UUID | None = None,
+        department_id: UUID | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ):
+        if company_id:
+            stmt = stmt.where(NCRFact.company_id == company_id)
+        if plant_id:
+            stmt = stmt.where(NCRFact.plant_id == plant_id)
+        if audit_id:
+            stmt = stmt.where(NCRFact.audit_id == audit_id)
+        if department_id:
+            stmt = stmt.where(NCRFact.department_id == department_id)
+        if from_date:
+            stmt = stmt.where(NCRFact.created_at >= to_naive(from_date))
+        if to_date:
+            stmt = stmt.where(NCRFact.created_at <= to_naive(to_date))
+        return stmt
+
+    def fact_to_dict(self, fact: NCRFact) -> dict:
+        return {
+            "id": fact.ncr_id,
+            "ref": fact.ref,
+            "status": fact.status,
+            "type": fact.type,
+            "repeat": fact.repeat,
+            "expected_date_of_completion": fact.expected_date_of_completion,
+            "actual_date_of_completion": fact.actual_date_of_completion,
+            "closed_on": fact.closed_on,
+        }
+
     def ncr_to_dict(self, ncr: NCR) -> dict:
         return {
             "id": ncr.id,
@@ -1733,21 +1435,13 @@ class NCRService:
             for dept_id, dept_name in dept_rows
         }
 
-        count_stmt = (
-            select(
-                Department.id.label("department_id"),
-                NCR.status,
-                func.count(NCR.id),
-            )
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Department, AuditInfo.department_id == Department.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-            .group_by(Department.id, NCR.status)
-        )
+        count_stmt = select(
+            NCRFact.department_id,
+            NCRFact.status,
+            func.count(NCRFact.ncr_id),
+        ).group_by(NCRFact.department_id, NCRFact.status)
 
-        count_stmt = self.apply_common_filters(
+        count_stmt = self.apply_fact_filters(
             count_stmt,
             company_id=company_id,
             plant_id=plant_id,
@@ -1757,20 +1451,11 @@ class NCRService:
             to_date=to_date,
         )
 
-        for dept_id, status, count in (await self.session.execute(count_stmt)).all():
-            result[dept_id]["status_counts"][status] = count
+        for dept_id, ncr_status, count in (await self.session.execute(count_stmt)).all():
+            result[dept_id]["status_counts"][ncr_status] = count
 
-        ncr_stmt = (
-            select(NCR, Department.id)
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Department, AuditInfo.department_id == Department.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-        )
-
-        ncr_stmt = self.apply_common_filters(
-            ncr_stmt,
+        ncr_stmt = self.apply_fact_filters(
+            select(NCRFact),
             company_id=company_id,
             plant_id=plant_id,
             audit_id=audit_id,
@@ -1779,8 +1464,8 @@ class NCRService:
             to_date=to_date,
         )
 
-        for ncr, dept_id in (await self.session.execute(ncr_stmt)).all():
-            result[dept_id]["ncrs"].append(self.ncr_to_dict(ncr))
+        for fact in (await self.session.execute(ncr_stmt)).scalars().all():
+            result[fact.department_id]["ncrs"].append(self.fact_to_dict(fact))
 
         return list(result.values())
 
@@ -1793,16 +1478,9 @@ class NCRService:
         to_date: datetime | None = None,
     ) -> list[dict]:
 
-        plant_stmt = (
-            select(Plant.id, Plant.name)
-            .join(Audit, Audit.plant_id == Plant.id)
-            .join(AuditInfo, AuditInfo.audit_id == Audit.id)
-            .join(NCR, NCR.audit_info_id == AuditInfo.id)
-            .join(Company, Plant.company_id == Company.id)
-            .distinct()
-        )
+        plant_stmt = select(NCRFact.plant_id, NCRFact.plant_name).distinct()
 
-        plant_stmt = self.apply_common_filters(
+        plant_stmt = self.apply_fact_filters(
             plant_stmt,
             company_id=company_id,
             from_date=to_naive(from_date),
@@ -1821,20 +1499,13 @@ class NCRService:
             for p_id, p_name in plant_rows
         }
 
-        count_stmt = (
-            select(
-                Plant.id,
-                NCR.status,
-                func.count(NCR.id),
-            )
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-            .group_by(Plant.id, NCR.status)
-        )
+        count_stmt = select(
+            NCRFact.plant_id,
+            NCRFact.status,
+            func.count(NCRFact.ncr_id),
+        ).group_by(NCRFact.plant_id, NCRFact.status)
 
-        count_stmt = self.apply_common_filters(
+        count_stmt = self.apply_fact_filters(
             count_stmt,
             company_id=company_id,
             plant_id=plant_id,
@@ -1843,19 +1514,11 @@ class NCRService:
             to_date=to_date,
         )
 
-        for p_id, status, count in (await self.session.execute(count_stmt)).all():
-            result[p_id]["status_counts"][status] = count
-
-        ncr_stmt = (
-            select(NCR, Plant.id)
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-        )
+        for p_id, ncr_status, count in (await self.session.execute(count_stmt)).all():
+            result[p_id]["status_counts"][ncr_status] = count
 
-        ncr_stmt = self.apply_common_filters(
-            ncr_stmt,
+        ncr_stmt = self.apply_fact_filters(
+            select(NCRFact),
             company_id=company_id,
             plant_id=plant_id,
             audit_id=audit_id,
@@ -1863,8 +1526,8 @@ class NCRService:
             to_date=to_date,
         )
 
-        for ncr, p_id in (await self.session.execute(ncr_stmt)).all():
-            result[p_id]["ncrs"].append(self.ncr_to_dict(ncr))
+        for fact in (await self.session.execute(ncr_stmt)).scalars().all():
+            result[fact.plant_id]["ncrs"].append(self.fact_to_dict(fact))
 
         return list(result.values())
 
@@ -1891,83 +1554,78 @@ class NCRService:
             for c_id, c_name in company_rows
         }
 
-        count_stmt = (
-            select(
-                Company.id,
-                NCR.status,
-                func.count(NCR.id),
-            )
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-            .group_by(Company.id, NCR.status)
-        )
+        count_stmt = select(
+            NCRFact.company_id,
+            NCRFact.status,
+            func.count(NCRFact.ncr_id),
+        ).group_by(NCRFact.company_id, NCRFact.status)
 
-        count_stmt = self.apply_common_filters(
+        count_stmt = self.apply_fact_filters(
             count_stmt,
             company_id=company_id,
             from_date=from_date,
             to_date=to_date,
         )
 
-        for c_id, status, count in (
-            await self.session.execute(count_stmt)
-        ).all():  # noqa: F402
-            result[c_id]["status_counts"][status] = count
-
-        ncr_stmt = (
-            select(NCR, Company.id)
-            .join(AuditInfo, NCR.audit_info_id == AuditInfo.id)
-            .join(Audit, AuditInfo.audit_id == Audit.id)
-            .join(Plant, Audit.plant_id == Plant.id)
-            .join(Company, Plant.company_id == Company.id)
-        )
+        for c_id, ncr_status, count in (await self.session.execute(count_stmt)).all():
+            result[c_id]["status_counts"][ncr_status] = count
 
-        ncr_stmt = self.apply_common_filters(
-            ncr_stmt,
+        ncr_stmt = self.apply_fact_filters(
+            select(NCRFact),
             company_id=company_id,
             from_date=from_date,
             to_date=to_date,
         )
 
-        for ncr, c_id in (await self.session.execute(ncr_stmt)).all():
-            result[c_id]["ncrs"].append(self.ncr_to_dict(ncr))
+        for fact in (await self.session.execute(ncr_stmt)).scalars().all():
+            result[fact.company_id]["ncrs"].append(self.fact_to_dict(fact))
 
         return list(result.values())
 
     def _normalize_column(self, col: str) -> str:
         return col.strip().lower().replace(" ", "_")
 
-    def _parse_value(self, field_name: str, value):
-        if pd.isna(value):
-            return None
+    def _parse_column(self, field_name: str, column: pd.Series):
+        """
+        Convert a whole Excel column for the NCR bulk update.
+
+        Returns the values as Python objects (``None`` for blanks) and a mask
+        of the non-blank cells that could not be converted.
+        """
+        present = column.notna()
+        failed = pd.Series(False, index=column.index)
 
         if field_name == "status":
-            return NCRStatus(str(value).strip().upper())
+            values = column.astype(str).str.strip().str.upper().map(NCR_STATUSES)
+            failed = present & values.isna()
+
+        elif field_name == "repeat":
+            values = column.astype(str).str.strip().str.upper().eq("YES")
 
-        if field_name == "repeat":
-            return str(value).strip().upper() == "YES"
+        elif field_name == "rejected_count":
+            numbers = pd.to_numeric(column, errors="coerce")
+            failed = present & numbers.isna()
+            values = numbers.dropna().astype("int64").astype(object)
+            values = values.reindex(column.index)
 
-        if field_name == "rejected_count":
-            return int(value)
+        elif field_name in NCR_EXCEL_CLAUSE_FIELDS:
+            values = column.astype(str)
 
-        if field_name in [
-            "expected_date_of_completion",
-            "actual_date_of_completion",
-            "edc_given_date",
-            "followup_date",
-            "closed_on",
-        ]:
-            return pd.to_datetime(value)
+        elif field_name in NCR_EXCEL_DATE_FIELDS:
+            # unparseable dates clear the column, as before
+            values = pd.to_datetime(column, errors="coerce", format="mixed")
 
-        return value
+        else:
+            values = column
+
+        values = values.astype(object).where(present & values.notna(), None)
+        return values, failed
 
     async def upload_excel_in_background(
         self, background_tasks: BackgroundTasks, file: bytes, user_id: UUID
     ):
         logging.info("NCR Excel upload scheduled in background task")
-        background_tasks.add_task(self.upload_excel, file, user_id)
+        enqueue_task(background_tasks, self.upload_excel, file, user_id)
 
         return Response(
             message="NCR Excel upload is in progress.",
@@ -1998,105 +1656,62 @@ class NCRService:
 
             logging.info(f"Excel loaded successfully. Total rows: {total_rows}")
 
-            update_payload = []
-
-            for index, row in df.iterrows():
-                ref = row.get("Reference")
-
-                if not ref:
-                    skipped_rows += 1
-                    continue
-
-                row_data = {"ref_param": ref}
-                processed_rows += 1
-
-                for col in df.columns:
-                    if col == "Reference":
-                        continue
+            df.columns = [self._normalize_column(str(col)) for col in df.columns]
 
-                    field_name = col.strip().lower().replace(" ", "_")
+            if "reference" in df.columns:
+                refs = df["reference"].astype(str).str.strip()
+                has_ref = df["reference"].notna() & refs.ne("")
+            else:
+                refs = pd.Series("", index=df.index)
+                has_ref = pd.Series(False, index=df.index)
 
-                    if field_name not in NCR.model_fields:
-                        continue
+            processed_rows = int(has_ref.sum())
+            skipped_rows = total_rows - processed_rows
 
-                    value = row[col]
-
-                    if pd.isna(value):
-                        continue
-
-                    try:
-                        if field_name == "status":
-                            value = NCRStatus(str(value).strip().upper())
-
-                        elif field_name == "repeat":
-                            value = str(value).strip().upper() == "YES"
-
-                        elif field_name == "rejected_count":
-                            value = int(value)
-
-                        elif field_name in ["main_clause", "sub_clause", "ss_clause"]:
-                            value = str(value)
-
-                        elif field_name in [
-                            "expected_date_of_completion",
-                            "actual_date_of_completion",
-                            "edc_given_date",
-                            "followup_date",
-                            "closed_on",
-                            "created_at",
-                            "updated_at",
-                        ]:
-                            parsed_date = pd.to_datetime(value, errors="coerce")
-                            value = (
-                                parsed_date.to_pydatetime()
-                                if not pd.isna(parsed_date)
-                                else None
-                            )
+            # a column is updated when at least one row provides it; rows
+            # leaving it blank set it to NULL
+            columns = {}
+            provided = pd.Series(False, index=df.index)
+            for field_name in df.columns:
+                if field_name == "reference" or field_name not in NCR.model_fields:
+                    continue
 
-                    except Exception:
-                        failed_rows += 1
-                        continue
+                values, failed = self._parse_column(field_name, df[field_name])
+                failed &= has_ref
+                failed_rows += int(failed.sum())
 
-                    row_data[field_name] = value
+                cells = has_ref & df[field_name].notna() & ~failed
+                if not cells.any():
+                    continue
 
-                if len(row_data) > 1:
-                    update_payload.append(row_data)
+                columns[field_name] = values
+                provided |= cells
 
-            if not update_payload:
+            rows = has_ref & provided
+            if not rows.any():
                 logging.warning("No valid rows found.")
                 return
 
-            update_columns = set()
-            for row in update_payload:
-                update_columns.update(row.keys())
-
-            update_columns.discard("ref_param")
+            payload = pd.DataFrame(columns, index=df.index)[rows]
+            payload.insert(0, "ref_param", refs[rows])
+            update_payload = payload.to_dict("records")
 
-            for row in update_payload:
-                for col in update_columns:
-                    row.setdefault(col, None)
-
-            # sanitize NaT / nan
-            for row in update_payload:
-                for key, value in row.items():
-                    if pd.isna(value):
-                        row[key] = None
-
-            update_stmt = (
-                update(NCR.__table__)
-                .where(NCR.__table__.c.ref == bindparam("ref_param"))
-                .values({col: bindparam(col) for col in update_columns})
+            staged = await staged_update(self.session, NCR.__table__, update_payload)
+            await refresh_ncr_facts_by_ref(
+                self.session,
+                staged.matched
+                + (payload["ref"].dropna().tolist() if "ref" in payload else []),
             )
-
-            result = await self.session.execute(update_stmt, update_payload)
             await self.session.commit()
 
-            updated_rows = result.rowcount
+            updated_rows = len(staged.matched)
 
             execution_time = round(time.time() - start_time, 2)
 
             logging.info("========== NCR EXCEL UPLOAD COMPLETED ==========")
             logging.info(f"Updated Rows: {updated_rows}")
+            if staged.missing:
+                logging.warning(f"References not found: {staged.missing}")
 
             await send_email(
                 [user.email],
@@ -2108,6 +1723,7 @@ class NCRService:
                         f"<p><strong>Total Rows:</strong> {total_rows}</p>"
                         f"<p><strong>Processed Rows:</strong> {processed_rows}</p>"
                         f"<p><strong>Updated Rows:</strong> {updated_rows}</p>"
+                        f"<p><strong>Missing References:</strong> {format_missing_refs(staged.missing)}</p>"
                         f"<p><strong>Skipped Rows:</strong> {skipped_rows}</p>"
                         f"<p><strong>Failed Rows:</strong> {failed_rows}</p>"
                         f"<p><strong>Execution Time:</strong> {execution_time} seconds</p>"
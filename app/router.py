@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from app.core.query_stats import bind_route
 from app.users.api import router as users_router
 from app.settings.api import router as settings_router
 from app.auth.api import router as auth_router
@@ -12,8 +13,10 @@ from app.documents.api import router as documents_router
 from app.dashboard.api import router as dashboard_router
 from app.checklist.api import router as checklist_router
 from app.suggestions.api import router as suggestions_router
+from app.search.api import router as search_router
+from app.debug.api import router as debug_router
 
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", dependencies=[Depends(bind_route)])
 
 routers_config = {
     "auth_router": {
@@ -83,6 +86,16 @@ routers_config = {
         "prefix": "files",
         "tags": ["files"],
     },
+    "search_router": {
+        "router": search_router,
+        "prefix": "search",
+        "tags": ["search"],
+    },
+    "debug_router": {
+        "router": debug_router,
+        "prefix": "debug",
+        "tags": ["debug"],
+    },
 }
 
 for config in routers_config.values():
@@ -0,0 +1,29 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.schemas import Response, ResponseStatus
+from app.core.security import authenticate
+from app.search.dependencies import get_search_service
+from app.search.models import SearchEntity, SearchResponse
+from app.search.services import SEARCH_DEFAULT_LIMIT, SearchService
+from app.users.models import User
+
+router = APIRouter()
+
+
+@router.get("", response_model=Response[SearchResponse])
+async def search(
+    q: str,
+    entities: Optional[List[SearchEntity]] = Query(None),
+    limit: int = SEARCH_DEFAULT_LIMIT,
+    service: SearchService = Depends(get_search_service),
+    user: User = Depends(authenticate),
+):
+    data = await service.search(q, entities=entities, limit=limit)
+    return Response(
+        message="Search results retrieved successfully",
+        status=ResponseStatus.SUCCESS,
+        data=data,
+        success=True,
+    )
@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.search.services import SearchService
+from app.core.database import get_session
+
+async def get_search_service(
+    session: AsyncSession = Depends(get_session),
+) -> SearchService:
+    return SearchService(session=session)
@@ -0,0 +1,28 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel as PydanticBaseModel
+
+
+class SearchEntity(str, Enum):
+    NCR = "ncr"
+    SUGGESTION = "suggestion"
+    AUDITORS_CHECKLIST_ITEM = "auditors_checklist_item"
+    OBSERVATION_CHECKLIST_ITEM = "observation_checklist_item"
+
+
+class SearchHit(PydanticBaseModel):
+    entity: SearchEntity
+    id: UUID
+    parent_id: Optional[UUID] = None
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+    created_at: datetime
+
+
+class SearchResponse(PydanticBaseModel):
+    query: str
+    hits: List[SearchHit]
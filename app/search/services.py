@@ -0,0 +1,130 @@
+from typing import NamedTuple, Optional, Sequence, Type
+
+from fastapi import HTTPException, status
+from sqlalchemy import String, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from app.checklist.models import (
+    InternalAuditObservationChecklistItem,
+    InternalAuditorsChecklistItem,
+)
+from app.ncr.models import NCR
+from app.search.models import SearchEntity, SearchHit, SearchResponse
+from app.suggestions.models import Suggestion
+from app.utils.text_search import SEARCH_REGCONFIG, SEARCH_VECTOR, search_query
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SNIPPET_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=5, FragmentDelimiter= … "
+
+
+class SearchTarget(NamedTuple):
+    entity: SearchEntity
+    model: Type[SQLModel]
+    title: str
+    body: str
+    parent: str
+    # trigram-indexed column for fragments full-text search misses (refs,
+    # partial words)
+    fuzzy: str
+
+
+SEARCH_TARGETS = {
+    target.entity: target
+    for target in (
+        SearchTarget(SearchEntity.NCR, NCR, "ref", "description", "audit_info_id", "ref"),
+        SearchTarget(
+            SearchEntity.SUGGESTION, Suggestion, "ref", "suggestion", "audit_info_id", "ref"
+        ),
+        SearchTarget(
+            SearchEntity.AUDITORS_CHECKLIST_ITEM,
+            InternalAuditorsChecklistItem,
+            "activity_description",
+            "audit_findings",
+            "checklist_id",
+            "audit_findings",
+        ),
+        SearchTarget(
+            SearchEntity.OBSERVATION_CHECKLIST_ITEM,
+            InternalAuditObservationChecklistItem,
+            "qms_check_point",
+            "observation",
+            "checklist_id",
+            "observation",
+        ),
+    )
+}
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class SearchService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _branch(self, target: SearchTarget, text: str):
+        table = target.model.__table__
+        query = search_query(text)
+        vector = table.c[SEARCH_VECTOR]
+        fuzzy = table.c[target.fuzzy]
+        return select(
+            literal(target.entity.value, String).label("entity"),
+            table.c.id.label("id"),
+            table.c[target.parent].label("parent_id"),
+            table.c[target.title].label("title"),
+            table.c[target.body].label("body"),
+            func.greatest(
+                func.ts_rank_cd(vector, query), func.word_similarity(text, fuzzy)
+            ).label("rank"),
+            table.c.created_at.label("created_at"),
+        ).where(
+            vector.op("@@")(query)
+            | fuzzy.ilike(f"%{_escape_like(text)}%", escape="/")
+        )
+
+    async def search(
+        self,
+        q: str,
+        entities: Optional[Sequence[SearchEntity]] = None,
+        limit: int = SEARCH_DEFAULT_LIMIT,
+    ) -> SearchResponse:
+        text = (q or "").strip()
+        if not text:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "message": "Search query is required",
+                    "success": False,
+                    "status": status.HTTP_400_BAD_REQUEST,
+                    "data": None,
+                },
+            )
+        limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+        targets = [SEARCH_TARGETS[e] for e in (entities or SEARCH_TARGETS)]
+
+        # rank and cut to `limit` first so snippets are only built for the
+        # rows returned
+        ranked = union_all(*(self._branch(t, text) for t in targets)).subquery()
+        top = (
+            select(ranked)
+            .order_by(ranked.c.rank.desc(), ranked.c.created_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = select(
+            top.c.entity,
+            top.c.id,
+            top.c.parent_id,
+            top.c.title,
+            func.ts_headline(
+                SEARCH_REGCONFIG, top.c.body, search_query(text), SNIPPET_OPTIONS
+            ).label("snippet"),
+            top.c.rank,
+            top.c.created_at,
+        ).order_by(top.c.rank.desc(), top.c.created_at.desc())
+
+        rows = (await self.session.execute(stmt)).mappings().all()
+        return SearchResponse(query=text, hits=[SearchHit(**row) for row in rows])
@@ -9,15 +9,15 @@ class UserDepartment(SQLModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     user_id: UUID = Field(
-        sa_column=Column(PG_UUID, ForeignKey("user.id", ondelete="CASCADE"))
+        sa_column=Column(PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), index=True)
     )
 
     department_id: UUID = Field(
-        sa_column=Column(PG_UUID, ForeignKey("department.id", ondelete="CASCADE"))
+        sa_column=Column(PG_UUID, ForeignKey("department.id", ondelete="CASCADE"), index=True)
     )
 
     role_id: UUID = Field(
-        sa_column=Column(PG_UUID, ForeignKey("userrole.id", ondelete="CASCADE"))
+        sa_column=Column(PG_UUID, ForeignKey("userrole.id", ondelete="CASCADE"), index=True)
     )
 
     user: "User" = Relationship(back_populates="departments")
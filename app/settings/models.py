@@ -21,7 +21,7 @@ class Plant(BaseModel, table=True):
     code: str
     company_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("company.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("company.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     company: Company = Relationship(back_populates="plants")
@@ -41,7 +41,7 @@ class Department(BaseModel, table=True):
 
     plant_id: UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("plant.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("plant.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
 
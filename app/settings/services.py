@@ -5,15 +5,15 @@ from sqlmodel import select
 from fastapi import HTTPException, status
 from uuid import UUID
 
+from app.ncr.facts import refresh_ncr_facts
 from app.utils.dsl_filter import apply_filters, apply_sort
-from app.utils.model_graph import ModelGraph
+from app.utils.model_graph import get_model_graph
 
 
 class SettingsService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build([Company, Plant, Department])
+        self.graph = get_model_graph()
 
     async def create_company(self, request: CompanyRequest):
 
@@ -116,6 +116,7 @@ class SettingsService:
             )
         company.name = request.name
         company.code = request.code
+        await refresh_ncr_facts(self.session, Company.id == company.id)
         await self.session.commit()
         return company
 
@@ -236,6 +237,7 @@ class SettingsService:
             )
         plant.name = request.name
         plant.code = request.code
+        await refresh_ncr_facts(self.session, Plant.id == plant.id)
         await self.session.commit()
         return plant
 
@@ -357,7 +359,7 @@ class SettingsService:
         plant = await self.get_plant_by_id(department.plant_id)
         department.slug = plant.company.code + "-" + plant.code + "-" + request.code
 
-
+        await refresh_ncr_facts(self.session, Department.id == department.id)
         await self.session.commit()
         return department
 
@@ -11,6 +11,8 @@ from app.suggestions.dependencies import get_suggestion_service
 from app.suggestions.models import Suggestion, SuggestionCreateRequest, SuggestionListResponse, SuggestionResponse, SuggestionTeam, SuggestionTeamCreateRequest, SuggestionUpdateRequest
 from app.suggestions.services import SuggestionService
 from app.users.models import User
+from app.utils.export import ExportFormat
+from app.utils.serializer import typed_response
 
 router = APIRouter()
 
@@ -24,6 +26,9 @@ async def get_all_suggestions(
     to_date: Optional[datetime] = None,
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    include: Optional[str] = None,
 ):
     data = await service.get_all_suggestions(
         filters=filters,
@@ -32,13 +37,20 @@ async def get_all_suggestions(
         to_date=to_date,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+        include=include,
     )
     
-    return Response(
-        message="Suggestions retrieved successfully",
-        status=ResponseStatus.SUCCESS,
-        data=data,
-        success=True,
+    return typed_response(
+        Response[SuggestionListResponse],
+        Response(
+            message="Suggestions retrieved successfully",
+            status=ResponseStatus.SUCCESS,
+            data=data,
+            success=True,
+        ),
+        exclude_unset=include is not None,
     )
 
 
@@ -88,6 +100,18 @@ async def delete_suggestion(
         success=True,
     )
     
+@router.get("/export")
+async def stream_suggestions(
+    service: SuggestionService = Depends(get_suggestion_service),
+    format: ExportFormat = ExportFormat.CSV,
+    filters: Optional[str] = None,
+    sort: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+):
+    return service.stream_suggestions(format, filters, sort, from_date, to_date)
+
+
 @router.get("/export/all", response_model=Response[List[SuggestionResponse]])
 async def export_all_suggestions(
     service: SuggestionService = Depends(get_suggestion_service),
@@ -1,12 +1,13 @@
 
-from pydantic import BaseModel as PydanticBaseModel,RootModel
+from pydantic import AliasChoices, BaseModel as PydanticBaseModel,RootModel
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlmodel import Field, Relationship
 from app.core.schemas import BaseModel
+from app.utils.text_search import add_search_vector, add_trigram_indexes
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 
@@ -26,25 +27,27 @@ class SuggestionStatus(str, Enum):
 class SuggestionTeam(BaseModel, table=True):
     user_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     user: "User" = Relationship(back_populates="suggestion_teams")
     suggestion_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("suggestion.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("suggestion.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     suggestion: "Suggestion" = Relationship(back_populates="team")
     role : SuggestionTeamRole = Field(default=SuggestionTeamRole.CREATED_BY)
-    
+
 
 class Suggestion(BaseModel,table=True):
-    ref: str
+    __table_args__ = (Index("ix_suggestion_created_at", "created_at"),)
+
+    ref: str = Field(index=True)
     status: SuggestionStatus = Field(default=SuggestionStatus.CREATED)
     audit_info_id : UUID = Field(
         sa_column=Column(
-            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False
+            PG_UUID, ForeignKey("auditinfo.id", ondelete="CASCADE"), nullable=False, index=True
         )
     )
     audit_info: "AuditInfo" = Relationship(back_populates="suggestions")
@@ -56,8 +59,14 @@ class Suggestion(BaseModel,table=True):
         back_populates="suggestion",
         sa_relationship_kwargs={"cascade": "all, delete-orphan"},
     )
-    
-    
+
+
+add_search_vector(
+    Suggestion, {"ref": "A", "suggestion": "B", "corrective_action": "C"}
+)
+add_trigram_indexes(Suggestion, "ref", "suggestion")
+
+
 class SuggestionCreateRequest(PydanticBaseModel):
     audit_info_id : UUID
     suggestion: str
@@ -80,7 +89,8 @@ class SuggestionTeamResponse(PydanticBaseModel):
     id: UUID
     user_id : UUID
     role : SuggestionTeamRole
-    ncr_id : UUID
+    # the suggestion's id, read from SuggestionTeam.suggestion_id
+    ncr_id : UUID = Field(validation_alias=AliasChoices("ncr_id", "suggestion_id"))
     user : Optional["UserResponse"] = None
     
     
@@ -98,10 +108,12 @@ class SuggestionResponse(PydanticBaseModel):
     created_at : datetime
     
 class SuggestionListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data : list["SuggestionResponse"] = []
     
     
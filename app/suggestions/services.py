@@ -4,12 +4,12 @@ import time
 import traceback
 from fastapi import BackgroundTasks, HTTPException, status
 import pandas as pd
-from sqlalchemy import bindparam, func, select, update
+from sqlalchemy import func, select
 from app.audit.models import Audit
 from app.audit_info.models import AuditInfo, AuditTeam, AuditTeamRole
 from app.core.mail import send_email
 from app.core.schemas import Response, ResponseStatus
-from app.settings.models import Department, Plant
+from app.settings.models import Plant
 from app.suggestions.models import (
     Suggestion,
     SuggestionCreateRequest,
@@ -19,10 +19,15 @@ from app.suggestions.models import (
     SuggestionStatus
 )
 from typing import Optional
-from app.utils.model_graph import ModelGraph
+from app.utils.background import enqueue_task
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 from app.utils.dsl_filter import apply_filters, apply_sort
+from app.utils.bulk_update import format_missing_refs, staged_update
+from app.utils.export import ExportFormat, export_query
+from app.utils.includes import include_options
 from app.audit.models import AuditResponse
 from app.audit_info.models import (
     AuditInfoResponse,
@@ -41,24 +46,19 @@ from app.suggestions.models import (
 )
 from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
 from app.users.models import User, UserResponse
-from app.utils.serializer import to_naive
+from app.utils.serializer import from_orm, to_naive
 from app.core.config import settings
 
+# relationships the list loads without `include=`
+SUGGESTION_LIST_INCLUDE = (
+    "audit_info.department,audit_info.team.user,audit_info.audit.plant.company,team.user"
+)
+
+
 class SuggestionService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build(
-            [
-                Suggestion,
-                SuggestionTeam,
-                AuditInfo,
-                AuditTeam,
-                Audit,
-                Plant,
-                Department,
-            ]
-        )
+        self.graph = get_model_graph()
 
     async def create_suggestion(self, data: SuggestionCreateRequest, user_id: UUID,background_tasks: BackgroundTasks):
         audit_info = await self.session.execute(
@@ -120,7 +120,8 @@ class SuggestionService:
         user = await self.session.execute(select(User).where(User.id == user_id))
         user = user.scalar_one_or_none()
         
-        background_tasks.add_task(
+        enqueue_task(
+            background_tasks,
             send_email,
             [auditee_member.user.email],
             f"ARe-Audit Management : Suggestion Raised {suggestion.ref} by {user.name}",
@@ -216,7 +217,8 @@ class SuggestionService:
                 suggestion.actual_date_of_completion = to_naive(datetime.now())
                 
                 if (user_id == hod.user.id):
-                    background_tasks.add_task(
+                    enqueue_task(
+                        background_tasks,
                         send_email,
                         [auditor.user.email],
                         f"ARe-Audit Management : Suggestion Closed {suggestion.ref}",
@@ -238,7 +240,8 @@ class SuggestionService:
                         },
                     )
                     
-                    background_tasks.add_task(
+                    enqueue_task(
+                        background_tasks,
                         send_email,
                         [auditee.user.email],
                         f"ARe-Audit Management : Suggestion Closed - {suggestion.ref}",
@@ -266,7 +269,8 @@ class SuggestionService:
         if data.expected_date_of_completion:
             suggestion.expected_date_of_completion = to_naive(data.expected_date_of_completion)
             
-            background_tasks.add_task(
+            enqueue_task(
+                background_tasks,
                 send_email,
                 [hod.user.email],
                 f"ARe-Audit Management : EDC Updated for Suggestion {suggestion.ref}",
@@ -323,19 +327,12 @@ class SuggestionService:
         to_date: Optional[datetime] = None,
         page: int = DEFAULT_PAGE,
         page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        include: Optional[str] = None,
     ):
         stmt = select(Suggestion).options(
-            selectinload(Suggestion.audit_info).options(
-                selectinload(AuditInfo.department),
-                selectinload(AuditInfo.team).options(selectinload(AuditTeam.user)),
-                   selectinload(AuditInfo.audit).options(
-            selectinload(Audit.plant).options(
-                selectinload(Plant.company)
-            )
-        ),
-            ),
-            
-            selectinload(Suggestion.team).options(selectinload(SuggestionTeam.user)),
+            *include_options(Suggestion, include, self.graph, SUGGESTION_LIST_INCLUDE)
         )
         if from_date:
             from_date = to_naive(from_date)
@@ -345,118 +342,26 @@ class SuggestionService:
             stmt = stmt.where(Suggestion.created_at <= to_naive(to_date))
         if filters:
             stmt = apply_filters(stmt, filters, Suggestion, self.graph)
-        if sort:
-            stmt = apply_sort(stmt, sort, Suggestion, self.graph)
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size).distinct()
-        result = await self.session.execute(stmt)
-        suggestions = result.scalars().all()
+        page_result = await paginate(
+            self.session,
+            stmt,
+            Suggestion,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        suggestions = page_result.items
         response = SuggestionListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
-            data=[
-                SuggestionResponse(
-                    id=suggestion.id,
-                    ref=suggestion.ref,
-                    created_at = suggestion.created_at,
-                    status=suggestion.status,
-                    audit_info_id=suggestion.audit_info_id,
-                    expected_date_of_completion=suggestion.expected_date_of_completion,
-                    actual_date_of_completion=suggestion.actual_date_of_completion,
-                    suggestion=suggestion.suggestion,
-                    corrective_action=suggestion.corrective_action,
-                    audit_info=AuditInfoResponse(
-                        id=suggestion.audit_info_id,
-                        ref=suggestion.audit_info.ref,
-                        department_id=suggestion.audit_info.department_id,
-                        department=DepartmentResponse(
-                            id=suggestion.audit_info.department.id,
-                            name=suggestion.audit_info.department.name,
-                            code=suggestion.audit_info.department.code,
-                            created_at=suggestion.audit_info.department.created_at,
-                            updated_at=suggestion.audit_info.department.updated_at,
-                            slug=suggestion.audit_info.department.slug,
-                        ),
-                        from_date=suggestion.audit_info.from_date,
-                        to_date=suggestion.audit_info.to_date,
-                        closed_date=suggestion.audit_info.closed_date,
-                        status=suggestion.audit_info.status,
-                        team=[
-                            AuditTeamResponse(
-                                id=audit_team.id,
-                                user_id=audit_team.user_id,
-                                role=audit_team.role,
-                                user=UserResponse(
-                                    id=audit_team.user_id,
-                                    employee_id=audit_team.user.employee_id,
-                                    password=audit_team.user.password,
-                                    email=audit_team.user.email,
-                                    qualification=audit_team.user.qualification,
-                                    designation=audit_team.user.designation,
-                                    is_active=audit_team.user.is_active,
-                                    role=audit_team.user.role,
-                                    departments=[],
-                                    name=audit_team.user.name,
-                                ),
-                            )
-                            for audit_team in suggestion.audit_info.team
-                        ],
-                        audit=AuditResponse(
-                            id=suggestion.audit_info.audit.id,
-                            ref=suggestion.audit_info.audit.ref,
-                            type=suggestion.audit_info.audit.type,
-                            schedule=suggestion.audit_info.audit.schedule,
-                            created_at=suggestion.audit_info.audit.created_at,
-                            updated_at=suggestion.audit_info.audit.updated_at,
-                            standard=suggestion.audit_info.audit.standard,
-                            start_date=suggestion.audit_info.audit.start_date,
-                            end_date=suggestion.audit_info.audit.end_date,
-                            plant=PlantResponse(
-                                id=suggestion.audit_info.audit.plant.id,
-                                name=suggestion.audit_info.audit.plant.name,
-                                code=suggestion.audit_info.audit.plant.code,
-                                created_at=suggestion.audit_info.audit.plant.created_at,
-                                updated_at=suggestion.audit_info.audit.plant.updated_at,
-                                company_id=suggestion.audit_info.audit.plant.company.id,
-                                company=CompanyResponse(
-                                    id=suggestion.audit_info.audit.plant.company.id,
-                                    name=suggestion.audit_info.audit.plant.company.name,
-                                    code=suggestion.audit_info.audit.plant.company.code,
-                                    created_at=suggestion.audit_info.audit.plant.company.created_at,
-                                    updated_at=suggestion.audit_info.audit.plant.company.updated_at,
-                                ),
-                            ),
-                            plant_id=suggestion.audit_info.audit.plant.id,
-                        ),
-                    ),
-                    team=[
-                        SuggestionTeamResponse(
-                            id=suggestion_team.id,
-                            user_id=suggestion_team.user_id,
-                            role=suggestion_team.role,
-                            ncr_id=suggestion_team.suggestion_id,
-                            user=UserResponse(
-                                id=suggestion_team.user_id,
-                                employee_id=suggestion_team.user.employee_id,
-                                password=suggestion_team.user.password,
-                                email=suggestion_team.user.email,
-                                qualification=suggestion_team.user.qualification,
-                                designation=suggestion_team.user.designation,
-                                is_active=suggestion_team.user.is_active,
-                                role=suggestion_team.user.role,
-                                departments=[],
-                                name=suggestion_team.user.name,
-                            ),
-                        )
-                        for suggestion_team in suggestion.team
-                    ],
-                )
-                for suggestion in suggestions
-            ],
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
+            data=from_orm(list[SuggestionResponse], suggestions),
         )
         return response
     
@@ -491,7 +396,7 @@ class SuggestionService:
             if sort:
                 stmt = apply_sort(stmt, sort, Suggestion, self.graph)
           
-            result = await self.session.execute(stmt.distinct())
+            result = await self.session.execute(stmt)
             suggestions = result.scalars().all()
             response = [
                     SuggestionResponse(
@@ -528,7 +433,6 @@ class SuggestionService:
                                 user=UserResponse(
                                     id=audit_team.user_id,
                                     employee_id=audit_team.user.employee_id,
-                                    password=audit_team.user.password,
                                     email=audit_team.user.email,
                                     qualification=audit_team.user.qualification,
                                     designation=audit_team.user.designation,
@@ -577,7 +481,6 @@ class SuggestionService:
                             user=UserResponse(
                                 id=suggestion_team.user_id,
                                 employee_id=suggestion_team.user.employee_id,
-                                password=suggestion_team.user.password,
                                 email=suggestion_team.user.email,
                                 qualification=suggestion_team.user.qualification,
                                 designation=suggestion_team.user.designation,
@@ -595,6 +498,65 @@ class SuggestionService:
             
             return response
         
+    def suggestion_export_row(self, suggestion: Suggestion) -> dict:
+        audit_info = suggestion.audit_info
+        audit = audit_info.audit
+        members = {role: [] for role in SuggestionTeamRole}
+        for member in suggestion.team:
+            members[member.role].append(member.user.name)
+        return {
+            "ref": suggestion.ref,
+            "created_at": suggestion.created_at,
+            "status": suggestion.status,
+            "company": audit.plant.company.name,
+            "plant": audit.plant.name,
+            "department": audit_info.department.name,
+            "audit_ref": audit.ref,
+            "audit_info_ref": audit_info.ref,
+            "created_by": members[SuggestionTeamRole.CREATED_BY],
+            "hod": members[SuggestionTeamRole.HOD],
+            "auditee": members[SuggestionTeamRole.AUDITEE],
+            "suggestion": suggestion.suggestion,
+            "corrective_action": suggestion.corrective_action,
+            "expected_date_of_completion": suggestion.expected_date_of_completion,
+            "actual_date_of_completion": suggestion.actual_date_of_completion,
+        }
+
+    def stream_suggestions(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ):
+        stmt = select(Suggestion).options(
+            selectinload(Suggestion.audit_info).options(
+                selectinload(AuditInfo.department),
+                selectinload(AuditInfo.audit).options(
+                    selectinload(Audit.plant).options(selectinload(Plant.company))
+                ),
+            ),
+            selectinload(Suggestion.team).options(selectinload(SuggestionTeam.user)),
+        )
+        from_date = to_naive(from_date)
+        to_date = to_naive(to_date)
+        if from_date:
+            stmt = stmt.where(Suggestion.created_at >= from_date)
+        if to_date:
+            stmt = stmt.where(Suggestion.created_at <= to_date)
+
+        return export_query(
+            stmt,
+            Suggestion,
+            self.graph,
+            self.suggestion_export_row,
+            format,
+            "suggestions",
+            filters,
+            sort,
+        )
+
     async def add_suggestion_team(
         self, team: SuggestionTeamCreateRequest
     ):
@@ -684,7 +646,7 @@ class SuggestionService:
     async def upload_excel_in_background(
         self, background_tasks: BackgroundTasks, file: bytes, user_id: UUID):
         logging.info("[BACKGROUND] Scheduling Excel upload task")
-        background_tasks.add_task(self.upload_excel, file,user_id)
+        enqueue_task(background_tasks, self.upload_excel, file,user_id)
 
         return Response(
             message="Suggestion Excel upload is in progress.",
@@ -777,22 +739,20 @@ class SuggestionService:
                     if pd.isna(value):
                         row[key] = None
 
-            update_stmt = (
-                update(Suggestion.__table__)
-                .where(Suggestion.__table__.c.ref == bindparam("ref_param"))
-                .values({col: bindparam(col) for col in update_columns})
+            staged = await staged_update(
+                self.session, Suggestion.__table__, update_payload
             )
-
-            result = await self.session.execute(update_stmt, update_payload)
             await self.session.commit()
 
-            updated_rows = result.rowcount
+            updated_rows = len(staged.matched)
 
             execution_time = round(time.time() - start_time, 2)
 
             logging.info(
                 f"[STEP 4 DONE] Bulk update complete. Rows affected: {updated_rows}"
             )
+            if staged.missing:
+                logging.warning(f"[STEP 4] References not found: {staged.missing}")
 
             logging.info("========== EXCEL UPLOAD COMPLETED SUCCESSFULLY ==========")
 
@@ -806,6 +766,7 @@ class SuggestionService:
                         f"<p><strong>Total Rows:</strong> {total_rows}</p>"
                         f"<p><strong>Processed Rows:</strong> {processed_rows}</p>"
                         f"<p><strong>Updated Rows:</strong> {updated_rows}</p>"
+                        f"<p><strong>Missing References:</strong> {format_missing_refs(staged.missing)}</p>"
                         f"<p><strong>Skipped Rows:</strong> {skipped_rows}</p>"
                         f"<p><strong>Failed Rows:</strong> {failed_rows}</p>"
                         f"<p><strong>Execution Time:</strong> {execution_time} seconds</p>"
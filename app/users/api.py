@@ -22,6 +22,8 @@ from app.users.models import (
 )
 from app.users.dependencies import get_user_service
 from app.users.services import UserService
+from app.utils.export import ExportFormat
+from app.utils.serializer import typed_response
 
 
 router = APIRouter()
@@ -204,14 +206,29 @@ async def get_all_users(
     sort: Optional[str] = "created_at.desc",
     page: int = DEFAULT_PAGE,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    fields: Optional[str] = None,
     user_service: UserService = Depends(get_user_service),
 ):
-    users = await user_service.get_all_users(filters, sort, page, page_size)
-    return Response(
-        message="Users fetched successfully",
-        status=ResponseStatus.SUCCESS,
-        success=True,
-        data=users,
+    users = await user_service.get_all_users(
+        filters,
+        sort,
+        page,
+        page_size,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+    )
+    return typed_response(
+        Response[UserListResponse],
+        Response(
+            message="Users fetched successfully",
+            status=ResponseStatus.SUCCESS,
+            success=True,
+            data=users,
+        ),
+        sparse=bool(fields),
     )
 
 
@@ -223,8 +240,12 @@ async def get_all_users(
 async def export_users(
     filters: Optional[str] = None,
     sort: Optional[str] = "created_at.desc",
+    format: Optional[ExportFormat] = None,
     user_service: UserService = Depends(get_user_service),
 ):
+    if format:
+        return user_service.stream_users(format, filters, sort)
+
     users = await user_service.export_users(filters, sort)
     return Response(
         message="Users fetched successfully",
@@ -275,15 +296,21 @@ async def get_all_users_by_department(
 
 
 @router.post("/upload/bulk", status_code=status.HTTP_200_OK)
-async def upload(file: UploadFile,background_tasks: BackgroundTasks,_service: UserService = Depends(get_user_service)):
-        print(file)
-        result = await _service.upload_excel_in_background(background_tasks, await file.read())
-        return Response(
-            message="Employees are uploading, It will take sometime..",
-            success=True,
-            status=ResponseStatus.CREATED,
-            data=result,
-        )
+async def upload(
+    file: UploadFile,
+    background_tasks: BackgroundTasks,
+    _service: UserService = Depends(get_user_service),
+    user: User = Depends(authenticate),
+):
+    result = await _service.upload_excel_in_background(
+        background_tasks, await file.read(), user.id
+    )
+    return Response(
+        message="Employees are uploading, the summary will be emailed to you.",
+        success=True,
+        status=ResponseStatus.CREATED,
+        data=result,
+    )
         
         
 @router.get("/roles/all/", response_model=Response[List[RoleResponse]])
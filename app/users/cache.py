@@ -0,0 +1,104 @@
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.settings.links import UserDepartment
+from app.users.models import User, UserRole
+
+
+class PrincipalCache:
+    """
+    Users resolved by ``authenticate``, keyed by token subject (employee id).
+
+    Only column values are kept; every hit builds a fresh detached ``User``
+    so concurrent requests never share an ORM instance.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ):
+        self._entries = TTLCache(max_entries=max_entries, ttl=ttl)
+
+    def get(self, employee_id: str) -> Optional[User]:
+        values = self._entries.get(employee_id)
+        if values is None:
+            return None
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user: User) -> None:
+        values = {
+            column.key: getattr(user, column.key) for column in User.__table__.columns
+        }
+        self._entries.set(user.employee_id, values)
+
+    def invalidate(self, employee_id: str) -> None:
+        self._entries.pop(employee_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache()
+
+# Writes to these tables can change what ``authenticate`` returns.
+TRACKED_TABLES = {
+    model.__tablename__ for model in (User, UserDepartment, UserRole)
+}
+
+_STALE_KEY = "principal_cache_stale"
+_ALL = "*"
+
+
+def _stale(session) -> set:
+    return session.info.setdefault(_STALE_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_stale_on_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            history = inspect(obj).attrs.employee_id.history
+            _stale(session).update(
+                value for value in (obj.employee_id, *history.deleted) if value
+            )
+        elif isinstance(obj, (UserDepartment, UserRole)):
+            # role / department changes fan out to many users
+            _stale(session).add(_ALL)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_stale_on_bulk_write(orm_execute_state):
+    # bulk statements (e.g. the employee import upsert) bypass the flush
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in TRACKED_TABLES:
+        _stale(orm_execute_state.session).add(_ALL)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    stale = session.info.pop(_STALE_KEY, None)
+    if not stale:
+        return
+    if _ALL in stale:
+        principal_cache.clear()
+        return
+    for employee_id in stale:
+        principal_cache.invalidate(employee_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_on_rollback(session):
+    session.info.pop(_STALE_KEY, None)
@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import ARRAY, Column, ForeignKey, String
+from sqlalchemy import ARRAY, Column, ForeignKey, Index, String
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.core.schemas import BaseModel
@@ -34,9 +34,11 @@ UserRole.model_rebuild()
 
 
 class User(BaseModel, table=True):
+    __table_args__ = (Index("ix_user_created_at", "created_at"),)
+
     employee_id: str = Field(unique=True, nullable=False)
     name: str = Field(nullable=True)
-    password: str = Field(nullable=False)
+    password: str = Field(nullable=False, exclude=True)  # never serialized
     email: str = Field(nullable=False)
     qualification: str
     designation: str
@@ -167,7 +169,6 @@ class RoleResponse(PydanticBaseModel):
 class UserResponse(PydanticBaseModel):
     id: UUID
     employee_id: Optional[str] = None
-    password: Optional[str] = None
     email: Optional[str] = None
     qualification: Optional[str] = None
     designation: Optional[str] = None
@@ -178,10 +179,12 @@ class UserResponse(PydanticBaseModel):
 
 
 class UserListResponse(PydanticBaseModel):
-    total: int
+    total: Optional[int] = None
     current_page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     data: list["UserResponse"] = []
 
 
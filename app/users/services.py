@@ -1,19 +1,24 @@
+import io
 import logging
+import time
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 import pandas as pd
-from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
+from app.core.config import settings
 from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
+from app.core.mail import send_email
 from app.core.schemas import Response, ResponseStatus
-from app.core.security import get_password_hash
+from app.core.hashing import password_hasher
+from app.core.security import hash_password
 from app.settings.links import UserDepartment
 from app.settings.models import Department
 from app.users.models import (
     AssignUserDepartmentRequest,
     RemoveUserDepartmentRequest,
-    RoleEnum,
     RoleRequest,
     RoleResponse,
     RoleUpdateRequest,
@@ -27,15 +32,28 @@ from app.users.models import (
 )
 from fastapi import BackgroundTasks, HTTPException, status
 
+from app.utils.background import enqueue_task
 from app.utils.dsl_filter import apply_sort, apply_filters
-from app.utils.model_graph import ModelGraph
+from app.utils.export import ExportFormat, export_query
+from app.utils.fieldsets import FieldSet
+from app.utils.model_graph import get_model_graph
+from app.utils.pagination import paginate
+
+# Excel header -> User column for the HR employee sheet
+EMPLOYEE_SHEET_COLUMNS = {
+    "Employee Id": "employee_id",
+    "Name": "name",
+    "E-mail": "email",
+    "Designation": "designation",
+    "Qualification": "qualification",
+}
+EMPLOYEE_IMPORT_CHUNK_SIZE = 1000
 
 
 class UserService:
     def __init__(self, session):
         self.session = session
-        self.graph = ModelGraph()
-        self.graph.build([User, UserDepartment, UserRole, Department])
+        self.graph = get_model_graph()
 
     async def create_role(self, request: RoleRequest):
         role = UserRole(
@@ -119,7 +137,7 @@ class UserService:
         return role
 
     async def create_user(self, data: UserCreateRequest):
-        password = get_password_hash(data.password)
+        password = await hash_password(data.password)
         user = User(
             employee_id=data.employee_id,
             password=password,
@@ -149,7 +167,7 @@ class UserService:
             )
         user.employee_id = data.employee_id or user.employee_id
         if data.password:
-            user.password = get_password_hash(data.password)
+            user.password = await hash_password(data.password)
         user.email = data.email or user.email
         user.qualification = data.qualification or user.qualification
         user.designation = data.designation or user.designation
@@ -164,16 +182,23 @@ class UserService:
         sort: Optional[str] = "created_at.desc",
         page: int = DEFAULT_PAGE,
         page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        fields: Optional[str] = None,
     ):
-        stmt = select(User).options(
-            selectinload(User.departments).options(
-                selectinload(UserDepartment.role),
-                selectinload(UserDepartment.department),
-            )
-        )
+        fieldset = FieldSet.parse(fields, UserResponse)
+        if fieldset:
+            options = fieldset.load_options(User)
+        else:
+            options = [
+                selectinload(User.departments).options(
+                    selectinload(UserDepartment.role),
+                    selectinload(UserDepartment.department),
+                )
+            ]
+        stmt = select(User).options(*options)
 
         if filters:
-            print(filters)
             # if "departments.role.role" in filters or "departments.department.name" in filters:
             #     stmt = stmt.join(
             #         UserDepartment, User.id == UserDepartment.user_id
@@ -181,30 +206,32 @@ class UserService:
 
             stmt = apply_filters(stmt, filters, User, self.graph)
 
-        if sort:
-            stmt = apply_sort(stmt, sort, User, self.graph)
-        stmt = stmt.distinct()
-        print(stmt)
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar()
-
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.session.execute(stmt)
-        users = result.scalars().all()
-        print(filters)
+        page_result = await paginate(
+            self.session,
+            stmt,
+            User,
+            self.graph,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        users = page_result.items
+        if fieldset:
+            return fieldset.page(page_result, page, page_size)
 
         response = UserListResponse(
-            total=total,
+            total=page_result.total,
             current_page=page,
             page_size=page_size,
-            total_pages=total // page_size + 1,
+            total_pages=page_result.total_pages,
+            total_estimated=page_result.total_estimated,
+            next_cursor=page_result.next_cursor,
             data=[
                 UserResponse(
                     id=user.id,
                     employee_id=user.employee_id,
-                    password=user.password,
                     email=user.email,
                     qualification=user.qualification,
                     designation=user.designation,
@@ -325,8 +352,6 @@ class UserService:
 
         if sort:
             stmt = apply_sort(stmt, sort, User, self.graph)
-            
-        stmt = stmt.distinct()
 
         result = await self.session.execute(stmt)
         users = result.scalars().all()
@@ -335,7 +360,6 @@ class UserService:
             UserResponse(
                 id=user.id,
                 employee_id=user.employee_id,
-                password=user.password,
                 email=user.email,
                 qualification=user.qualification,
                 designation=user.designation,
@@ -357,6 +381,43 @@ class UserService:
             for user in users
         ]
 
+    def user_export_row(self, user: User) -> dict:
+        return {
+            "employee_id": user.employee_id,
+            "name": user.name,
+            "email": user.email,
+            "designation": user.designation,
+            "qualification": user.qualification,
+            "role": user.role,
+            "is_active": user.is_active,
+            "departments": [
+                f"{link.department.name} ({link.role.role})" for link in user.departments
+            ],
+        }
+
+    def stream_users(
+        self,
+        format: ExportFormat,
+        filters: Optional[str] = None,
+        sort: Optional[str] = "created_at.desc",
+    ):
+        stmt = select(User).options(
+            selectinload(User.departments).options(
+                selectinload(UserDepartment.role),
+                selectinload(UserDepartment.department),
+            )
+        )
+        return export_query(
+            stmt,
+            User,
+            self.graph,
+            self.user_export_row,
+            format,
+            "users",
+            filters,
+            sort,
+        )
+
     async def get_user_department_by_user_id(self, user_id: UUID):
         role = await self.session.execute(
             select(UserDepartment)
@@ -404,50 +465,102 @@ class UserService:
             for user_department in users
         ]
 
-    async def upload_excel(self, file: bytes):
+    async def upload_excel(self, file: bytes, user_id: Optional[UUID] = None):
+        """
+        Import employees from an Excel sheet. The summary of inserted, updated
+        and invalid rows is returned and, when ``user_id`` is given (the
+        background upload), emailed to that user along with any failure.
+        """
+        user = None
+        if user_id:
+            user = (
+                await self.session.execute(select(User).where(User.id == user_id))
+            ).scalar_one_or_none()
+        # the chunks roll back and commit the session, which expires `user`
+        recipient = (user.email, user.name) if user else None
+        start_time = time.time()
         try:
-            print("Starting the Excel upload process.")
-            df = pd.read_excel(file)
-            print(f"Successfully read the Excel file with {len(df)} rows.")
-
-            for _, row in df.iterrows():
-                user_data = UserCreateRequest(
-                    employee_id=str(row["Employee Id"]),
-                    name=row["Name"],
-                    email=row["E-mail"],
-                    designation=row["Designation"],
-                    qualification=row["Qualification"],
-                    password=str(row["Employee Id"]),
-                    role=RoleEnum.USER,
-                )
-
-                print(f"Processing user: {user_data.employee_id}")
+            logging.info("Starting the employee Excel import.")
+            df = pd.read_excel(io.BytesIO(file))
+            logging.info(f"Successfully read the Excel file with {len(df)} rows.")
+
+            missing = [col for col in EMPLOYEE_SHEET_COLUMNS if col not in df.columns]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+            sheet = df[list(EMPLOYEE_SHEET_COLUMNS)].rename(columns=EMPLOYEE_SHEET_COLUMNS)
+            valid = sheet.notna().all(axis=1)
+
+            employee_ids = sheet["employee_id"]
+            # a blank cell turns a numeric id column into floats (1234.0)
+            if pd.api.types.is_float_dtype(employee_ids) and (
+                employee_ids.dropna() % 1 == 0
+            ).all():
+                sheet["employee_id"] = employee_ids.astype("Int64")
+
+            sheet = sheet.astype(str).apply(lambda col: col.str.strip())
+            valid &= sheet.ne("").all(axis=1)
+
+            # the same employee twice would hit ON CONFLICT twice in a statement
+            records = (
+                sheet[valid]
+                .drop_duplicates("employee_id", keep="last")
+                .to_dict("records")
+            )
 
-                user = await self.session.execute(
-                    select(User).where(User.employee_id == user_data.employee_id)
+            summary = {"inserted": 0, "updated": 0, "invalid": int((~valid).sum())}
+            for start in range(0, len(records), EMPLOYEE_IMPORT_CHUNK_SIZE):
+                inserted, updated = await self._upsert_employees(
+                    records[start : start + EMPLOYEE_IMPORT_CHUNK_SIZE]
+                )
+                summary["inserted"] += inserted
+                summary["updated"] += updated
+
+            logging.info(f"Employee Excel import finished: {summary}")
+
+            if recipient:
+                email, name = recipient
+                execution_time = round(time.time() - start_time, 2)
+                await send_email(
+                    [email],
+                    "ARe-Audit Management : Employee Import Completed",
+                    {
+                        "user": name,
+                        "message": (
+                            f"<h3>Employee Import Summary</h3>"
+                            f"<p><strong>Total Rows:</strong> {len(df)}</p>"
+                            f"<p><strong>Inserted Employees:</strong> {summary['inserted']}</p>"
+                            f"<p><strong>Updated Employees:</strong> {summary['updated']}</p>"
+                            f"<p><strong>Invalid Rows:</strong> {summary['invalid']}</p>"
+                            f"<p><strong>Execution Time:</strong> {execution_time} seconds</p>"
+                            f"<p><strong>Completed At:</strong> {datetime.now().strftime('%d %B %Y %H:%M:%S')}</p>"
+                        ),
+                        "frontend_url": settings.FRONTEND_URL,
+                    },
                 )
-
-                user = user.scalar_one_or_none()
-                if user:
-                    print(f"User {user_data.employee_id} found. Updating data.")
-
-                    await self.update_user(user_id=user.id, data=user_data)
-
-                else:
-                    print(
-                        f"Employee {user_data.employee_id} not found. Creating new record."
-                    )
-                    await self.create_user(user_data)
 
             return Response(
                 message="Employee data imported from Excel file successfully",
                 success=True,
                 status=ResponseStatus.CREATED,
-                data=None,
+                data=summary,
             )
 
         except Exception as e:
-            print(f"Error in Excel upload process: {str(e)}")
+            logging.error(f"Error in Excel upload process: {str(e)}")
+            if recipient:
+                email, name = recipient
+                await send_email(
+                    [email],
+                    "Employee Excel Upload Failed",
+                    {
+                        "user": name,
+                        "message": (
+                            f"<h3>Employee Excel Upload Failed</h3>" f"<p>Error: {str(e)}</p>"
+                        ),
+                        "frontend_url": settings.FRONTEND_URL,
+                    },
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -458,11 +571,57 @@ class UserService:
                 },
             )
 
+    async def _upsert_employees(self, rows: list[dict]) -> tuple[int, int]:
+        """
+        ``INSERT ... ON CONFLICT (employee_id) DO UPDATE`` one chunk of sheet
+        rows. Only new employees get a password hash (their employee id);
+        existing users keep their password and role.
+        """
+        existing = dict(
+            (
+                await self.session.execute(
+                    select(User.employee_id, User.password).where(
+                        User.employee_id.in_([row["employee_id"] for row in rows])
+                    )
+                )
+            ).all()
+        )
+        # release the connection while the chunk is hashed (minutes for a
+        # full chunk); the upsert opens its own transaction
+        await self.session.rollback()
+        new_rows = [row for row in rows if row["employee_id"] not in existing]
+        hashes = await password_hasher.hash_many(
+            [row["employee_id"] for row in new_rows]
+        )
+        for row, hashed in zip(new_rows, hashes):
+            row["password"] = hashed
+        for row in rows:
+            row.setdefault("password", existing.get(row["employee_id"]))
+
+        stmt = insert(User.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.__table__.c.employee_id],
+            set_={
+                name: stmt.excluded[name]
+                for name in (
+                    "name",
+                    "email",
+                    "designation",
+                    "qualification",
+                    "updated_at",
+                )
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+        return len(rows) - len(existing), len(existing)
+
     async def upload_excel_in_background(
-        self, background_tasks: BackgroundTasks, file: bytes
+        self, background_tasks: BackgroundTasks, file: bytes, user_id: UUID
     ):
-        background_tasks.add_task(self.upload_excel, file)
-        print("Excel file upload started in the background.")
+        enqueue_task(background_tasks, self.upload_excel, file, user_id)
+        logging.info("Employee Excel import queued in the background.")
         return Response(
             message="Excel file upload is in progress.",
             success=True,
@@ -486,12 +645,10 @@ class UserService:
         )
         
         if filters:
-            print(filters)
             stmt = apply_filters(stmt, filters, UserRole, self.graph)
             
         if sort:
             stmt = apply_sort(stmt, sort, UserRole, self.graph)
-        stmt = stmt.distinct()
         result = await self.session.execute(stmt)
         users = result.scalars().all()
 
@@ -0,0 +1,43 @@
+import time
+from typing import Any, Callable
+
+from fastapi import BackgroundTasks
+from starlette._utils import is_async_callable
+from starlette.concurrency import run_in_threadpool
+
+from app.core.metrics import (
+    BACKGROUND_TASK_DURATION,
+    BACKGROUND_TASKS_QUEUED,
+    BACKGROUND_TASKS_RUNNING,
+)
+
+"""
+# BACKGROUND TASKS
+
+`enqueue_task(background_tasks, func, *args)` is `background_tasks.add_task`
+with metrics: tasks run one after another once their response is sent, so
+the number added and not yet started (`background_tasks_queued`) is the queue
+depth, next to how many are running and how long each takes, per task name.
+"""
+
+
+def enqueue_task(
+    background_tasks: BackgroundTasks, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> None:
+    name = getattr(func, "__name__", "task")
+    BACKGROUND_TASKS_QUEUED.inc(task=name)
+
+    async def run() -> None:
+        BACKGROUND_TASKS_QUEUED.dec(task=name)
+        BACKGROUND_TASKS_RUNNING.inc(task=name)
+        start = time.perf_counter()
+        try:
+            if is_async_callable(func):
+                await func(*args, **kwargs)
+            else:
+                await run_in_threadpool(func, *args, **kwargs)
+        finally:
+            BACKGROUND_TASKS_RUNNING.dec(task=name)
+            BACKGROUND_TASK_DURATION.observe(time.perf_counter() - start, task=name)
+
+    background_tasks.add_task(run)
@@ -0,0 +1,92 @@
+import uuid
+from typing import Any, NamedTuple, Sequence
+
+from sqlalchemy import Column, MetaData, Table, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+"""
+# STAGED BULK UPDATES
+
+Excel uploads update thousands of rows keyed on a business reference. Instead
+of an executemany UPDATE (one statement per row), the parsed rows are
+COPYed into a temporary staging table on the session's own connection and
+applied with a single `UPDATE ... FROM staging` joined on the key. The staging
+table lives in the session's transaction and is dropped on commit/rollback.
+"""
+
+
+class StagedUpdate(NamedTuple):
+    matched: list[Any]
+    missing: list[Any]
+
+
+async def staged_update(
+    session: AsyncSession,
+    table: Table,
+    rows: Sequence[dict],
+    key: str = "ref",
+    key_param: str = "ref_param",
+) -> StagedUpdate:
+    """
+    Update ``table`` from ``rows`` (``key_param`` plus the columns to set,
+    the same keys in every row) with one set-based statement.
+
+    Returns the keys that matched a row and the ones that did not.
+    """
+    # a key repeated in the sheet keeps its last row, as row-by-row updates did
+    by_key = {row[key_param]: row for row in rows if row.get(key_param) is not None}
+    if not by_key:
+        return StagedUpdate([], [])
+
+    columns = [name for name in next(iter(by_key.values())) if name != key_param]
+
+    staging = Table(
+        f"{table.name}_staging_{uuid.uuid4().hex[:8]}",
+        MetaData(),
+        Column(key_param, table.c[key].type),
+        *(Column(name, table.c[name].type) for name in columns),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+    connection = await session.connection()
+    await connection.execute(CreateTable(staging))
+
+    # COPY bypasses SQLAlchemy's type handling (e.g. Enum -> label), so run
+    # the column bind processors here
+    names = [key_param, *columns]
+    processors = [staging.c[name].type.bind_processor(connection.dialect) for name in names]
+    records = [
+        tuple(
+            process(row.get(name)) if process else row.get(name)
+            for name, process in zip(names, processors)
+        )
+        for row in by_key.values()
+    ]
+
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        staging.name, records=records, columns=names
+    )
+
+    # through the session so ORM execute hooks (cache invalidation) still fire
+    result = await session.execute(
+        update(table)
+        .where(table.c[key] == staging.c[key_param])
+        .values({name: staging.c[name] for name in columns})
+        .returning(staging.c[key_param])
+    )
+    matched = list(result.scalars().all())
+
+    found = set(matched)
+    return StagedUpdate(matched, [k for k in by_key if k not in found])
+
+
+def format_missing_refs(missing: Sequence[Any], limit: int = 50) -> str:
+    """``"3 (R1, R2, R3)"`` for upload summaries; long lists are truncated."""
+    if not missing:
+        return "0"
+    shown = ", ".join(str(ref) for ref in missing[:limit])
+    more = f", … {len(missing) - limit} more" if len(missing) > limit else ""
+    return f"{len(missing)} ({shown}{more})"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 import uuid
 import datetime
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from functools import lru_cache
 from sqlalchemy import and_, or_, asc, desc, func, literal, text, cast
@@ -14,7 +15,9 @@ from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.selectable import Select
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
+from .index_advisor import usage_recorder
 from .model_graph import ModelGraph
+from .text_search import search_condition
 
 """
 #  DSL FILTER OPTIONS & EXAMPLES
@@ -37,6 +40,15 @@ You can combine filters using:
 | gte / lte    | Greater/Less or Equal      | created_at:2023-01-01~gte |
 | in           | Match any in list          | id:1,2,3~in               |
 | notIn        | Match none in list         | status:hidden,deleted~notIn|
+| search       | Full-text match on the     | description:pump leak~search|
+|              | field's table document     |                           |
+
+`ilike` / `startsWith` on free-text columns (NCR description, evidence, root
+cause, suggestion text, checklist findings/observations) are served by
+pg_trgm indexes. `search` matches the whole search document of the field's
+table (e.g. an NCR's ref, description, evidence, root cause, requirement) with
+`websearch_to_tsquery` syntax: words, "quoted phrases", `or`, `-excluded`.
+See app/utils/text_search.py.
 
 ## 2. FILTERABLE PATHS (Based on your ModelGraph)
 -------------------------------------------------------------------------
@@ -69,8 +81,26 @@ Pass as `field_path.direction` (asc/desc):
 - created_at.desc
 - name.asc
 - departments.department.name.asc
+
+## 5. TO-MANY PATHS
+-------------------------------------------------------------------------
+A path crossing a one-to-many / many-to-many relationship (e.g.
+`departments.department.name` on User) compiles to a correlated EXISTS
+(`User.departments.any(...)`) instead of a JOIN, so a parent matching several
+children is returned once and callers need no DISTINCT. Filters AND-ed under
+the same to-many relationship go into one EXISTS and must match the same
+child row. Sorting still joins.
+
+## 6. COMPILED PLANS
+-------------------------------------------------------------------------
+Parsing, path resolution and value casting happen once per
+(model, filter string) / (model, sort string); the result (AST, joins to add,
+typed WHERE clause) is kept in an LRU of PLAN_CACHE_SIZE entries, so a repeated
+filter only re-attaches the joins and the condition to the new statement.
 """
 
+PLAN_CACHE_SIZE = 1024
+
 TOKEN_REGEX = re.compile(r"""
     (\()|       # LPAREN
     (\))|       # RPAREN
@@ -182,6 +212,7 @@ def op_lt(col, val): return col < val
 def op_lte(col, val): return col <= val
 def op_in(col, val): return col.in_(val)
 def op_notin(col, val): return ~col.in_(val)
+def op_search(col, val): return search_condition(col, val)
 
 
 OP_MAP = {
@@ -196,6 +227,7 @@ OP_MAP = {
     "lte": op_lte,
     "in": op_in,
     "notIn": op_notin,
+    "search": op_search,
 }
 
 
@@ -285,6 +317,63 @@ def resolve_python_type(col) -> Any:
     return str
 
 
+def leaf_condition(node: FilterNode, col: Any) -> BinaryExpression:
+    raw = node.value
+
+    col_type = resolve_python_type(col)
+    val = cast_value(col_type, raw)
+
+    if node.op == "ilike" and node.field.lower() == "employee_id":
+        return op_prefix(col, val)
+
+    handler = OP_MAP.get(node.op)
+    if handler is None:
+        raise ValueError(f"Unsupported operator: {node.op}")
+
+    if node.op in ("in", "notIn"):
+        val = raw.split(',')
+    elif node.op == "search":
+        val = raw
+    return handler(col, val)
+
+
+def resolve_semi_join(
+    model: Type[SQLModel], node: FilterNode, graph: ModelGraph, alias_cache: Dict
+) -> Optional[Tuple[Tuple, Any, Any]]:
+    """
+    For a path crossing a to-many relationship, return
+    ``(anchor_key, anchor_relationship, inner_condition)``: the to-one prefix
+    is joined as usual and the rest becomes the body of ``anchor.any(...)``
+    (a correlated EXISTS), so matching children never multiply parent rows.
+
+    Returns None for purely to-one paths.
+    """
+    plan, colname = graph.resolve_attr_path(model, node.field.split('.'))
+    split = next((i for i, step in enumerate(plan) if step.uselist), None)
+    if split is None:
+        return None
+
+    stmt, source = graph.apply_joins(alias_cache.get("__stmt__"), plan[:split], alias_cache)
+    alias_cache["__stmt__"] = stmt
+    anchor = getattr(source if source is not None else model, plan[split].attr)
+
+    rest = plan[split + 1:]
+    target = rest[-1].dst if rest else plan[split].dst
+    condition = leaf_condition(node, getattr(target, colname))
+    for step in reversed(rest):
+        rel = getattr(step.src, step.attr)
+        condition = rel.any(condition) if step.uselist else rel.has(condition)
+
+    key = tuple((step.src, step.attr) for step in plan[:split + 1])
+    return key, anchor, condition
+
+
+def _and_terms(node: ASTNode) -> List[ASTNode]:
+    if isinstance(node, AndNode):
+        return _and_terms(node.left) + _and_terms(node.right)
+    return [node]
+
+
 def build_condition(
     node: ASTNode,
     model: Type[SQLModel],
@@ -293,28 +382,36 @@ def build_condition(
 ) -> BinaryExpression:
 
     if isinstance(node, FilterNode):
+        semi = resolve_semi_join(model, node, graph, alias_cache)
+        if semi is not None:
+            _, anchor, condition = semi
+            return anchor.any(condition)
         col, _ = resolve_column(model, node.field, graph, alias_cache)
-        raw = node.value
-
-        col_type = resolve_python_type(col)
-        val = cast_value(col_type, raw)
-
-        if node.op == "ilike" and node.field.lower() == "employee_id":
-            return op_prefix(col, val)
-
-        handler = OP_MAP.get(node.op)
-        if handler is None:
-            raise ValueError(f"Unsupported operator: {node.op}")
-
-        if node.op in ("in", "notIn"):
-            val = raw.split(',')
-        return handler(col, val)
+        return leaf_condition(node, col)
 
     if isinstance(node, AndNode):
-        return and_(
-            build_condition(node.left, model, graph, alias_cache),
-            build_condition(node.right, model, graph, alias_cache),
-        )
+        # AND-ed filters under the same to-many relationship share one EXISTS,
+        # so they must hold for the same child row (as they did with a join)
+        parts: List[Any] = []
+        groups: Dict[Tuple, Tuple[Any, List[Any]]] = {}
+        for term in _and_terms(node):
+            semi = (
+                resolve_semi_join(model, term, graph, alias_cache)
+                if isinstance(term, FilterNode) else None
+            )
+            if semi is None:
+                parts.append(build_condition(term, model, graph, alias_cache))
+                continue
+            key, anchor, condition = semi
+            if key not in groups:
+                groups[key] = (anchor, [])
+                parts.append(key)
+            groups[key][1].append(condition)
+
+        return and_(*(
+            groups[part][0].any(and_(*groups[part][1])) if isinstance(part, tuple) else part
+            for part in parts
+        ))
 
     if isinstance(node, OrNode):
         return or_(
@@ -325,28 +422,96 @@ def build_condition(
     raise TypeError("Invalid AST node")
 
 
-def apply_filters(stmt: Select, filters: str, model: Type[SQLModel], graph: ModelGraph) -> Select:
-    filters = filters.replace(",", "&")
-    print(filters)
-    alias_cache: Dict = {"__stmt__": stmt}
-    tokens = tokenize(filters)
-    ast = parse_expression(tokens)
+# --------------------------
+# COMPILED PLANS
+# --------------------------
+
+class _JoinRecorder:
+    """Stands in for the statement while compiling; records the joins added."""
+
+    def __init__(self) -> None:
+        self.joins: List[Tuple[Any, Any]] = []
+
+    def join(self, target: Any, onclause: Any) -> "_JoinRecorder":
+        self.joins.append((target, onclause))
+        return self
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    ast: ASTNode
+    joins: Tuple[Tuple[Any, Any], ...]  # (alias, relationship attribute), in order
+    condition: Any
+    paths: Tuple[Tuple[str, str], ...]  # (field path, operator), for the index advisor
+
+
+@dataclass(frozen=True)
+class CompiledSort:
+    joins: Tuple[Tuple[Any, Any], ...]
+    column: Any
+    direction: str
+    path: str
+
+
+def _filter_paths(node: ASTNode) -> List[Tuple[str, str]]:
+    if isinstance(node, FilterNode):
+        return [(node.field, node.op)]
+    return _filter_paths(node.left) + _filter_paths(node.right)
+
+
+def _attach(stmt: Select, joins: Tuple[Tuple[Any, Any], ...]) -> Select:
+    for target, onclause in joins:
+        stmt = stmt.join(target, onclause)
+    return stmt
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_filters(model: Type[SQLModel], filters: str, graph: ModelGraph) -> CompiledFilter:
+    recorder = _JoinRecorder()
+    alias_cache: Dict = {"__stmt__": recorder}
+    ast = parse_expression(tokenize(filters))
     condition = build_condition(ast, model, graph, alias_cache)
-    print(condition)
-    stmt = alias_cache["__stmt__"]
-    return stmt.where(condition)
+    return CompiledFilter(
+        ast=ast,
+        joins=tuple(recorder.joins),
+        condition=condition,
+        paths=tuple(_filter_paths(ast)),
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_sort(model: Type[SQLModel], sort: str, graph: ModelGraph) -> CompiledSort:
+    parts = sort.split('.')
+    direction = "asc" if parts[-1] == "asc" else "desc"
+    field = ".".join(parts[:-1])
+    recorder = _JoinRecorder()
+    col, _ = resolve_column(model, field, graph, {"__stmt__": recorder})
+    return CompiledSort(
+        joins=tuple(recorder.joins), column=col, direction=direction, path=field
+    )
 
 
+def apply_filters(stmt: Select, filters: str, model: Type[SQLModel], graph: ModelGraph) -> Select:
+    compiled = compile_filters(model, filters.replace(",", "&").strip(), graph)
+    usage_recorder.record_paths(model.__name__, compiled.paths)
+    return _attach(stmt, compiled.joins).where(compiled.condition)
+
+
+
+def resolve_sort(
+    stmt: Select, sort: str, model: Type[SQLModel], graph: ModelGraph
+) -> Tuple[Select, Any, str]:
+    """Resolve ``field.path.asc|desc`` to ``(stmt_with_joins, column, direction)``."""
+    compiled = compile_sort(model, sort.strip(), graph)
+    usage_recorder.record_paths(model.__name__, ((compiled.path, "sort"),))
+    return _attach(stmt, compiled.joins), compiled.column, compiled.direction
+
 
 def apply_sort(stmt: Select, sort: str, model: Type[SQLModel], graph: ModelGraph) -> Select:
     if not sort:
         return stmt
 
-    parts = sort.split('.')
-    direction = parts[-1]
-    field = ".".join(parts[:-1])
-    alias_cache = {"__stmt__": stmt}
-    col, stmt = resolve_column(model, field, graph, alias_cache)
+    stmt, col, direction = resolve_sort(stmt, sort, model, graph)
     if direction == "asc":
         return stmt.order_by(asc(col))
     return stmt.order_by(desc(col))
@@ -0,0 +1,150 @@
+from typing import Any, Optional, Type
+
+from fastapi import HTTPException, status
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, load_only, selectinload
+from sqlmodel import SQLModel
+
+from app.utils.pagination import Page
+from app.utils.serializer import inner_model, model_fields
+
+"""
+# SPARSE FIELDSETS
+
+`?fields=ref,status,audit_info.ref,team.user.name` returns only the named
+fields of each row (plus `id`), and loads only what they need:
+
+- the row's named columns, its primary key and the foreign keys of the named
+  to-one relationships (`load_only`); every other column, text blobs
+  included, stays out of the SELECT;
+- only the named relationships (`selectinload`), each restricted the same
+  way by its own sub-fields. A relationship named without sub-fields
+  (`fields=files`) returns the related rows' plain fields; its own
+  relationships are only returned when named (`files.ncr.ref`).
+
+Field names are the response model's (`NCRResponse`); an unknown or hidden
+one is a 400. Rows are projected to plain dicts instead of response models,
+so the response carries exactly the requested keys.
+"""
+
+FIELDS_SEPARATOR = ","
+
+
+def _bad_fields(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "message": message,
+            "success": False,
+            "status": status.HTTP_400_BAD_REQUEST,
+            "data": None,
+        },
+    )
+
+
+def _visible_fields(model: type) -> dict:
+    return {name: field for name, field in model_fields(model).items() if field.exclude is not True}
+
+
+class FieldSet:
+    def __init__(self, response_model: Type[Any], tree: dict):
+        self.response_model = response_model
+        self.tree = tree
+
+    @classmethod
+    def parse(cls, spec: Optional[str], response_model: Type[Any]) -> Optional["FieldSet"]:
+        """``None`` when no fields were asked for (the full response)."""
+        paths = [path.strip() for path in (spec or "").split(FIELDS_SEPARATOR) if path.strip()]
+        if not paths:
+            return None
+        tree: dict = {}
+        for path in paths:
+            node, model = tree, response_model
+            for part in path.split("."):
+                field = _visible_fields(model).get(part) if model else None
+                if field is None:
+                    raise _bad_fields(f"Unknown field '{path}'")
+                node = node.setdefault(part, {})
+                model = inner_model(field.annotation)
+        return cls(response_model, tree)
+
+    def load_options(self, entity: Type[SQLModel]) -> list:
+        return _load_options(entity, self.tree)
+
+    def project(self, value: Any) -> Any:
+        return _project(value, self.tree, self.response_model)
+
+    def page(self, page: Page, current_page: int, page_size: int) -> dict:
+        """A list response body (`NCRListResponse` and alike) of projected rows."""
+        return {
+            "total": page.total,
+            "current_page": current_page,
+            "page_size": page_size,
+            "total_pages": page.total_pages,
+            "total_estimated": page.total_estimated,
+            "next_cursor": page.next_cursor,
+            "data": self.project(page.items),
+        }
+
+
+def _load_options(entity: Type[SQLModel], tree: dict) -> list:
+    mapper = sa_inspect(entity)
+    columns = {mapper.get_property_by_column(col).key for col in mapper.primary_key}
+    relationships = []
+    for name, sub_tree in tree.items():
+        prop = mapper.attrs.get(name)
+        if isinstance(prop, ColumnProperty):
+            columns.add(name)
+        elif isinstance(prop, RelationshipProperty):
+            # a to-one relationship is loaded by the row's own foreign key
+            for col in prop.local_columns:
+                if col.table is mapper.local_table:
+                    columns.add(mapper.get_property_by_column(col).key)
+            loader = selectinload(getattr(entity, name))
+            if sub_tree:
+                loader = loader.options(*_load_options(prop.mapper.class_, sub_tree))
+            relationships.append(loader)
+    return [load_only(*(getattr(entity, key) for key in columns)), *relationships]
+
+
+def _plain_fields(value: Any, model: Optional[type]) -> dict:
+    """A related row named without sub-fields: its loaded, non-relationship fields."""
+    loaded = value.__dict__
+    names = _visible_fields(model) if model else loaded
+    data = {}
+    for name in names:
+        item = loaded.get(name, _MISSING)
+        if item is _MISSING or name.startswith("_"):
+            continue
+        if hasattr(item, "_sa_instance_state") or (
+            isinstance(item, list) and item and hasattr(item[0], "_sa_instance_state")
+        ):
+            continue
+        data[name] = item
+    return data
+
+
+def _project(value: Any, tree: dict, model: Optional[type]) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree, model) for item in value]
+    if value is None or not hasattr(value, "_sa_instance_state"):
+        return value
+    if not tree:
+        return _plain_fields(value, model)
+    loaded = value.__dict__
+    mapped = sa_inspect(type(value)).attrs
+    fields = _visible_fields(model) if model else {}
+    data = {"id": loaded.get("id")}
+    for name, sub_tree in tree.items():
+        if name in loaded:
+            item = loaded[name]
+        elif name in mapped:
+            continue  # not loaded
+        else:
+            item = getattr(value, name, None)
+        field = fields.get(name)
+        data[name] = _project(item, sub_tree, inner_model(field.annotation) if field else None)
+    return data
+
+
+_MISSING = object()
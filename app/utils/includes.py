@@ -0,0 +1,77 @@
+from functools import lru_cache
+from typing import Optional, Type
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import selectinload
+from sqlmodel import SQLModel
+
+from app.utils.model_graph import ModelGraph
+
+"""
+# RELATIONSHIP EXPANSION
+
+List endpoints load their full response graph by default; clients that need
+less name the relationships to load with `?include=`, a comma separated list
+of relationship paths walked through the ModelGraph:
+
+    ?include=team.user,audit_info.audit.plant.company
+
+- each path segment is a relationship of the previous model; every prefix
+  is loaded too (`team.user` loads `team` and its users);
+- one `selectinload` per relationship, so each expansion costs one query
+  per page, not one per row;
+- `include` left out uses the endpoint's default; `include=` (empty) loads
+  no relationships at all.
+
+With an explicit `include`, relationships that were not loaded are left out
+of the response (`typed_response(..., exclude_unset=True)`) rather than sent
+as `null` / `[]`, so a missing key means "not requested", never "empty".
+"""
+
+INCLUDE_SEPARATOR = ","
+
+
+def _bad_include(path: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "message": f"Unknown relationship '{path}'",
+            "success": False,
+            "status": status.HTTP_400_BAD_REQUEST,
+            "data": None,
+        },
+    )
+
+
+def include_options(
+    model: Type[SQLModel], include: Optional[str], graph: ModelGraph, default: str = ""
+) -> list:
+    """Loader options for ``include`` (``default`` when it is None)."""
+    return list(_include_options(model, default if include is None else include, graph))
+
+
+@lru_cache(maxsize=256)
+def _include_options(model: Type[SQLModel], include: str, graph: ModelGraph) -> tuple:
+    tree: dict = {}
+    for path in include.split(INCLUDE_SEPARATOR):
+        path = path.strip()
+        if not path:
+            continue
+        node, current = tree, model
+        for attr in path.split("."):
+            step = graph.forward.get(current, {}).get(attr)
+            if step is None:
+                raise _bad_include(path)
+            node = node.setdefault(attr, {})
+            current = step.dst
+    return tuple(_loaders(model, tree))
+
+
+def _loaders(model: Type[SQLModel], tree: dict) -> list:
+    loaders = []
+    for attr, sub_tree in tree.items():
+        loader = selectinload(getattr(model, attr))
+        if sub_tree:
+            loader = loader.options(*_loaders(getattr(model, attr).property.mapper.class_, sub_tree))
+        loaders.append(loader)
+    return loaders
@@ -0,0 +1,333 @@
+import random
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, ColumnClause, UnaryExpression
+from sqlalchemy.sql.selectable import Alias
+
+from app.core.config import settings
+
+"""
+# INDEX ADVISOR
+
+Records which columns the application actually filters, joins and sorts on,
+and proposes the missing indexes.
+
+- every DSL `filters` / `sort` records its model path and operator
+  (`apply_filters` / `apply_sort`), unsampled;
+- a share (INDEX_ADVISOR_SAMPLE_RATE) of all ORM selects, DSL or hand written
+  service queries, relationship loads included, are walked for the columns in
+  their WHERE / JOIN ... ON / ORDER BY and how they are compared.
+
+`advise` checks those columns against pg_indexes (leading column, method,
+validity) and pg_stat_user_tables (size, sequential scans): an equality /
+range / sort use with no btree leading on the column, or an ilike use with no
+pg_trgm index, on a table of at least INDEX_ADVISOR_MIN_ROWS rows becomes a
+suggestion. `render_migration` turns suggestions into an Alembic revision that
+builds them with CREATE INDEX CONCURRENTLY.
+
+Usage is per process and kept since start up (or the last reset).
+"""
+
+BTREE = "btree"
+TRIGRAM = "gin_trgm"
+
+# how a comparison uses its column; only these are worth an index
+_KINDS = {
+    operators.eq: "eq",
+    operators.ne: "eq",
+    operators.in_op: "eq",
+    operators.not_in_op: "eq",
+    operators.is_: "eq",
+    operators.is_not: "eq",
+    operators.lt: "range",
+    operators.le: "range",
+    operators.gt: "range",
+    operators.ge: "range",
+    operators.between_op: "range",
+    operators.like_op: "like",
+    operators.ilike_op: "like",
+    operators.not_like_op: "like",
+    operators.not_ilike_op: "like",
+}
+BTREE_KINDS = {"eq", "range", "sort"}
+
+
+def _base_column(element) -> Optional[Tuple[str, str]]:
+    """``(table, column)`` of a plain or aliased table column, else None."""
+    if not isinstance(element, ColumnClause):
+        return None
+    table = getattr(element, "table", None)
+    while isinstance(table, Alias):
+        table = table.element
+    if not isinstance(table, Table):
+        return None
+    return table.name, element.name
+
+
+def column_uses(statement) -> Iterator[Tuple[str, str, str]]:
+    """``(table, column, kind)`` for every indexable column use in ``statement``."""
+    for element in visitors.iterate(statement):
+        if isinstance(element, BinaryExpression):
+            kind = _KINDS.get(element.operator)
+            if kind is None:
+                continue
+            for side in (element.left, element.right):
+                base = _base_column(side)
+                if base:
+                    yield (*base, kind)
+        elif isinstance(element, UnaryExpression) and element.modifier in (
+            operators.asc_op,
+            operators.desc_op,
+        ):
+            base = _base_column(element.element)
+            if base:
+                yield (*base, "sort")
+
+
+class UsageRecorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.since = datetime.now()
+            self.columns: dict[Tuple[str, str], Counter] = defaultdict(Counter)
+            self.paths: Counter = Counter()
+
+    def record_paths(self, model: str, paths: Sequence[Tuple[str, str]]) -> None:
+        if not settings.INDEX_ADVISOR_ENABLED:
+            return
+        with self._lock:
+            for path, op in paths:
+                self.paths[(model, path, op)] += 1
+
+    def record_statement(self, statement) -> None:
+        uses = list(column_uses(statement))
+        with self._lock:
+            for table, column, kind in uses:
+                self.columns[(table, column)][kind] += 1
+
+    def column_usage(self) -> dict[Tuple[str, str], Counter]:
+        with self._lock:
+            return {key: Counter(kinds) for key, kinds in self.columns.items()}
+
+    def path_usage(self) -> Counter:
+        with self._lock:
+            return Counter(self.paths)
+
+
+usage_recorder = UsageRecorder()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _sample_statement(orm_execute_state):
+    if not (settings.INDEX_ADVISOR_ENABLED and orm_execute_state.is_select):
+        return
+    if random.random() >= settings.INDEX_ADVISOR_SAMPLE_RATE:
+        return
+    usage_recorder.record_statement(orm_execute_state.statement)
+
+
+@dataclass
+class IndexSuggestion:
+    table: str
+    column: str
+    method: str
+    uses: dict[str, int]
+    live_rows: int
+    seq_scan: int
+    seq_tup_read: int
+    idx_scan: int
+
+    @property
+    def name(self) -> str:
+        suffix = "_trgm" if self.method == TRIGRAM else ""
+        return f"ix_{self.table}_{self.column}{suffix}"
+
+    @property
+    def ddl(self) -> str:
+        target = (
+            f'USING gin ("{self.column}" gin_trgm_ops)'
+            if self.method == TRIGRAM
+            else f'("{self.column}")'
+        )
+        return (
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.name} '
+            f'ON "{self.table}" {target}'
+        )
+
+    @property
+    def score(self) -> float:
+        # uses weighted by rows read per sequential scan of the table
+        rows_per_scan = self.seq_tup_read / self.seq_scan if self.seq_scan else self.live_rows
+        return sum(self.uses.values()) * max(rows_per_scan, 1)
+
+
+TABLE_STATS = text("""
+SELECT relname, seq_scan, seq_tup_read, coalesce(idx_scan, 0) AS idx_scan, n_live_tup
+FROM pg_stat_user_tables
+WHERE schemaname = current_schema()
+""")
+
+# pg_indexes has no validity flag; a failed CONCURRENTLY build leaves an
+# INVALID index behind that must not count as coverage
+TABLE_INDEXES = text("""
+SELECT i.tablename, i.indexname, i.indexdef, x.indisvalid
+FROM pg_indexes i
+JOIN pg_namespace n ON n.nspname = i.schemaname
+JOIN pg_class c ON c.relname = i.indexname AND c.relnamespace = n.oid
+JOIN pg_index x ON x.indexrelid = c.oid
+WHERE i.schemaname = current_schema()
+""")
+
+_INDEXDEF = re.compile(r"USING (\w+) \((.*)\)")
+
+
+def leading_column(indexdef: str) -> Optional[Tuple[str, str, Optional[str]]]:
+    """``(method, column, opclass)`` of an index definition's first key."""
+    match = _INDEXDEF.search(indexdef)
+    if not match:
+        return None
+    first = match.group(2).split(",")[0].strip()
+    if first.startswith("("):  # expression index
+        return None
+    parts = first.split()
+    return match.group(1), parts[0].strip('"'), parts[1] if len(parts) > 1 else None
+
+
+async def advise(
+    session: AsyncSession,
+    recorder: UsageRecorder = usage_recorder,
+    min_rows: int = settings.INDEX_ADVISOR_MIN_ROWS,
+) -> list[IndexSuggestion]:
+    stats = {row.relname: row for row in await session.execute(TABLE_STATS)}
+
+    covered = set()
+    for row in await session.execute(TABLE_INDEXES):
+        lead = row.indisvalid and leading_column(row.indexdef)
+        if not lead:
+            continue
+        method, column, opclass = lead
+        if method == "btree":
+            covered.add((row.tablename, column, BTREE))
+        elif method == "gin" and opclass == "gin_trgm_ops":
+            covered.add((row.tablename, column, TRIGRAM))
+
+    suggestions = []
+    for (table, column), kinds in recorder.column_usage().items():
+        table_stats = stats.get(table)
+        if table_stats is None or table_stats.n_live_tup < min_rows:
+            continue
+        needed = []
+        if BTREE_KINDS & kinds.keys():
+            needed.append(BTREE)
+        if "like" in kinds:
+            needed.append(TRIGRAM)
+        for method in needed:
+            if (table, column, method) in covered:
+                continue
+            suggestions.append(
+                IndexSuggestion(
+                    table=table,
+                    column=column,
+                    method=method,
+                    uses=dict(kinds),
+                    live_rows=table_stats.n_live_tup,
+                    seq_scan=table_stats.seq_scan,
+                    seq_tup_read=table_stats.seq_tup_read,
+                    idx_scan=table_stats.idx_scan,
+                )
+            )
+    return sorted(suggestions, key=lambda s: s.score, reverse=True)
+
+
+async def current_revision(session: AsyncSession) -> Optional[str]:
+    result = await session.execute(text("SELECT version_num FROM alembic_version"))
+    return result.scalars().first()
+
+
+MIGRATION_TEMPLATE = '''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision}
+Create Date: {create_date}
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '{revision}'
+down_revision: Union[str, Sequence[str], None] = {down_revision!r}
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable; Postgres only allows it
+    # outside a transaction
+    with op.get_context().autocommit_block():
+{creates}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+{drops}
+'''
+
+
+def _create_index(name: str, table: str, column: str, method: str) -> str:
+    lines = [
+        f"{name!r}, {table!r}, [{column!r}], unique=False,",
+        "if_not_exists=True, postgresql_concurrently=True,",
+    ]
+    if method == TRIGRAM:
+        lines.append(f"postgresql_using='gin', postgresql_ops={{{column!r}: 'gin_trgm_ops'}},")
+    body = "".join(f"            {line}\n" for line in lines)
+    return f"        op.create_index(\n{body}        )"
+
+
+def _drop_index(name: str, table: str) -> str:
+    return (
+        f"        op.drop_index(\n"
+        f"            {name!r}, table_name={table!r},\n"
+        f"            if_exists=True, postgresql_concurrently=True,\n"
+        f"        )"
+    )
+
+
+def render_migration(
+    indexes: Sequence[Tuple[str, str, str, str]],
+    revision: str,
+    down_revision: Optional[str],
+    message: str = "index advisor",
+    create_date: Optional[datetime] = None,
+) -> str:
+    """Alembic revision source creating ``(name, table, column, method)`` indexes."""
+    return MIGRATION_TEMPLATE.format(
+        message=message,
+        revision=revision,
+        down_revision=down_revision,
+        create_date=create_date or datetime.now(),
+        creates="\n".join(_create_index(*index) for index in indexes) or "        pass",
+        drops="\n".join(_drop_index(name, table) for name, table, _, _ in reversed(indexes))
+        or "        pass",
+    )
+
+
+def suggestion_indexes(suggestions: Sequence[IndexSuggestion]) -> list[Tuple[str, str, str, str]]:
+    return [(s.name, s.table, s.column, s.method) for s in suggestions]
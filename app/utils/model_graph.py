@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Type, Set, Any
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Type, Any
 from dataclasses import dataclass
-from functools import lru_cache
 from sqlalchemy.inspection import inspect as sa_inspect
 from sqlalchemy.orm import RelationshipProperty, aliased
 from sqlmodel import SQLModel
 from sqlalchemy.sql.selectable import Select
 from sqlalchemy.orm import contains_eager
 
-@dataclass
+# resolve_attr_path memo bound; client-supplied paths are few but unbounded
+MAX_CACHED_ATTR_PATHS = 4096
+
+
+@dataclass(frozen=True)
 class JoinStep:
     src: Type[SQLModel]
     attr: str
@@ -28,16 +32,29 @@ class ModelGraph:
         - deep path
         - BFS shortest path
         - join application with alias reuse
+
+    Services share one process-wide instance (``get_model_graph``) covering
+    every mapped table, with all-pairs shortest paths precomputed and
+    resolved attribute paths memoized.
     """
 
     def __init__(self) -> None:
         self.forward: Dict[Type[SQLModel], Dict[str, JoinStep]] = {}
         self.reverse: Dict[Type[SQLModel], Dict[str, JoinStep]] = {}
+        # (src, dst) -> shortest join path; filled by precompute()
+        self.paths: Dict[Tuple[Type[SQLModel], Type[SQLModel]], Tuple[JoinStep, ...]] = {}
+        self._attr_paths: Dict[
+            Tuple[Type[SQLModel], Tuple[str, ...]], Tuple[Tuple[JoinStep, ...], str]
+        ] = {}
 
     def register(self, model: Type[SQLModel]) -> None:
         if model in self.forward:
             return
 
+        # new edges can change existing paths
+        self.paths.clear()
+        self._attr_paths.clear()
+
         self.forward[model] = {}
         self.reverse.setdefault(model, {})
 
@@ -57,49 +74,71 @@ class ModelGraph:
         for m in models:
             self.register(m)
 
-    @lru_cache(None)
+    def build_all(self) -> "ModelGraph":
+        """Register every mapped SQLModel table and precompute all paths."""
+        self.build([mapper.class_ for mapper in SQLModel._sa_registry.mappers])
+        self.precompute()
+        return self
+
+    def _reachable(self, src: Type[SQLModel]) -> Dict[Type[SQLModel], List[JoinStep]]:
+        """BFS from ``src``: shortest path to every reachable model."""
+        paths: Dict[Type[SQLModel], List[JoinStep]] = {src: []}
+        queue = deque([src])
+
+        while queue:
+            node = queue.popleft()
+            # forward edges, then reverse edges
+            steps = [
+                *self.forward.get(node, {}).values(),
+                *self.reverse.get(node, {}).values(),
+            ]
+            for step in steps:
+                if step.dst not in paths:
+                    paths[step.dst] = paths[node] + [step]
+                    queue.append(step.dst)
+
+        return paths
+
+    def precompute(self) -> None:
+        self.paths = {
+            (src, dst): tuple(path)
+            for src in self.forward
+            for dst, path in self._reachable(src).items()
+        }
+
     def shortest_path(
         self, src: Type[SQLModel], dst: Type[SQLModel]
     ) -> Optional[List[JoinStep]]:
         if src == dst:
             return []
 
-        from collections import deque
-        visited: Set[Type[SQLModel]] = set()
-        queue = deque([(src, [])])
-
-        while queue:
-            node, path = queue.popleft()
-            if node == dst:
-                return path
-            visited.add(node)
-
-            # forward edges
-            for step in self.forward.get(node, {}).values():
-                if step.dst not in visited:
-                    queue.append((step.dst, path + [step]))
-
-            # reverse edges
-            for reverse_key, rev_step in self.reverse.get(node, {}).items():
-                if rev_step.dst not in visited:
-                    queue.append((rev_step.dst, path + [rev_step]))
+        if self.paths:
+            path = self.paths.get((src, dst))
+            return list(path) if path is not None else None
 
-        return None
+        return self._reachable(src).get(dst)
 
     def resolve_attr_path(
         self, base: Type[SQLModel], attrs: List[str]
     ) -> Tuple[List[JoinStep], str]:
+        key = (base, tuple(attrs))
+        cached = self._attr_paths.get(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
+
         current = base
         join_plan: List[JoinStep] = []
 
         for attr in attrs[:-1]:
-            if attr in self.forward[current]:
+            if attr in self.forward.get(current, {}):
                 step = self.forward[current][attr]
                 join_plan.append(step)
                 current = step.dst
             else:
                 raise ValueError(f"Invalid relationship: {current.__name__}.{attr}")
 
+        if len(self._attr_paths) < MAX_CACHED_ATTR_PATHS:
+            self._attr_paths[key] = (tuple(join_plan), attrs[-1])
         return join_plan, attrs[-1]
 
     from sqlalchemy.orm import contains_eager
@@ -125,4 +164,20 @@ class ModelGraph:
             
             last_target = alias_cache[key]
 
-        return query, last_target
\ No newline at end of file
+        return query, last_target
+
+
+_model_graph: Optional[ModelGraph] = None
+
+
+def get_model_graph() -> ModelGraph:
+    """
+    The process-wide graph over every mapped table.
+
+    Built at application startup; built lazily here for code running outside
+    the app (scripts, background jobs) once the models are imported.
+    """
+    global _model_graph
+    if _model_graph is None:
+        _model_graph = ModelGraph().build_all()
+    return _model_graph
@@ -0,0 +1,240 @@
+import base64
+import binascii
+import datetime
+import json
+import time
+import uuid
+from enum import Enum
+from typing import Any, NamedTuple, Optional, Type
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, asc, desc, func, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import Select
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.core.constants import DEFAULT_PAGE, DEFAULT_PAGE_SIZE
+from app.utils.dsl_filter import resolve_sort
+from app.utils.model_graph import ModelGraph
+
+"""
+# PAGINATION
+
+List endpoints support two modes:
+
+- offset (default): `?page=3&page_size=50`
+- keyset / cursor:  `?cursor=&page_size=50` for the first page, then
+  `?cursor=<next_cursor>` from the previous response until it is null.
+
+Cursor mode orders by `(sort column, id)` and seeks past the last row seen, so
+deep pages cost the same as the first one. `include_total=false` skips the
+COUNT entirely (`total` / `total_pages` come back as null). An unfiltered,
+unjoined list of a table above COUNT_ESTIMATE_MIN_ROWS reports the planner's
+row estimate instead, with `total_estimated: true`.
+"""
+
+
+class Page(NamedTuple):
+    items: list
+    total: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[str]
+    total_estimated: bool = False
+
+
+def _bad_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "message": "Invalid pagination cursor",
+            "success": False,
+            "status": status.HTTP_400_BAD_REQUEST,
+            "data": None,
+        },
+    )
+
+
+def _dump(value: Any) -> list:
+    if value is None:
+        return ["none", None]
+    if isinstance(value, datetime.datetime):
+        return ["datetime", value.isoformat()]
+    if isinstance(value, datetime.date):
+        return ["date", value.isoformat()]
+    if isinstance(value, uuid.UUID):
+        return ["uuid", str(value)]
+    if isinstance(value, Enum):
+        return ["raw", value.value]
+    return ["raw", value]
+
+
+def _load(tagged: list) -> Any:
+    tag, value = tagged
+    if tag == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    if tag == "date":
+        return datetime.date.fromisoformat(value)
+    if tag == "uuid":
+        return uuid.UUID(value)
+    if tag in ("none", "raw"):
+        return value
+    raise ValueError(tag)
+
+
+def encode_cursor(sort_value: Any, row_id: uuid.UUID) -> str:
+    payload = json.dumps([_dump(sort_value), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        tagged, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return _load(tagged), uuid.UUID(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise _bad_cursor()
+
+
+def _seek(sort_col, id_col, direction: str, last_value: Any, last_id: uuid.UUID):
+    """
+    Rows strictly after ``(last_value, last_id)`` in
+    ``ORDER BY sort_col <direction>, id <direction>``, following Postgres'
+    default NULL placement (NULLS LAST for ASC, NULLS FIRST for DESC).
+    """
+    if direction == "asc":
+        if last_value is None:
+            return and_(sort_col.is_(None), id_col > last_id)
+        return or_(
+            sort_col > last_value,
+            and_(sort_col == last_value, id_col > last_id),
+            sort_col.is_(None),
+        )
+
+    if last_value is None:
+        return or_(
+            and_(sort_col.is_(None), id_col < last_id),
+            sort_col.isnot(None),
+        )
+    return or_(
+        sort_col < last_value,
+        and_(sort_col == last_value, id_col < last_id),
+    )
+
+
+# table name -> (expires_at, estimated rows)
+_row_estimates: dict[str, tuple[float, int]] = {}
+
+
+async def estimated_row_count(session: AsyncSession, table_name: str) -> Optional[int]:
+    """Planner estimate from ``pg_class.reltuples``, cached per process."""
+    cached = _row_estimates.get(table_name)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    estimate = (
+        await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": table_name},
+        )
+    ).scalar()
+    # -1 / NULL: never analysed or unknown table
+    if estimate is None or estimate < 0:
+        return None
+
+    _row_estimates[table_name] = (
+        time.monotonic() + settings.COUNT_ESTIMATE_TTL_SECONDS,
+        estimate,
+    )
+    return estimate
+
+
+def _is_bare(stmt: Select, model: Type[SQLModel]) -> bool:
+    """``select(model)`` with no WHERE and nothing joined to the table."""
+    froms = stmt.get_final_froms()
+    return stmt.whereclause is None and len(froms) == 1 and froms[0] is model.__table__
+
+
+async def count_rows(
+    session: AsyncSession, stmt: Select, model: Type[SQLModel]
+) -> tuple[int, bool]:
+    """
+    Total for a filtered ``select(model)``, and whether it is an estimate.
+
+    A bare select of a large table uses the planner estimate. Otherwise the
+    statement is reduced to ``count(id)`` over its own FROM/JOIN/WHERE:
+    the selected columns, loader options, ordering and paging are dropped.
+    DSL filters only join to-one relationships (to-many paths compile to
+    EXISTS), so the remaining joins cannot duplicate rows.
+    """
+    if _is_bare(stmt, model):
+        estimate = await estimated_row_count(session, model.__tablename__)
+        if estimate is not None and estimate >= settings.COUNT_ESTIMATE_MIN_ROWS:
+            return estimate, True
+
+    count_stmt = (
+        stmt.with_only_columns(
+            func.count(model.id), maintain_column_froms=True
+        )
+        .order_by(None)
+        .limit(None)
+        .offset(None)
+    )
+    return (await session.execute(count_stmt)).scalar() or 0, False
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    model: Type[SQLModel],
+    graph: ModelGraph,
+    sort: Optional[str] = None,
+    page: int = DEFAULT_PAGE,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Page:
+    """
+    Run a filtered ``select(model)`` one page at a time.
+
+    ``cursor=None`` keeps classic offset paging; any other value (``""`` for
+    the first page) switches to keyset paging.
+    """
+    # counted before sorting so the sort's joins stay out of the COUNT
+    total, estimated = None, False
+    if include_total:
+        total, estimated = await count_rows(session, stmt, model)
+    total_pages = -(-total // page_size) if total is not None else None
+
+    sort_col, direction = None, "desc"
+    if sort:
+        stmt, sort_col, direction = resolve_sort(stmt, sort, model, graph)
+    order = asc if direction == "asc" else desc
+
+    if cursor is None:
+        if sort_col is not None:
+            stmt = stmt.order_by(order(sort_col), order(model.id))
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        items = (await session.execute(stmt)).scalars().all()
+        return Page(items, total, total_pages, None, estimated)
+
+    if sort_col is None:
+        sort_col = getattr(model, "created_at", model.id)
+
+    # the sort key is selected alongside the entity so the next cursor can be
+    # built from the last row even when it lives on a joined table
+    stmt = stmt.add_columns(sort_col.label("cursor_sort_key")).order_by(
+        order(sort_col), order(model.id)
+    )
+    if cursor:
+        last_value, last_id = decode_cursor(cursor)
+        stmt = stmt.where(_seek(sort_col, model.id, direction, last_value, last_id))
+    stmt = stmt.limit(page_size + 1)
+    rows = (await session.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last, last_key = rows[-1]
+        next_cursor = encode_cursor(last_key, last.id)
+
+    return Page([row[0] for row in rows], total, total_pages, next_cursor, estimated)
@@ -1,27 +1,176 @@
 from datetime import datetime
+from functools import lru_cache
 import json
-from typing import Optional, Union
+from types import UnionType
+from typing import Any, Optional, Union, get_args, get_origin
 import uuid
-from uuid import UUID
 
+from fastapi.responses import ORJSONResponse
+from pydantic import AliasChoices, BaseModel as PydanticBaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy import inspect as sa_inspect
 
+"""
+# SERIALIZATION
 
+Responses are built from ORM rows in one pass instead of field by field:
+
+- `from_orm(NCRResponse, ncr)` / `from_orm(list[NCRResponse], ncrs)`
+  reads the fields the response model declares straight from the loaded ORM
+  state and validates them with a cached `TypeAdapter`. Relationships that
+  were not eager loaded are skipped (the field keeps its default) rather than
+  lazy loaded, which the async session could not do anyway; table model
+  fields take the ORM instance as is;
+- `typed_response(Response[NCRListResponse], body)` dumps the already
+  validated body straight to JSON bytes. Returning a Response makes FastAPI
+  skip re-validating it against `response_model`, which then only documents
+  the endpoint.
+
+Everything else goes through `ORJSONResponse`, the application's default
+response class.
+"""
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def inner_model(annotation: Any) -> Optional[type]:
+    """The model class inside ``Optional[...]`` / ``list[...]``, if any."""
+    while True:
+        origin = get_origin(annotation)
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if origin in (Union, UnionType, list, tuple, set, frozenset) and len(args) == 1:
+            annotation = args[0]
+        else:
+            break
+    if isinstance(annotation, type) and issubclass(annotation, PydanticBaseModel):
+        return annotation
+    return None
+
+
+def _nested_model(annotation: Any) -> Optional[type]:
+    model = inner_model(annotation)
+    # table models accept the ORM instance itself
+    return None if hasattr(model, "__table__") else model
+
+
+@lru_cache(maxsize=None)
+def model_fields(model: type) -> dict:
+    if not model.__pydantic_complete__:
+        model.model_rebuild()  # resolve forward references in the annotations
+    return model.model_fields
+
+
+def _sources(name: str, field: Any) -> tuple[str, ...]:
+    """Attribute names a field is read from: its validation aliases, else its name."""
+    alias = field.validation_alias
+    if isinstance(alias, str):
+        return (alias,)
+    if isinstance(alias, AliasChoices):
+        return tuple(choice for choice in alias.choices if isinstance(choice, str))
+    return (name,)
+
+
+@lru_cache(maxsize=None)
+def _fields(model: type) -> tuple[tuple[tuple[str, ...], Optional[type]], ...]:
+    return tuple(
+        (_sources(name, field), _nested_model(field.annotation))
+        for name, field in model_fields(model).items()
+    )
 
-def serialize_for_json(obj):
-    if isinstance(obj, UUID):
-        return str(obj)
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if isinstance(obj, dict):
-        return {k: serialize_for_json(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [serialize_for_json(item) for item in obj]
-    if isinstance(obj, tuple):
-        return tuple(serialize_for_json(item) for item in obj)
-    return obj  # fallback
 
+@lru_cache(maxsize=None)
+def _mapped_attributes(cls: type) -> frozenset:
+    return frozenset(sa_inspect(cls).attrs.keys())
 
 
+def _project(value: Any, model: type, memo: dict) -> Any:
+    """Input for ``model`` read from the loaded state of ORM instance ``value``."""
+    if isinstance(value, list):
+        return [_project(item, model, memo) for item in value]
+    if not hasattr(value, "_sa_instance_state"):
+        return value
+    key = (id(value), model)
+    if key in memo:
+        return memo[key]
+    loaded = value.__dict__
+    mapped = _mapped_attributes(type(value))
+    data = memo[key] = {}
+    for sources, nested in _fields(model):
+        for source in sources:
+            if source in loaded:
+                item = loaded[source]
+                break
+            if source in mapped:
+                item = _MISSING  # not loaded: the field keeps its default
+                break
+            item = getattr(value, source, _MISSING)
+            if item is not _MISSING:
+                break
+        if item is _MISSING:
+            continue
+        if nested is not None and item is not None:
+            item = _project(item, nested, memo)
+        data[source] = item
+    return data
+
+
+_MISSING = object()
+
+
+def from_orm(tp: Any, value: Any) -> Any:
+    model = _nested_model(tp)
+    if model is not None:
+        value = _project(value, model, {})
+    return type_adapter(tp).validate_python(value, from_attributes=True)
+
+
+class TypedJSONResponse(ORJSONResponse):
+    """JSON rendered by the ``response_type`` serializer, without validation."""
+
+    def __init__(
+        self,
+        content: Any,
+        response_type: Any,
+        status_code: int = 200,
+        exclude_unset: bool = False,
+        **kwargs: Any,
+    ):
+        self.response_type = response_type
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code=status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return type_adapter(self.response_type).dump_json(
+            content, exclude_unset=self.exclude_unset
+        )
+
+
+def typed_response(
+    response_type: Any,
+    content: Any,
+    status_code: int = 200,
+    sparse: bool = False,
+    exclude_unset: bool = False,
+) -> TypedJSONResponse:
+    """
+    ``sparse``: ``content`` carries `FieldSet` projections (plain dicts) instead
+    of ``response_type`` models and is dumped by its own, unparametrized type.
+
+    ``exclude_unset``: leave out fields ``from_orm`` did not fill, i.e. the
+    relationships an explicit ``include=`` did not load.
+    """
+    if sparse:
+        response_type = type(content)
+    return TypedJSONResponse(
+        content, response_type, status_code=status_code, exclude_unset=exclude_unset
+    )
+
+
+def serialize_for_json(obj):
+    return to_jsonable_python(obj)
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -42,4 +191,3 @@ def to_naive(dt: Optional[Union[str, datetime]]) -> Optional[datetime]:
     if dt.tzinfo:
         return dt.astimezone(tz=None).replace(tzinfo=None)
     return dt
-
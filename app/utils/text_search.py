@@ -0,0 +1,85 @@
+from typing import Any, Optional, Type
+
+from sqlalchemy import Column, Computed, Index, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import SQLModel
+
+"""
+# TEXT SEARCH
+
+Free text columns get two kinds of index (created by the `text_search`
+migration, declared here so the metadata matches the database):
+
+- a generated, stored `search_vector` tsvector per searchable table, built
+  from weighted text columns (A = reference/title ... D = least important)
+  with a GIN index. The column is added to the table only, not mapped on the
+  model, so ORM selects never load it;
+- `pg_trgm` GIN indexes on the columns people `ilike`, which lets Postgres
+  answer `col ILIKE '%term%'` (terms of 3+ characters) from the index instead
+  of a sequential scan.
+
+`search_condition` matches a column's table document with
+`websearch_to_tsquery` (quoted phrases, `or`, `-word`); the DSL `search`
+operator and `/api/search` both use it.
+"""
+
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR = "search_vector"
+# inline, not a bind parameter: the text search functions need a regconfig
+SEARCH_REGCONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+
+def _document(weighted: dict[str, str]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce({name}, '')), '{weight}')"
+        for name, weight in weighted.items()
+    )
+
+
+def add_search_vector(model: Type[SQLModel], weighted: dict[str, str]) -> Column:
+    """Declare ``model``'s generated ``search_vector`` over ``{column: weight}``."""
+    table = model.__table__
+    column = Column(
+        SEARCH_VECTOR, TSVECTOR, Computed(_document(weighted), persisted=True)
+    )
+    table.append_column(column)
+    Index(
+        f"ix_{table.name}_{SEARCH_VECTOR}",
+        column,
+        postgresql_using="gin",
+    )
+    return column
+
+
+def add_trigram_indexes(model: Type[SQLModel], *names: str) -> None:
+    table = model.__table__
+    for name in names:
+        Index(
+            f"ix_{table.name}_{name}_trgm",
+            table.c[name],
+            postgresql_using="gin",
+            postgresql_ops={name: "gin_trgm_ops"},
+        )
+
+
+def search_query(text: str) -> Any:
+    return func.websearch_to_tsquery(SEARCH_REGCONFIG, text)
+
+
+def search_vector_of(col: Any) -> Optional[Any]:
+    """The ``search_vector`` of the table (or alias) ``col`` belongs to, if any."""
+    table = getattr(getattr(col, "expression", col), "table", None)
+    if table is None:
+        return None
+    return table.c.get(SEARCH_VECTOR)
+
+
+def search_condition(col: Any, text: str) -> Any:
+    """
+    Full-text match for ``text`` on ``col``'s table document; columns of
+    tables without one fall back to an (unindexed) ``to_tsvector(col)``.
+    """
+    vector = search_vector_of(col)
+    if vector is None:
+        vector = func.to_tsvector(SEARCH_REGCONFIG, func.coalesce(col, ""))
+    return vector.op("@@")(search_query(text))
@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+import pytest
+
+from app.core.database import run_concurrently
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def section(result=None, error=None):
+    async def run(session):
+        await asyncio.sleep(0)
+        if error is not None:
+            raise error
+        return result
+
+    return run
+
+
+def test_results_come_back_in_order():
+    sections = [section(result=index) for index in range(5)]
+
+    results = asyncio.run(run_concurrently(sections, FakeSession, max_connections=2))
+
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_first_failure_is_raised_and_the_others_are_logged(caplog):
+    first, second = ValueError("first"), KeyError("second")
+    sections = [section(error=first), section(error=second)]
+
+    with caplog.at_level(logging.ERROR), pytest.raises(ValueError) as exc:
+        asyncio.run(run_concurrently(sections, FakeSession, max_connections=2))
+
+    assert exc.value is first
+    assert isinstance(exc.value.__cause__, ExceptionGroup)
+    assert list(exc.value.__cause__.exceptions) == [first, second]
+    [record] = caplog.records
+    assert record.exc_info[1] is second
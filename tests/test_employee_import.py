@@ -0,0 +1,118 @@
+import asyncio
+import io
+import uuid
+
+import pandas as pd
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+
+from app.users import services
+from app.users.models import User
+from app.users.services import UserService
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, user):
+        self.user = user
+
+    async def execute(self, stmt):
+        return FakeResult(self.user)
+
+
+def make_uploader():
+    return User(
+        id=uuid.uuid4(),
+        employee_id="ADMIN",
+        password="hash",
+        email="admin@example.com",
+        qualification="q",
+        designation="d",
+        is_active=True,
+        role="ADMIN",
+        name="Admin",
+    )
+
+
+def make_sheet(rows):
+    buffer = io.BytesIO()
+    pd.DataFrame(
+        rows, columns=["Employee Id", "Name", "E-mail", "Designation", "Qualification"]
+    ).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def import_service(monkeypatch):
+    sent = []
+
+    async def send_email(to, subject, context):
+        sent.append((to, subject, context["message"]))
+
+    async def upsert(self, rows):
+        # E1 already exists; the others are new
+        updated = sum(row["employee_id"] == "E1" for row in rows)
+        return len(rows) - updated, updated
+
+    monkeypatch.setattr(services, "send_email", send_email)
+    monkeypatch.setattr(UserService, "_upsert_employees", upsert)
+    uploader = make_uploader()
+    return UserService(session=FakeSession(uploader)), uploader, sent
+
+
+def test_background_import_emails_the_summary_to_the_uploader(import_service):
+    service, uploader, sent = import_service
+    sheet = make_sheet(
+        [
+            ["E1", "One", "one@example.com", "d", "q"],
+            ["E2", "Two", "two@example.com", "d", "q"],
+            ["E3", None, "three@example.com", "d", "q"],
+        ]
+    )
+    background_tasks = BackgroundTasks()
+
+    async def run():
+        accepted = await service.upload_excel_in_background(
+            background_tasks, sheet, uploader.id
+        )
+        await background_tasks()
+        return accepted
+
+    accepted = asyncio.run(run())
+
+    assert accepted.data is None
+    [(to, subject, message)] = sent
+    assert to == ["admin@example.com"]
+    assert "Completed" in subject
+    assert "<strong>Inserted Employees:</strong> 1" in message
+    assert "<strong>Updated Employees:</strong> 1" in message
+    assert "<strong>Invalid Rows:</strong> 1" in message
+
+
+def test_import_returns_the_summary(import_service):
+    service, _, sent = import_service
+    sheet = make_sheet([["E2", "Two", "two@example.com", "d", "q"]])
+
+    result = asyncio.run(service.upload_excel(sheet))
+
+    assert result.data == {"inserted": 1, "updated": 0, "invalid": 0}
+    assert sent == []
+
+
+def test_failed_import_emails_the_error(import_service):
+    service, uploader, sent = import_service
+    sheet = make_sheet([])[:10]
+
+    with pytest.raises(HTTPException):
+        asyncio.run(service.upload_excel(sheet, uploader.id))
+
+    [(to, subject, _)] = sent
+    assert to == ["admin@example.com"]
+    assert "Failed" in subject
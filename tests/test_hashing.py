@@ -0,0 +1,78 @@
+import asyncio
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.hashing import PasswordHasher
+
+
+class BrokenPool(Executor):
+    """Stands in for a process pool whose workers died; jobs fail on ``break_next``."""
+
+    def __init__(self):
+        self.pending: list[Future] = []
+        self.shutdown_calls = 0
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.pending.append(future)
+        return future
+
+    def break_next(self):
+        self.pending.pop(0).set_exception(BrokenProcessPool("worker died"))
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdown_calls += 1
+
+
+def slow_upper(value):
+    time.sleep(0.05)
+    return value.upper()
+
+
+async def _until(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+def test_late_broken_caller_keeps_the_replacement_pool():
+    hasher = PasswordHasher(workers=1, max_pending=8, use_processes=True)
+    broken = hasher._executor = BrokenPool()
+
+    async def run():
+        first = asyncio.ensure_future(hasher._run(slow_upper, "a"))
+        late = asyncio.ensure_future(hasher._run(slow_upper, "b"))
+        await _until(lambda: len(broken.pending) == 2)
+
+        broken.break_next()  # "a" replaces the pool and runs in a thread
+        await _until(lambda: isinstance(hasher._executor, ThreadPoolExecutor))
+        # queued behind "a" on the replacement pool
+        queued = asyncio.ensure_future(hasher._run(slow_upper, "c"))
+        await asyncio.sleep(0.01)
+
+        broken.break_next()  # "b" fails later, on the pool that was already replaced
+        return await asyncio.gather(first, late, queued)
+
+    try:
+        assert asyncio.run(run()) == ["A", "B", "C"]
+        assert broken.shutdown_calls == 1
+        assert hasher.use_processes is False
+    finally:
+        hasher.shutdown()
+
+
+def test_hash_and_verify_in_threads():
+    hasher = PasswordHasher(workers=1, use_processes=False)
+
+    async def run():
+        hashed = await hasher.hash("secret")
+        return hashed, await hasher.verify("secret", hashed), await hasher.verify("nope", hashed)
+
+    try:
+        hashed, ok, wrong = asyncio.run(run())
+        assert hashed != "secret" and ok and not wrong
+    finally:
+        hasher.shutdown()
@@ -0,0 +1,190 @@
+import uuid
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from app.audit.models import Audit
+from app.audit_info.models import AuditInfo, AuditTeam
+from app.main import app
+from app.ncr.dependencies import get_ncr_service
+from app.ncr.models import NCR, DocumentReference, NCRFiles, NCRFileType, NCRTeam
+from app.ncr.services import NCRService
+from app.settings.models import Company, Department, Plant
+from app.users.models import User
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, value):
+        self.value = value
+
+    async def execute(self, stmt):
+        return FakeResult(self.value)
+
+
+def make_user():
+    return User(
+        id=uuid.uuid4(),
+        employee_id="E1",
+        password="hash",
+        email="auditor@example.com",
+        qualification="q",
+        designation="d",
+        is_active=True,
+        role="AUDITOR",
+        name="Auditor",
+    )
+
+
+def make_ncr():
+    now = datetime.now()
+    company = Company(id=uuid.uuid4(), name="C", code="C", created_at=now, updated_at=now)
+    plant = Plant(
+        id=uuid.uuid4(), name="P", code="P", company_id=company.id, created_at=now, updated_at=now
+    )
+    plant.company = company
+    audit = Audit(
+        id=uuid.uuid4(),
+        ref="A1",
+        type="t",
+        standard="s",
+        schedule="x",
+        start_date=now,
+        end_date=now,
+        plant_id=plant.id,
+        created_at=now,
+        updated_at=now,
+    )
+    audit.plant = plant
+    department = Department(
+        id=uuid.uuid4(),
+        name="D",
+        code="D",
+        slug="d",
+        plant_id=plant.id,
+        created_at=now,
+        updated_at=now,
+    )
+    audit_info = AuditInfo(
+        id=uuid.uuid4(),
+        ref="AI1",
+        department_id=department.id,
+        from_date=now,
+        to_date=now,
+        status="OPEN",
+        audit_id=audit.id,
+        created_at=now,
+        updated_at=now,
+    )
+    audit_info.department = department
+    audit_info.audit = audit
+    auditor = make_user()
+    audit_info.team = [
+        AuditTeam(
+            id=uuid.uuid4(),
+            user_id=auditor.id,
+            role="AUDITOR",
+            audit_info_id=audit_info.id,
+            user=auditor,
+        )
+    ]
+    ncr = NCR(
+        id=uuid.uuid4(),
+        ref="NCR1",
+        shift="A",
+        type="T",
+        audit_info_id=audit_info.id,
+        description="description",
+        status="CREATED",
+        mode="NCR",
+        created_at=now,
+        updated_at=now,
+    )
+    ncr.audit_info = audit_info
+    auditee = make_user()
+    ncr.team = [
+        NCRTeam(id=uuid.uuid4(), user_id=auditee.id, ncr_id=ncr.id, role="AUDITEE", user=auditee)
+    ]
+    ncr.files = [
+        NCRFiles(
+            id=uuid.uuid4(),
+            ncr_id=ncr.id,
+            path="files/ncr.pdf",
+            file_type=NCRFileType.NCR_FILE,
+            created_at=now,
+            updated_at=now,
+        )
+    ]
+    ncr.document_references = [
+        DocumentReference(
+            id=uuid.uuid4(),
+            ref="DOC1",
+            page="1",
+            paragraph="2",
+            ncr_id=ncr.id,
+            created_at=now,
+            updated_at=now,
+        )
+    ]
+    return ncr
+
+
+def get_ncr(ncr, params=None):
+    app.dependency_overrides[get_ncr_service] = lambda: NCRService(session=FakeSession(ncr))
+    try:
+        return TestClient(app).get(f"/api/ncr/{ncr.id}", params=params)
+    finally:
+        app.dependency_overrides.pop(get_ncr_service, None)
+
+
+def test_get_ncr_serializes_fully_loaded_ncr():
+    ncr = make_ncr()
+
+    response = get_ncr(ncr)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["id"] == str(ncr.id)
+    assert data["team"][0]["user"]["email"] == "auditor@example.com"
+    assert "password" not in data["team"][0]["user"]
+    assert data["files"][0]["path"] == "files/ncr.pdf"
+    assert data["document_references"][0]["ref"] == "DOC1"
+    audit_info = data["audit_info"]
+    assert audit_info["department"]["name"] == "D"
+    assert audit_info["audit"]["ref"] == "A1"
+    assert audit_info["team"][0]["role"] == "AUDITOR"
+
+
+def test_get_ncr_with_fields_returns_only_those_fields():
+    ncr = make_ncr()
+
+    response = get_ncr(ncr, {"fields": "ref,audit_info.department.name"})
+
+    assert response.status_code == 200
+    audit_info = ncr.audit_info
+    assert response.json()["data"] == {
+        "id": str(ncr.id),
+        "ref": "NCR1",
+        "audit_info": {
+            "id": str(audit_info.id),
+            "department": {"id": str(audit_info.department.id), "name": "D"},
+        },
+    }
+
+
+def test_get_ncr_not_found():
+    ncr = make_ncr()
+    app.dependency_overrides[get_ncr_service] = lambda: NCRService(session=FakeSession(None))
+    try:
+        response = TestClient(app).get(f"/api/ncr/{ncr.id}")
+    finally:
+        app.dependency_overrides.pop(get_ncr_service, None)
+
+    assert response.status_code == 404
@@ -0,0 +1,70 @@
+import datetime
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+
+from app.core.schemas import ResponseStatus
+from app.utils.pagination import _seek, decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        42,
+        "NCR-001",
+        datetime.datetime(2026, 1, 2, 3, 4, 5),
+        datetime.date(2026, 1, 2),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    ],
+)
+def test_cursor_round_trip(value):
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(value, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (value, row_id)
+
+
+def test_cursor_stores_enum_value():
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(ResponseStatus.SUCCESS, row_id)) == ("SUCCESS", row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor(1, uuid.uuid4())[:-4]])
+def test_bad_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail["message"] == "Invalid pagination cursor"
+
+
+# (id, value): duplicates and NULLs are where seeking goes wrong
+ROWS = [(1, 10), (2, None), (3, 20), (4, 10), (5, None), (6, 30), (7, 20)]
+
+
+def postgres_order(direction):
+    # Postgres defaults: NULLS LAST for ASC, NULLS FIRST for DESC
+    if direction == "asc":
+        return sorted(ROWS, key=lambda row: (row[1] is None, row[1] or 0, row[0]))
+    return sorted(ROWS, key=lambda row: (row[1] is None, row[1] or 0, row[0]), reverse=True)
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_seek_returns_exactly_the_rows_after_the_cursor(direction):
+    table = Table("rows", MetaData(), Column("id", Integer, primary_key=True), Column("value", Integer))
+    engine = create_engine("sqlite://")
+    table.metadata.create_all(engine)
+    ordered = postgres_order(direction)
+
+    with engine.connect() as conn:
+        conn.execute(insert(table), [{"id": id_, "value": value} for id_, value in ROWS])
+        for position, (last_id, last_value) in enumerate(ordered):
+            seek = _seek(table.c.value, table.c.id, direction, last_value, last_id)
+            after = {row.id for row in conn.execute(select(table.c.id).where(seek))}
+            assert after == {id_ for id_, _ in ordered[position + 1:]}, (last_id, last_value)
@@ -0,0 +1,94 @@
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.users import cache
+from app.users.cache import PrincipalCache, principal_cache
+from app.users.models import User
+
+
+def make_user(employee_id):
+    return User(
+        id=uuid.uuid4(),
+        employee_id=employee_id,
+        password="hash",
+        email=f"{employee_id}@example.com",
+        qualification="q",
+        designation="d",
+        is_active=True,
+        role="AUDITOR",
+        name=employee_id,
+    )
+
+
+def test_get_returns_a_fresh_detached_copy():
+    principals = PrincipalCache(ttl=60, max_entries=10)
+    user = make_user("E1")
+    principals.set(user)
+
+    first = principals.get("E1")
+    second = principals.get("E1")
+
+    assert first is not second
+    assert first.id == user.id
+    assert first.email == "E1@example.com"
+
+
+def test_invalidate_and_clear():
+    principals = PrincipalCache(ttl=60, max_entries=10)
+    principals.set(make_user("E1"))
+    principals.set(make_user("E2"))
+
+    principals.invalidate("E1")
+    assert principals.get("E1") is None
+    assert principals.get("E2") is not None
+
+    principals.clear()
+    assert principals.get("E2") is None
+
+
+def commit_with_stale(stale, rollback=False):
+    with Session(create_engine("sqlite://")) as session:
+        session.connection()
+        session.info[cache._STALE_KEY] = set(stale)
+        if rollback:
+            session.rollback()
+        else:
+            session.commit()
+        return session.info
+
+
+def test_commit_invalidates_only_stale_users():
+    principal_cache.clear()
+    principal_cache.set(make_user("E1"))
+    principal_cache.set(make_user("E2"))
+
+    info = commit_with_stale({"E1"})
+
+    assert cache._STALE_KEY not in info
+    assert principal_cache.get("E1") is None
+    assert principal_cache.get("E2") is not None
+    principal_cache.clear()
+
+
+def test_commit_of_a_shared_table_clears_everything():
+    principal_cache.clear()
+    principal_cache.set(make_user("E1"))
+    principal_cache.set(make_user("E2"))
+
+    commit_with_stale({cache._ALL})
+
+    assert principal_cache.get("E1") is None
+    assert principal_cache.get("E2") is None
+
+
+def test_rollback_keeps_the_cache():
+    principal_cache.clear()
+    principal_cache.set(make_user("E1"))
+
+    info = commit_with_stale({"E1"}, rollback=True)
+
+    assert cache._STALE_KEY not in info
+    assert principal_cache.get("E1") is not None
+    principal_cache.clear()
@@ -0,0 +1,93 @@
+import asyncio
+
+from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.cache import MemoryCacheBackend, ResponseCache
+from app.dashboard import cache as dashboard
+
+
+def make_cache():
+    return ResponseCache("test", backend=MemoryCacheBackend(), ttl=60)
+
+
+def counting_factory():
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    return factory, calls
+
+
+def test_get_or_set_caches_per_params():
+    cache = make_cache()
+    factory, calls = counting_factory()
+
+    async def run():
+        first = await cache.get_or_set("stats", {"plant": 1}, factory)
+        again = await cache.get_or_set("stats", {"plant": 1}, factory)
+        other = await cache.get_or_set("stats", {"plant": 2}, factory)
+        return first, again, other
+
+    first, again, other = asyncio.run(run())
+    assert first == again == {"value": 1}
+    assert other == {"value": 2}
+    assert len(calls) == 2
+
+
+def test_invalidate_bumps_generation_and_drops_entries():
+    cache = make_cache()
+    factory, calls = counting_factory()
+
+    async def run():
+        await cache.get_or_set("stats", {}, factory)
+        await cache.invalidate()
+        return await cache.get_or_set("stats", {}, factory), await cache.backend.generation("test")
+
+    value, generation = asyncio.run(run())
+    assert value == {"value": 2}
+    assert generation == 1
+    assert len(calls) == 2
+
+
+def test_invalidate_now_in_greenlet_is_synchronous():
+    cache = make_cache()
+
+    async def run():
+        await greenlet_spawn(cache.invalidate_now)
+        # visible as soon as the synchronous caller returns, nothing pending
+        return await cache.backend.generation("test"), len(cache._pending)
+
+    assert asyncio.run(run()) == (1, 0)
+
+
+def test_invalidate_now_outside_greenlet_is_scheduled():
+    cache = make_cache()
+
+    async def run():
+        cache.invalidate_now()
+        before = await cache.backend.generation("test")
+        await asyncio.gather(*cache._pending)
+        return before, await cache.backend.generation("test")
+
+    assert asyncio.run(run()) == (0, 1)
+
+
+def test_dashboard_commit_invalidates_before_commit_returns(monkeypatch):
+    cache = make_cache()
+    monkeypatch.setattr(dashboard, "dashboard_cache", cache)
+    session = Session()
+
+    async def run():
+        session.info[dashboard._STALE_FLAG] = True
+        await greenlet_spawn(session.commit)
+        return await cache.backend.generation("test")
+
+    assert asyncio.run(run()) == 1
+    assert dashboard._STALE_FLAG not in session.info
+
+
+def test_dashboard_tracks_team_fact_audit_and_user_tables():
+    assert {"ncrteam", "auditteam", "ncr_fact", "audit", "user"} <= dashboard.TRACKED_TABLES